@@ -0,0 +1,474 @@
+"""
+Набор бенчмарков горячих участков модели на масштабируемых сценариях.
+
+Отдельно замеряются симуляция (simulate_time), диспетчеризация (check_drivers и get_driver внутри симуляции),
+выгрузка в Excel (excel_schedule, add_summary_sheet), штраф генетического алгоритма (evaluate_individual)
+и одно поколение генетического алгоритма (run_ga). Для каждого замера записываются минимальное, медианное
+и среднее время и пиковый объём памяти, выделенной за прогон (tracemalloc). Результаты сохраняются в JSON
+и могут сравниваться с результатами предыдущего запуска.
+
+Запуск: python benchmarks/suite.py [--scenarios baseline fleet_x10] [--output results.json] [--compare old.json]
+"""
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from constants import *
+from config import SimulationConfig
+from event_log import EventLog
+from network import Depot, NetworkConfig, Route, simulate_network
+from simulation import simulate, ENGINES
+import event_engine
+import get_and_check_drivers
+import genetic
+import simulation
+import numpy as np
+import pandas as pd
+import openpyxl
+from openpyxl import Workbook
+from to_excel import add_summary_sheet, excel_schedule
+
+# Функция замера: выполняет замеряемую работу и возвращает время в секундах,
+# если замеряется только часть этой работы, иначе None
+Run = Callable[[], Optional[float]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Параметры масштабируемого сценария.
+
+    Attributes:
+        name (str): Имя сценария.
+        simulation_duration (int): Продолжительность симуляции в минутах.
+        n_of_buses (int): Количество автобусов на маршруте.
+        n_of_drivers_eight_shift (int): Количество 8-часовых водителей на маршруте.
+        n_of_drivers_twelve_shift (int): Количество 12-часовых водителей на маршруте.
+        n_of_routes (int): Количество маршрутов; несколько маршрутов симулируются как сеть с общим депо.
+        n_of_stations (int): Количество остановок на маршруте.
+    """
+
+    name: str
+    simulation_duration: int = MINUTES_PER_WEEK
+    n_of_buses: int = N_OF_BUS
+    n_of_drivers_eight_shift: int = N_OF_DRIVERS_EIGHT_SHIFT
+    n_of_drivers_twelve_shift: int = N_OF_DRIVERS_TWELVE_SHIFT
+    n_of_routes: int = 1
+    n_of_stations: int = N_OF_STATIONS
+
+    @property
+    def config(self) -> SimulationConfig:
+        """
+        SimulationConfig: Конфигурация одного маршрута сценария.
+        """
+        return SimulationConfig(
+            simulation_duration=self.simulation_duration,
+            n_of_stations=self.n_of_stations,
+            n_of_buses=self.n_of_buses,
+            n_of_drivers_eight_shift=self.n_of_drivers_eight_shift,
+            n_of_drivers_twelve_shift=self.n_of_drivers_twelve_shift
+        )
+
+    @property
+    def network(self) -> NetworkConfig:
+        """
+        NetworkConfig: Сеть из n_of_routes одинаковых маршрутов с общим депо, в котором автобусов
+            и водителей в n_of_routes раз больше, чем на одном маршруте.
+        """
+        return NetworkConfig(
+            routes=tuple(
+                Route(name=str(route), segment_times=(DEFAULT_TO_NEXT,) * self.n_of_stations, n_of_buses=self.n_of_buses)
+                for route in range(self.n_of_routes)
+            ),
+            depots=(Depot(
+                n_of_buses=self.n_of_buses * self.n_of_routes,
+                n_of_drivers_eight_shift=self.n_of_drivers_eight_shift * self.n_of_routes,
+                n_of_drivers_twelve_shift=self.n_of_drivers_twelve_shift * self.n_of_routes
+            ),),
+            simulation_duration=self.simulation_duration
+        )
+
+    @property
+    def n_of_drivers(self) -> int:
+        """
+        int: Общее количество водителей на всех маршрутах.
+        """
+        return (self.n_of_drivers_eight_shift + self.n_of_drivers_twelve_shift) * self.n_of_routes
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario for scenario in (
+        Scenario("baseline"),
+        Scenario("fleet_x10", n_of_buses=10 * N_OF_BUS, n_of_drivers_eight_shift=10 * N_OF_DRIVERS_EIGHT_SHIFT,
+                 n_of_drivers_twelve_shift=10 * N_OF_DRIVERS_TWELVE_SHIFT),
+        Scenario("weeks_4", simulation_duration=4 * MINUTES_PER_WEEK),
+        Scenario("many_routes", n_of_routes=50),
+    )
+}
+
+
+def simulate_routes(scenario: Scenario, engine: str) -> List[EventLog]:
+    """
+    Симулирует все маршруты сценария.
+
+    Один маршрут симулируется выбранным движком, несколько - как сеть (simulate_network),
+    которая всегда использует событийный движок.
+
+    Args:
+        scenario (Scenario): Сценарий.
+        engine (str): Движок симуляции одного маршрута.
+
+    Returns:
+        List[EventLog]: Журналы событий маршрутов.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        if scenario.n_of_routes > 1:
+            return list(simulate_network(scenario.network, seed=0).event_logs.values())
+        return [simulate(scenario.config, engine=engine, seed=0)]
+
+
+@lru_cache(maxsize=None)
+def schedules(scenario: Scenario, engine: str) -> Tuple[pd.DataFrame, ...]:
+    """
+    Возвращает записи расписаний маршрутов сценария; симуляция выполняется один раз.
+
+    Args:
+        scenario (Scenario): Сценарий.
+        engine (str): Движок симуляции.
+
+    Returns:
+        Tuple[pd.DataFrame, ...]: Записи расписания каждого маршрута (см. EventLog.to_records).
+    """
+    return tuple(event_log.to_records() for event_log in simulate_routes(scenario, engine))
+
+
+@contextlib.contextmanager
+def timed_calls(targets: Sequence[Tuple[Any, str]], totals: Dict[str, float]):
+    """
+    Временно заменяет функции обёртками, накапливающими время их выполнения.
+
+    Args:
+        targets (Sequence[Tuple[Any, str]]): Модули и имена заменяемых в них функций.
+        totals (Dict[str, float]): Накопленное время по именам функций, дополняется на месте.
+    """
+    originals: List[Tuple[Any, str, Callable]] = [(module, name, getattr(module, name)) for module, name in targets]
+
+    def wrap(name: str, func: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            start: float = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                totals[name] = totals.get(name, 0.0) + time.perf_counter() - start
+        return wrapper
+
+    try:
+        for module, name, func in originals:
+            setattr(module, name, wrap(name, func))
+        yield totals
+    finally:
+        for module, name, func in originals:
+            setattr(module, name, func)
+
+
+def bench_simulate_time(scenario: Scenario, options: argparse.Namespace) -> Run:
+    """
+    Симуляция всех маршрутов сценария.
+    """
+    def run() -> None:
+        simulate_routes(scenario, options.engine)
+    return run
+
+
+def _dispatch_bench(name: str, scenario: Scenario, options: argparse.Namespace) -> Run:
+    """
+    Замеряет суммарное время функции диспетчеризации внутри симуляции всех маршрутов сценария.
+
+    Args:
+        name (str): Имя функции: "check_drivers" или "get_driver".
+        scenario (Scenario): Сценарий.
+        options (argparse.Namespace): Параметры запуска.
+
+    Returns:
+        Run: Функция замера.
+    """
+    targets: List[Tuple[Any, str]] = [
+        (simulation, "check_drivers"), (event_engine, "check_drivers"), (get_and_check_drivers, "get_driver")
+    ]
+
+    def run() -> float:
+        totals: Dict[str, float] = {}
+        with timed_calls(targets, totals):
+            simulate_routes(scenario, options.engine)
+        return totals.get(name, 0.0)
+    return run
+
+
+def bench_check_drivers(scenario: Scenario, options: argparse.Namespace) -> Run:
+    """
+    Суммарное время check_drivers (вместе с get_driver) за симуляцию.
+    """
+    return _dispatch_bench("check_drivers", scenario, options)
+
+
+def bench_get_driver(scenario: Scenario, options: argparse.Namespace) -> Run:
+    """
+    Суммарное время get_driver за симуляцию.
+    """
+    return _dispatch_bench("get_driver", scenario, options)
+
+
+def bench_excel_schedule(scenario: Scenario, options: argparse.Namespace) -> Run:
+    """
+    Выгрузка расписания каждого маршрута в отдельный файл Excel.
+    """
+    routes: Tuple[pd.DataFrame, ...] = schedules(scenario, options.engine)
+
+    def run() -> None:
+        for route, schedule in enumerate(routes):
+            excel_schedule(schedule, os.path.join(options.workdir, f"{scenario.name}_{route}.xlsx"))
+    return run
+
+
+def bench_add_summary_sheet(scenario: Scenario, options: argparse.Namespace) -> Run:
+    """
+    Построение листа 'Итоги' для каждого маршрута.
+    """
+    routes: Tuple[pd.DataFrame, ...] = schedules(scenario, options.engine)
+
+    def run() -> float:
+        workbook: Workbook = Workbook(write_only=True)
+        start: float = time.perf_counter()
+        for schedule in routes:
+            add_summary_sheet(workbook, schedule)
+        elapsed: float = time.perf_counter() - start
+        # Листы книги только для записи закрываются при сохранении
+        workbook.save(io.BytesIO())
+        return elapsed
+    return run
+
+
+def bench_evaluate_individual(scenario: Scenario, options: argparse.Namespace) -> Run:
+    """
+    Полный расчёт штрафа случайной особи со всеми водителями сценария.
+    """
+    individual: genetic.Individual = genetic.random_individual(scenario.n_of_drivers, np.random.default_rng(0))
+
+    def run() -> None:
+        genetic.evaluate_individual(individual)
+    return run
+
+
+def bench_run_ga_generation(scenario: Scenario, options: argparse.Namespace) -> Run:
+    """
+    Одно поколение run_ga (Island.evolve) с популяцией особей со всеми водителями сценария.
+    """
+    island: genetic.Island = genetic.Island(
+        scenario.n_of_drivers, options.pop_size, options.mutation_rate, np.random.default_rng(0)
+    )
+    evaluator: genetic.PopulationEvaluator = genetic.PopulationEvaluator()
+
+    def run() -> None:
+        island.evolve(evaluator)
+    return run
+
+
+# Замеры: имя -> функция подготовки, возвращающая функцию замера.
+# Подготовка выполняется перед каждым повтором и в замер не входит.
+BENCHMARKS: Dict[str, Callable[[Scenario, argparse.Namespace], Run]] = {
+    "simulate_time": bench_simulate_time,
+    "check_drivers": bench_check_drivers,
+    "get_driver": bench_get_driver,
+    "excel_schedule": bench_excel_schedule,
+    "add_summary_sheet": bench_add_summary_sheet,
+    "evaluate_individual": bench_evaluate_individual,
+    "run_ga_generation": bench_run_ga_generation,
+}
+
+
+def measure(
+        benchmark: Callable[[Scenario, argparse.Namespace], Run],
+        scenario: Scenario,
+        options: argparse.Namespace
+) -> Dict[str, Any]:
+    """
+    Выполняет замер options.repeat раз и ещё один раз под tracemalloc для пикового объёма памяти.
+
+    Args:
+        benchmark (Callable[[Scenario, argparse.Namespace], Run]): Функция подготовки замера.
+        scenario (Scenario): Сценарий.
+        options (argparse.Namespace): Параметры запуска.
+
+    Returns:
+        Dict[str, Any]: Время в секундах (min, median, mean, stdev) и пиковый объём памяти в байтах.
+    """
+    times: List[float] = []
+    for _ in range(options.repeat):
+        run: Run = benchmark(scenario, options)
+        start: float = time.perf_counter()
+        partial: Optional[float] = run()
+        times.append(partial if partial is not None else time.perf_counter() - start)
+
+    # Память замеряется отдельным прогоном, так как tracemalloc замедляет выполнение
+    run = benchmark(scenario, options)
+    tracemalloc.start()
+    try:
+        run()
+        peak_memory: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "repeat": options.repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "peak_memory": peak_memory,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """
+    Возвращает хеш текущего коммита репозитория или None, если он недоступен.
+
+    Returns:
+        Optional[str]: Хеш коммита.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=Path(__file__).resolve().parent, capture_output=True, text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(options: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Выполняет выбранные замеры на выбранных сценариях.
+
+    Args:
+        options (argparse.Namespace): Параметры запуска (см. parse_args).
+
+    Returns:
+        Dict[str, Any]: Описание окружения ("meta") и результаты замеров ("results").
+    """
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        options.workdir = workdir
+        for scenario_name in options.scenarios:
+            scenario: Scenario = SCENARIOS[scenario_name]
+            for benchmark_name in options.benchmarks:
+                result: Dict[str, Any] = {
+                    "benchmark": benchmark_name,
+                    "scenario": scenario_name,
+                    "params": asdict(scenario),
+                    **measure(BENCHMARKS[benchmark_name], scenario, options),
+                }
+                print(
+                    f"{benchmark_name:<20} {scenario_name:<12} {result['min']:9.4f} {result['median']:9.4f} "
+                    f"{result['peak_memory'] / 2 ** 20:9.1f}"
+                )
+                results.append(result)
+        schedules.cache_clear()
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "openpyxl": openpyxl.__version__,
+            "engine": options.engine,
+            "pop_size": options.pop_size,
+            "mutation_rate": options.mutation_rate,
+        },
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """
+    Печатает отношение времени и памяти текущего запуска к предыдущему для совпадающих замеров.
+
+    Args:
+        report (Dict[str, Any]): Результаты текущего запуска.
+        baseline (Dict[str, Any]): Результаты предыдущего запуска.
+    """
+    previous: Dict[Tuple[str, str], Dict[str, Any]] = {
+        (result["benchmark"], result["scenario"]): result for result in baseline["results"]
+    }
+    print()
+    print(f"Сравнение с {baseline['meta'].get('commit') or baseline['meta'].get('created')} (текущий / предыдущий):")
+    print(f"{'замер':<20} {'сценарий':<12} {'время':>9} {'память':>9}")
+    for result in report["results"]:
+        old: Optional[Dict[str, Any]] = previous.get((result["benchmark"], result["scenario"]))
+        if old is None:
+            continue
+        time_ratio: float = result["min"] / old["min"] if old["min"] else float("nan")
+        memory_ratio: float = result["peak_memory"] / old["peak_memory"] if old["peak_memory"] else float("nan")
+        print(f"{result['benchmark']:<20} {result['scenario']:<12} {time_ratio:8.2f}x {memory_ratio:8.2f}x")
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Аргументы; по умолчанию sys.argv.
+
+    Returns:
+        argparse.Namespace: Разобранные аргументы.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарки симуляции, диспетчеризации, выгрузки и ГА.")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS),
+                        help="Сценарии")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        help="Замеры")
+    parser.add_argument("--repeat", type=int, default=3, help="Количество повторов каждого замера")
+    parser.add_argument("--engine", choices=ENGINES, default="tick", help="Движок симуляции")
+    parser.add_argument("--pop-size", type=int, default=10, help="Размер популяции ГА")
+    parser.add_argument("--mutation-rate", type=float, default=0.01, help="Вероятность точечной мутации ГА")
+    parser.add_argument("--output", default=None, help="JSON-файл для сохранения результатов")
+    parser.add_argument("--compare", default=None, help="JSON-файл предыдущего запуска для сравнения")
+    args: argparse.Namespace = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat должен быть положительным")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    options: argparse.Namespace = parse_args(argv)
+    print(f"{'замер':<20} {'сценарий':<12} {'мин, с':>9} {'мед., с':>9} {'пик, МБ':>9}")
+    report: Dict[str, Any] = run_suite(options)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        print(f"Результаты сохранены в файл: {options.output}")
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as file:
+            compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Бенчмарк представления времени в целых минутах.
+
+Сравнивает типичные поминутные операции модели в двух представлениях (timedelta и int)
+и замеряет полную симуляцию длительностью SIMULATION_DURATION и в 10 раз дольше.
+
+Запуск: python benchmarks/time_representation.py
+"""
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+import contextlib
+import io
+import random
+import sys
+import time
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from constants import *
+from simulation import simulate_time
+
+REPEATS: int = 200_000
+
+
+def timedelta_tick(
+        to_next: timedelta = timedelta(minutes=12),
+        working_time: timedelta = timedelta(hours=3),
+        between_shifts_time: timedelta = timedelta(hours=11),
+        shift_duration: timedelta = timedelta(hours=8),
+        current_time: timedelta = timedelta(days=2, hours=7),
+        time_road: timedelta = timedelta(minutes=60),
+        step: timedelta = timedelta(minutes=1)
+) -> None:
+    """
+    Поминутные операции одного водителя в прежнем представлении timedelta.
+    """
+    to_next -= timedelta(minutes=1)
+    _ = to_next == timedelta(minutes=0)
+    working_time += step
+    between_shifts_time -= step
+    _ = between_shifts_time <= timedelta(minutes=0)
+    _ = ((current_time.days * MAX_HOUR) + ((current_time.seconds + time_road.seconds) // SECONDS_IN_HOUR)) % MAX_HOUR
+    _ = working_time + time_road < shift_duration
+
+
+def minutes_tick(
+        to_next: int = DEFAULT_TO_NEXT,
+        working_time: int = 3 * MINUTES_PER_HOUR,
+        between_shifts_time: int = BETWEEN_SHIFTS_TIME,
+        shift_duration: int = SHIFT_DURATION_8H,
+        current_time: int = 2 * MINUTES_PER_DAY + 7 * MINUTES_PER_HOUR,
+        time_road: int = DEFAULT_TO_NEXT * N_OF_STATIONS,
+        step: int = TIME_INCREMENT
+) -> None:
+    """
+    Те же поминутные операции в целых минутах.
+    """
+    to_next -= TIME_INCREMENT
+    _ = to_next == 0
+    working_time += step
+    between_shifts_time -= step
+    _ = between_shifts_time <= 0
+    _ = ((current_time + time_road) // MINUTES_PER_HOUR) % MAX_HOUR
+    _ = working_time + time_road < shift_duration
+
+
+def measure_operations() -> Dict[str, float]:
+    """
+    Замеряет время поминутных операций в обоих представлениях.
+
+    Returns:
+        Dict[str, float]: Время одной итерации в микросекундах для каждого представления.
+    """
+    results: Dict[str, float] = {}
+    for name, func in (("timedelta", timedelta_tick), ("int", minutes_tick)):
+        seconds: float = min(timeit.repeat(func, number=REPEATS, repeat=3))
+        results[name] = seconds / REPEATS * 1_000_000
+    return results
+
+
+def measure_simulation(duration: int, engine: str, seed: int = 0) -> float:
+    """
+    Замеряет время полной симуляции.
+
+    Args:
+        duration (int): Продолжительность симуляции в минутах.
+        engine (str): Движок симуляции.
+        seed (int, optional): Зерно генератора случайных чисел. По умолчанию 0.
+
+    Returns:
+        float: Время симуляции в секундах.
+    """
+    random.seed(seed)
+    start: float = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_time(
+            simulation_duration=duration,
+            n_of_stations=N_OF_STATIONS,
+            n_of_buses=N_OF_BUS,
+            n_of_drivers_eight_shift=N_OF_DRIVERS_EIGHT_SHIFT,
+            n_of_drivers_twelve_shift=N_OF_DRIVERS_TWELVE_SHIFT,
+            engine=engine
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    operations: Dict[str, float] = measure_operations()
+    print("Поминутные операции водителя, мкс на итерацию:")
+    for name, value in operations.items():
+        print(f"  {name:<10} {value:8.3f}")
+    print(f"  ускорение  {operations['timedelta'] / operations['int']:8.2f}x")
+    print()
+
+    rows: List[Tuple[int, str, float]] = []
+    for multiplier in (1, 10):
+        for engine in ("tick", "event"):
+            duration: int = SIMULATION_DURATION * multiplier
+            rows.append((duration, engine, measure_simulation(duration, engine)))
+
+    print("Полная симуляция:")
+    print(f"  {'минут':>8} {'движок':>7} {'секунд':>8} {'минут/с':>10}")
+    for duration, engine, seconds in rows:
+        print(f"  {duration:>8} {engine:>7} {seconds:8.3f} {duration / seconds:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
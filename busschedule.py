@@ -0,0 +1,251 @@
+"""
+Командная строка модели: python -m busschedule simulate|export|sweep|network|roster.
+
+Модули симуляции, выгрузки и перебора параметров импортируются только для выполняемой команды,
+а pandas и openpyxl - только при построении таблиц и выгрузке в Excel, поэтому короткие прогоны
+и процессы перебора параметров запускаются быстро. С флагом --timing выводится время импорта
+модулей и время выполнения команды.
+"""
+from constants import *
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Sequence, TYPE_CHECKING
+import argparse
+import importlib
+import os
+import sys
+import time
+
+if TYPE_CHECKING:
+    from event_log import EventLog
+
+# Тяжёлые зависимости, загрузка которых отмечается в выводе --timing
+HEAVY_MODULES: List[str] = ["pandas", "openpyxl"]
+
+
+def import_modules(timings: Dict[str, float], *names: str) -> List[ModuleType]:
+    """
+    Импортирует модули команды и учитывает время импорта.
+
+    Args:
+        timings (Dict[str, float]): Замеры времени, дополняется на месте (ключ "import").
+        *names (str): Имена модулей.
+
+    Returns:
+        List[ModuleType]: Импортированные модули в порядке names.
+    """
+    start: float = time.perf_counter()
+    modules: List[ModuleType] = [importlib.import_module(name) for name in names]
+    timings["import"] = timings.get("import", 0.0) + time.perf_counter() - start
+    return modules
+
+
+def add_simulation_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Добавляет параметры сценария симуляции.
+
+    Args:
+        parser (argparse.ArgumentParser): Разборщик аргументов команды.
+    """
+    parser.add_argument("--duration", type=int, default=SIMULATION_DURATION, help="Продолжительность в минутах")
+    parser.add_argument("--stations", type=int, default=N_OF_STATIONS, help="Количество остановок")
+    parser.add_argument("--buses", type=int, default=N_OF_BUS, help="Количество автобусов")
+    parser.add_argument("--eight", type=int, default=N_OF_DRIVERS_EIGHT_SHIFT, help="Количество 8-часовых водителей")
+    parser.add_argument("--twelve", type=int, default=N_OF_DRIVERS_TWELVE_SHIFT,
+                        help="Количество 12-часовых водителей")
+    parser.add_argument("--engine", choices=ENGINES, default="tick", help="Движок симуляции")
+    parser.add_argument("--seed", type=int, default=None, help="Зерно генератора случайных чисел")
+
+
+def run_simulation(args: argparse.Namespace, timings: Dict[str, float]) -> 'EventLog':
+    """
+    Выполняет симуляцию по параметрам командной строки.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы.
+        timings (Dict[str, float]): Замеры времени.
+
+    Returns:
+        EventLog: Журнал событий симуляции.
+    """
+    simulation, = import_modules(timings, "simulation")
+    event_log = simulation.simulate_time(
+        simulation_duration=args.duration,
+        n_of_stations=args.stations,
+        n_of_buses=args.buses,
+        n_of_drivers_eight_shift=args.eight,
+        n_of_drivers_twelve_shift=args.twelve,
+        engine=args.engine,
+        seed=args.seed,
+        profile=args.profile
+    )
+    if args.profile_output and event_log.profile is not None:
+        event_log.profile.save(args.profile_output)
+        print(f"Профиль симуляции сохранён в файл: {args.profile_output}")
+    return event_log
+
+
+def command_simulate(args: argparse.Namespace, timings: Dict[str, float]) -> None:
+    """
+    Команда simulate: симуляция и, при необходимости, сохранение журнала событий без pandas и openpyxl.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы.
+        timings (Dict[str, float]): Замеры времени.
+    """
+    event_log = run_simulation(args, timings)
+    if args.output:
+        storage, = import_modules(timings, "storage")
+        storage.save_event_log(event_log, args.output)
+        print(f"Журнал событий сохранён в файл: {args.output}")
+    print(f"Всего водителей задействовано: {len(event_log.driver_names)}")
+
+
+def command_export(args: argparse.Namespace, timings: Dict[str, float]) -> None:
+    """
+    Команда export: выгрузка расписания в Excel из сохранённого журнала событий или новой симуляции.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы.
+        timings (Dict[str, float]): Замеры времени.
+    """
+    if args.input:
+        storage, = import_modules(timings, "storage")
+        event_log = storage.load_event_log(args.input)
+    else:
+        event_log = run_simulation(args, timings)
+    to_excel, = import_modules(timings, "to_excel")
+    to_excel.excel_schedule(event_log.to_records(), args.output)
+    print(f"Расписание сохранено в файл: {args.output}")
+
+
+def command_sweep(args: argparse.Namespace, timings: Dict[str, float]) -> None:
+    """
+    Команда sweep: перебор параметров парка (аргументы передаются sweep.main).
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы.
+        timings (Dict[str, float]): Замеры времени.
+    """
+    sweep, = import_modules(timings, "sweep")
+    sweep.main(args.sweep_args)
+
+
+def command_network(args: argparse.Namespace, timings: Dict[str, float]) -> None:
+    """
+    Команда network: симуляция сети маршрутов из JSON-файла и, при необходимости, сохранение журналов маршрутов.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы.
+        timings (Dict[str, float]): Замеры времени.
+    """
+    network, = import_modules(timings, "network")
+    result = network.simulate_network(network.load_network(args.config), seed=args.seed, profile=args.profile)
+    if args.profile_output and result.profile is not None:
+        result.profile.save(args.profile_output)
+        print(f"Профиль симуляции сохранён в файл: {args.profile_output}")
+    if args.output:
+        storage, = import_modules(timings, "storage")
+        os.makedirs(args.output, exist_ok=True)
+        for name, event_log in result.event_logs.items():
+            storage.save_event_log(event_log, os.path.join(args.output, f"{name}.npz"))
+        print(f"Журналы событий маршрутов сохранены в каталог: {args.output}")
+
+
+def command_roster(args: argparse.Namespace, timings: Dict[str, float]) -> None:
+    """
+    Команда roster: детерминированное недельное расписание водителей без генетического алгоритма.
+
+    Выводит штраф расписания и состав водителей так же, как генетический алгоритм,
+    и при необходимости сохраняет таблицу расписания по минутам в CSV.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы.
+        timings (Dict[str, float]): Замеры времени.
+    """
+    genetic, roster = import_modules(timings, "genetic", "roster")
+    step: int = roster.ROSTER_STEP if args.step is None else args.step
+    individual = genetic.Individual.from_drivers(roster.solve_roster(step=step, n_of_buses=args.buses))
+    print(f"Штраф расписания: {genetic.evaluate_individual(individual):.2f}")
+    genetic.print_stats(individual)
+    if args.output:
+        genetic.build_schedule_table(individual).to_csv(args.output)
+        print(f"Расписание сохранено в файл: {args.output}")
+
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace, Dict[str, float]], None]] = {
+    "simulate": command_simulate,
+    "export": command_export,
+    "sweep": command_sweep,
+    "network": command_network,
+    "roster": command_roster,
+}
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Аргументы; по умолчанию sys.argv.
+
+    Returns:
+        argparse.Namespace: Разобранные аргументы.
+    """
+    parser = argparse.ArgumentParser(prog="python -m busschedule", description="Симуляция работы автобусного парка.")
+    parser.add_argument("--timing", action="store_true", help="Вывести время импорта модулей и выполнения команды")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    simulate = commands.add_parser("simulate", help="Симуляция без выгрузки в Excel")
+    add_simulation_arguments(simulate)
+    simulate.add_argument("--output", default=None, help="Файл журнала событий (.npz, .parquet, .feather)")
+
+    export = commands.add_parser("export", help="Выгрузка расписания в Excel")
+    add_simulation_arguments(export)
+    export.add_argument("--input", default=None, help="Сохранённый журнал событий; без него выполняется симуляция")
+    export.add_argument("--output", default="drivers_schedule.xlsx", help="Excel-файл расписания")
+
+    network = commands.add_parser("network", help="Симуляция сети маршрутов с общими депо")
+    network.add_argument("--config", required=True, help="JSON-файл сети маршрутов (см. network.load_network)")
+    network.add_argument("--seed", type=int, default=None, help="Зерно генератора случайных чисел")
+    network.add_argument("--output", default=None, help="Каталог для журналов событий маршрутов (.npz)")
+
+    roster = commands.add_parser("roster", help="Недельное расписание водителей без генетического алгоритма")
+    roster.add_argument("--step", type=int, default=None,
+                        help="Шаг сетки начала смен в минутах (по умолчанию roster.ROSTER_STEP)")
+    roster.add_argument("--buses", type=int, default=GA_NUM_BUSES, help="Количество автобусов")
+    roster.add_argument("--output", default=None, help="CSV-файл таблицы расписания по минутам")
+
+    for command in (simulate, export, network):
+        command.add_argument("--profile", action="store_true", help="Профилировать фазы симуляции")
+        command.add_argument("--profile-output", default=None, help="JSON-файл для сохранения профиля")
+
+    # Аргументы перебора разбирает sweep.parse_args
+    commands.add_parser("sweep", help="Перебор параметров парка (аргументы см. python sweep.py --help)",
+                        add_help=False)
+
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "sweep":
+        args.sweep_args = extra
+    elif extra:
+        parser.error(f"неизвестные аргументы: {' '.join(extra)}")
+    if getattr(args, "profile_output", None):
+        args.profile = True
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args: argparse.Namespace = parse_args(argv)
+    timings: Dict[str, float] = {}
+    start: float = time.perf_counter()
+    COMMANDS[args.command](args, timings)
+    if args.timing:
+        total: float = time.perf_counter() - start
+        loaded: List[str] = [name for name in HEAVY_MODULES if name in sys.modules]
+        print(
+            f"Импорт модулей: {timings.get('import', 0.0):.3f} с, выполнение: {total - timings.get('import', 0.0):.3f} с;"
+            f" загружены: {', '.join(loaded) if loaded else 'без pandas и openpyxl'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
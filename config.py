@@ -0,0 +1,118 @@
+from constants import *
+from help_functions import apply_demand, get_interval_table
+from dataclasses import dataclass, field
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """
+    Неизменяемые параметры одного сценария симуляции.
+
+    Конфигурация передаётся во все функции и модели вместо чтения глобальных констант,
+    поэтому в одном процессе можно одновременно выполнять сценарии с разными параметрами.
+    Конфигурация описывает один маршрут; в сети маршрутов (network.py) у каждого маршрута своя конфигурация.
+    Производные величины (время полного маршрута, таблицы интервалов выпуска по часам недели)
+    рассчитываются один раз при создании объекта.
+
+    Attributes:
+        simulation_duration (int): Продолжительность симуляции в минутах.
+        n_of_stations (int): Количество остановок на маршруте.
+        n_of_buses (int): Количество автобусов.
+        n_of_drivers_eight_shift (int): Количество водителей с 8-часовыми сменами.
+        n_of_drivers_twelve_shift (int): Количество водителей с 12-часовыми сменами.
+        start_hour (int): Час начала симуляции.
+        to_next (int): Время в пути между соседними остановками в минутах.
+        segment_times (Tuple[int, ...]): Время каждого перегона в минутах: перегон i ведёт от остановки i
+            к остановке i + 1, последний - обратно к начальной. Пустой кортеж - все перегоны по to_next.
+        demand (Tuple[float, ...]): Профиль спроса: множители частоты выпуска на каждый час суток
+            (24 значения) или недели (168 значений). Пустой кортеж - без поправки на спрос.
+        segments (Tuple[int, ...]): Время перегонов с учётом значения по умолчанию.
+        road_time (int): Время полного маршрута в минутах.
+        start_minute (int): Минута начала симуляции.
+        end_minute (int): Минута окончания симуляции (не включительно).
+        dispatch_intervals (Tuple[float, ...]): Интервалы выпуска автобусов для каждого часа недели.
+        required_buses (Tuple[int, ...]): Требуемое количество автобусов для каждого часа недели.
+    """
+
+    simulation_duration: int = SIMULATION_DURATION
+    n_of_stations: int = N_OF_STATIONS
+    n_of_buses: int = N_OF_BUS
+    n_of_drivers_eight_shift: int = N_OF_DRIVERS_EIGHT_SHIFT
+    n_of_drivers_twelve_shift: int = N_OF_DRIVERS_TWELVE_SHIFT
+    start_hour: int = SIMULATION_START_HOURS
+    to_next: int = DEFAULT_TO_NEXT
+    segment_times: Tuple[int, ...] = ()
+    demand: Tuple[float, ...] = ()
+    segments: Tuple[int, ...] = field(init=False, repr=False)
+    road_time: int = field(init=False)
+    start_minute: int = field(init=False)
+    end_minute: int = field(init=False)
+    dispatch_intervals: Tuple[float, ...] = field(init=False, repr=False)
+    required_buses: Tuple[int, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Проверяет параметры и рассчитывает производные величины.
+
+        Raises:
+            ValueError: Если параметры сценария некорректны.
+        """
+        if self.n_of_stations <= 0 or self.to_next <= 0:
+            raise ValueError("Количество остановок и время между остановками должны быть положительными.")
+        if self.n_of_buses < 0 or self.n_of_drivers_eight_shift < 0 or self.n_of_drivers_twelve_shift < 0:
+            raise ValueError("Количество автобусов и водителей не может быть отрицательным.")
+        if self.segment_times and len(self.segment_times) != self.n_of_stations:
+            raise ValueError(
+                f"Количество перегонов ({len(self.segment_times)}) должно совпадать с количеством остановок "
+                f"({self.n_of_stations})."
+            )
+        if any(segment_time <= 0 for segment_time in self.segment_times):
+            raise ValueError("Время в пути по перегону должно быть положительным.")
+        if self.demand and len(self.demand) not in (HOUR_IN_DAY, HOURS_IN_WEEK):
+            raise ValueError(f"Профиль спроса задаётся на {HOUR_IN_DAY} или {HOURS_IN_WEEK} часов: {len(self.demand)}")
+        if any(factor <= 0 for factor in self.demand):
+            raise ValueError("Множители спроса должны быть положительными.")
+
+        segments: Tuple[int, ...] = tuple(self.segment_times) or (self.to_next,) * self.n_of_stations
+        road_time: int = sum(segments)
+        start_minute: int = self.start_hour * MINUTES_PER_HOUR
+        intervals, required = get_interval_table(self.n_of_buses, float(road_time))
+        if self.demand:
+            intervals, required = apply_demand(intervals, tuple(self.demand), float(road_time))
+        # Поля замороженного dataclass задаются в обход __setattr__
+        object.__setattr__(self, "segments", segments)
+        object.__setattr__(self, "road_time", road_time)
+        object.__setattr__(self, "start_minute", start_minute)
+        object.__setattr__(self, "end_minute", start_minute + self.simulation_duration)
+        object.__setattr__(self, "dispatch_intervals", intervals)
+        object.__setattr__(self, "required_buses", required)
+
+    def dispatch_plan(self, current_time: int) -> Tuple[float, int]:
+        """
+        Возвращает интервал выпуска и требуемое количество автобусов для текущего часа недели.
+
+        Args:
+            current_time (int): Текущее время симуляции в минутах.
+
+        Returns:
+            Tuple[float, int]: Интервал выпуска автобусов в минутах и требуемое количество автобусов.
+        """
+        hour_of_week: int = (current_time // MINUTES_PER_HOUR) % HOURS_IN_WEEK
+        return self.dispatch_intervals[hour_of_week], self.required_buses[hour_of_week]
+
+    def segment_time(self, station: int, direct: bool) -> int:
+        """
+        Возвращает время в пути от станции до следующей остановки по направлению движения.
+
+        Станции прямого направления нумеруются 0, 1, ..., обратного - 0, -1, ...,
+        поэтому из станции -k автобус обратного направления едет по перегону n - 1 - k.
+
+        Args:
+            station (int): Текущая станция автобуса.
+            direct (bool): Направление движения; ложное значение - обратное направление.
+
+        Returns:
+            int: Время в пути в минутах.
+        """
+        return self.segments[station if direct else self.n_of_stations - 1 + station]
@@ -1,5 +1,5 @@
-from datetime import timedelta
 # Константы
+# Все промежутки времени задаются в целых минутах
 N_OF_BUS: int = 8
 
 
@@ -21,43 +21,76 @@ N_OF_DRIVERS_TWELVE_SHIFT: int = 30
 
 HOUR_IN_DAY: int = 24
 SECONDS_IN_HOUR: int = 3600
+SECONDS_IN_MINUTE: int = 60
 MIN_WORK_HOUR: int = 5
 MAX_WORK_HOUR: int = 22
 MINUTES_PER_HOUR: int = 60
+MINUTES_PER_DAY: int = HOUR_IN_DAY * MINUTES_PER_HOUR
+HOURS_IN_WEEK: int = DAYS_IN_WEEK * HOUR_IN_DAY
 WEEKEND_REGULAR_START_HOUR: int = 10
 WEEKEND_REGULAR_END_HOUR: int = 23
 
 SIMULATION_DURATION: int = 9500
+# Движки симуляции (см. simulation.simulate)
+ENGINES = ("tick", "event", "vector")
+# Профилировать ли фазы симуляции в main.py (см. profiler.py)
+PROFILE_SIMULATION: bool = False
 
-SHIFT_DURATION_8H: timedelta = timedelta(hours=8)
-SHIFT_DURATION_12H: timedelta = timedelta(hours=12)
-WORKING_TIME_THRESHOLD_8H: timedelta = timedelta(hours=4)
-WORKING_TIME_THRESHOLD_12H_FIRST: timedelta = timedelta(hours=4)
-WORKING_TIME_THRESHOLD_12H_SECOND: timedelta = timedelta(hours=7)
+SHIFT_DURATION_8H: int = 8 * MINUTES_PER_HOUR
+SHIFT_DURATION_12H: int = 12 * MINUTES_PER_HOUR
+WORKING_TIME_THRESHOLD_8H: int = 4 * MINUTES_PER_HOUR
+WORKING_TIME_THRESHOLD_12H_FIRST: int = 4 * MINUTES_PER_HOUR
+WORKING_TIME_THRESHOLD_12H_SECOND: int = 7 * MINUTES_PER_HOUR
 
 SIMULATION_START_HOURS: int = 6
 DISPATCH_BUSES_DEFAULT: int = 4
 DISPATCH_MINUTES: int = 5
-TIME_INCREMENT: timedelta = timedelta(minutes=1)
-INITIAL_DISPATCH_TIME: timedelta = timedelta(seconds=0)
+TIME_INCREMENT: int = 1
+INITIAL_DISPATCH_TIME: int = 0
 PLACEHOLDER_COLUMN: str = "placeholder"
 
 N_OF_STATIONS: int = 5
-DEFAULT_TO_NEXT = timedelta(minutes=12)
-FLOAT_ROAD_TIME: float = DEFAULT_TO_NEXT.total_seconds() // MINUTES_PER_HOUR * N_OF_STATIONS
+DEFAULT_TO_NEXT: int = 12
+FLOAT_ROAD_TIME: float = float(DEFAULT_TO_NEXT * N_OF_STATIONS)
 START_STATION = 0
 
-DEFAULT_SHIFT_DURATION_8H = timedelta(hours=8)
-DEFAULT_SHIFT_DURATION_12H = timedelta(hours=12)
-BREAK_DURATION_8H = timedelta(minutes=60)
-BREAK_DURATION_12H = timedelta(minutes=30)
+DEFAULT_SHIFT_DURATION_8H: int = 8 * MINUTES_PER_HOUR
+DEFAULT_SHIFT_DURATION_12H: int = 12 * MINUTES_PER_HOUR
+BREAK_DURATION_8H: int = 60
+BREAK_DURATION_12H: int = 30
+MAX_BREAK_DURATION: int = 60
 DAILY_BREAKS_8H = 1
 DAILY_BREAKS_12H = 2
-BETWEEN_SHIFTS_TIME = timedelta(hours=11)
+BETWEEN_SHIFTS_TIME: int = 11 * MINUTES_PER_HOUR
 MAX_HOUR = 24
-DAY_OFF_DURATION_12H = timedelta(hours=48)
+DAY_OFF_DURATION_12H: int = 48 * MINUTES_PER_HOUR
 
 
 PEAK_MULTIPLIER: float = 2
 REGULAR_MULTIPLIER: float = 8 / 3
 NIGHT_MULTIPLIER: float = 4.0
+
+
+# Генетический алгоритм составления недельного расписания водителей (genetic.py)
+MINUTES_PER_WEEK: int = DAYS_IN_WEEK * MINUTES_PER_DAY
+GA_STOPS_COUNT: int = 5
+GA_SEGMENT_DURATION: int = 12
+GA_NUM_BUSES: int = 8
+GA_NIGHT_START_HOUR: int = 22
+GA_NIGHT_END_HOUR: int = 6
+GA_REQUIRED_PEAK: int = 4
+GA_REQUIRED_REGULAR: int = 3
+GA_REQUIRED_NIGHT: int = 2
+GA_MIN_BREAK_12H: int = 60
+
+COST_PER_DRIVER: float = 200.0
+COVERAGE_PENALTY: float = 50.0
+CONFLICT_PENALTY: float = 30.0
+TELEPORT_PENALTY: float = 5.0
+NIGHT_WEEKEND_PENALTY: float = 10.0
+OVERTIME_8H_PENALTY: float = 5.0
+OVERTIME_12H_PENALTY: float = 5.0
+
+# Островная модель генетического алгоритма (genetic.run_islands)
+MIGRATION_INTERVAL: int = 10
+N_OF_MIGRANTS: int = 2
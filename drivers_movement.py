@@ -1,112 +1,97 @@
 from constants import *
-from datetime import timedelta
-from models import Bus, BusDriver
-from help_functions import get_interval
+from config import SimulationConfig
+from models import BusDriver
+from pools import BusPool, DriverPool
+from event_log import EventLog, Action, NO_BUS
 from typing import List
-import pandas as pd
 
 
-def drivers_movement(
+def process_driver(
+        config: SimulationConfig,
+        driver: 'BusDriver',
         active_drivers: List['BusDriver'],
-        finished_drivers: List['BusDriver'],
+        driver_pool: 'DriverPool',
         drivers_on_lunch: List['BusDriver'],
-        buses: List['Bus'],
-        df: pd.DataFrame,
-        current_time: timedelta
-) -> pd.DataFrame:
+        bus_pool: 'BusPool',
+        event_log: EventLog,
+        current_time: int
+) -> None:
     """
-    Обрабатывает действия водителей автобусов, включая движение, перерывы и завершение смены.
-
-    Эта функция обновляет состояние водителей и автобусов, записывая информацию в DataFrame.
+    Обрабатывает одну минуту работы активного водителя: завершение смены, перерыв или движение.
 
     Args:
+        config (SimulationConfig): Параметры сценария.
+        driver (BusDriver): Активный водитель.
         active_drivers (List[BusDriver]): Список активных водителей.
-        finished_drivers (List[BusDriver]): Список завершивших работу водителей.
+        driver_pool (DriverPool): Пул водителей, ожидающих смены.
         drivers_on_lunch (List[BusDriver]): Список водителей на перерыве.
-        buses (List[Bus]): Список автобусов
-        df (pd.DataFrame): DataFrame для отслеживания состояния водителей.
-        current_time (timedelta): Текущее время.
-
-    Returns:
-        pd.DataFrame: Обновленный DataFrame со статусами водителей.
+        bus_pool (BusPool): Пул свободных автобусов.
+        event_log (EventLog): Журнал событий симуляции.
+        current_time (int): Текущее время в минутах.
     """
-    time_str = f"{current_time.days % DAYS_IN_WEEK}, {current_time - timedelta(hours=current_time.days * HOUR_IN_DAY)}"
+    if not event_log.has_driver(driver.name):
+        event_log.record(current_time, driver.name, driver.shift_duration, Action.SHIFT_START,
+                         driver.bus.number if driver.bus else NO_BUS)
 
-    if time_str not in df.index:
-        df.loc[time_str] = [pd.NA] * len(df.columns)
+    if not driver.is_allowed_to_work(current_time):
+        event_log.record(current_time, driver.name, driver.shift_duration, Action.SHIFT_END, driver.bus.number)
+        driver.end_of_the_day(active_drivers, driver_pool, bus_pool, current_time)
+        return
 
-    dispatch_interval = get_interval(current_time, N_OF_BUS, FLOAT_ROAD_TIME)
+    if driver.on_lunch:
+        if driver.end_break(drivers_on_lunch, bus_pool, active_drivers, driver_pool, current_time):
+            event_log.record(current_time, driver.name, driver.shift_duration, Action.BREAK_END, driver.bus.number)
+        return
 
-    for driver in active_drivers[:]:
-        if driver.name not in df.columns:
-            df[driver.name] = pd.NA
-            df.at[time_str, driver.name] = [
-                "Вышел на смену",
-                f"Смена: {driver.shift_duration}",
-                f"Автобус: {driver.bus.number if driver.bus else 'Не назначен'}"
-            ]
+    if driver.is_break_due():
+        event_log.record(current_time, driver.name, driver.shift_duration, Action.BREAK_START)
+        driver.take_break(bus_pool, drivers_on_lunch, current_time)
+        return
+
+    driver.working_time += TIME_INCREMENT
 
-        if not driver.is_allowed_to_work(DEFAULT_TO_NEXT * N_OF_STATIONS, current_time):
-            df.at[time_str, driver.name] = [
-                f"Закончил смену",
-                f"Смена: {driver.shift_duration}",
-                f"Автобус: {driver.bus.number}"
-            ]
-            driver.end_of_the_day(active_drivers, finished_drivers, buses)
-            continue
+    reached_station = driver.drive_bus()
 
-        if driver.on_lunch:
-            if driver.end_break(drivers_on_lunch, buses, active_drivers, finished_drivers):
-                df.at[time_str, driver.name] = [
-                    "Закончил перерыв",
-                    f"Смена: {driver.shift_duration}",
-                    f"Автобус: {driver.bus.number}"
-                ]
-            continue
+    if reached_station:
+        station = driver.bus.station
+        if station not in (0, config.n_of_stations):
+            event_log.record(current_time, driver.name, driver.shift_duration, Action.STOP, driver.bus.number,
+                             station if driver.bus.direct else config.n_of_stations + station)
         else:
-            if driver.shift_duration == SHIFT_DURATION_8H:
-                if driver.working_time >= WORKING_TIME_THRESHOLD_8H and driver.daily_breaks > 0 and driver.bus.station == START_STATION:
-                    df.at[time_str, driver.name] = [
-                        "Ушел на перерыв",
-                        f"Смена: {driver.shift_duration}",
-                        "Автобус: None"
-                    ]
-                    driver.take_break(buses, drivers_on_lunch)
-                    continue
-            else:
-                if (
-                        (driver.working_time >= WORKING_TIME_THRESHOLD_12H_FIRST and
-                         driver.daily_breaks == 2 and
-                         driver.bus.station == START_STATION) or
-                        (driver.working_time >= WORKING_TIME_THRESHOLD_12H_SECOND and
-                         driver.daily_breaks == 1 and
-                         driver.bus.station == START_STATION)
-                ):
-                    df.at[time_str, driver.name] = [
-                        "Ушел на перерыв",
-                        f"Смена: {driver.shift_duration}",
-                        "Автобус: None"
-                    ]
-                    driver.take_break(buses, drivers_on_lunch)
-                    continue
+            event_log.record(current_time, driver.name, driver.shift_duration, Action.DEPOT, driver.bus.number)
 
-        driver.working_time += TIME_INCREMENT
 
-        reached_station = driver.drive_bus()
+def drivers_movement(
+        config: SimulationConfig,
+        active_drivers: List['BusDriver'],
+        driver_pool: 'DriverPool',
+        drivers_on_lunch: List['BusDriver'],
+        bus_pool: 'BusPool',
+        event_log: EventLog,
+        current_time: int
+) -> None:
+    """
+    Обрабатывает действия водителей автобусов, включая движение, перерывы и завершение смены.
 
-        if reached_station:
-            station = driver.bus.station
-            if station not in (0, N_OF_STATIONS):
-                df.at[time_str, driver.name] = [
-                    f"На остановке {(station) if driver.bus.direct else (N_OF_STATIONS + station)}",
-                    f"Смена: {driver.shift_duration}",
-                    f"Автобус: {driver.bus.number}"
-                ]
-            else:
-                df.at[time_str, driver.name] = [
-                    f"В депо",
-                    f"Смена: {driver.shift_duration}",
-                    f"Автобус: {driver.bus.number}"
-                ]
+    Эта функция обновляет состояние водителей и автобусов, записывая события в журнал.
 
-    return df
+    Args:
+        config (SimulationConfig): Параметры сценария.
+        active_drivers (List[BusDriver]): Список активных водителей.
+        driver_pool (DriverPool): Пул водителей, ожидающих смены.
+        drivers_on_lunch (List[BusDriver]): Список водителей на перерыве.
+        bus_pool (BusPool): Пул свободных автобусов.
+        event_log (EventLog): Журнал событий симуляции.
+        current_time (int): Текущее время в минутах.
+    """
+    for driver in active_drivers[:]:
+        process_driver(
+            config=config,
+            driver=driver,
+            active_drivers=active_drivers,
+            driver_pool=driver_pool,
+            drivers_on_lunch=drivers_on_lunch,
+            bus_pool=bus_pool,
+            event_log=event_log,
+            current_time=current_time
+        )
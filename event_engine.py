@@ -0,0 +1,297 @@
+from constants import *
+from config import SimulationConfig
+from models import Bus, BusDriver
+from pools import BusPool, DriverPool
+from drivers_movement import process_driver
+from get_and_check_drivers import check_drivers
+from event_log import EventLog
+from profiler import SimulationProfiler, PROFILE_MOVEMENT, PROFILE_REST
+from typing import List, Optional, Set
+import heapq
+import itertools
+import math
+
+# Фазы внутри одной минуты в том же порядке, что и в пошаговом цикле simulate_time
+PHASE_MOVEMENT: int = 0
+PHASE_DISPATCH: int = 1
+
+EVENT_DRIVER: int = 0
+EVENT_DISPATCH: int = 1
+
+
+class RouteState:
+    """
+    Состояние диспетчеризации одного маршрута в событийном движке.
+
+    У каждого маршрута свои активные водители, водители на перерыве и времена последнего выпуска,
+    а пулы водителей и автобусов принадлежат депо и могут быть общими для нескольких маршрутов.
+
+    Attributes:
+        index (int): Номер маршрута; задаёт порядок диспетчеризации маршрутов внутри минуты.
+        config (SimulationConfig): Параметры маршрута.
+        active_drivers (List[BusDriver]): Список активных водителей маршрута.
+        driver_pool (DriverPool): Пул водителей депо, ожидающих смены.
+        drivers_on_lunch (List[BusDriver]): Список водителей маршрута на перерыве.
+        bus_pool (BusPool): Пул свободных автобусов депо.
+        event_log (EventLog): Журнал событий маршрута.
+        last_dispatch_time_direct (int): Время последней диспетчеризации в прямом направлении.
+        last_dispatch_time_reverse (int): Время последней диспетчеризации в обратном направлении.
+        dispatch_minutes (Set[int]): Минуты, на которые уже запланирована проверка диспетчеризации.
+    """
+
+    __slots__ = (
+        "index", "config", "active_drivers", "driver_pool", "drivers_on_lunch", "bus_pool", "event_log",
+        "last_dispatch_time_direct", "last_dispatch_time_reverse", "dispatch_minutes",
+    )
+
+    def __init__(
+            self,
+            index: int,
+            config: SimulationConfig,
+            active_drivers: List['BusDriver'],
+            driver_pool: 'DriverPool',
+            drivers_on_lunch: List['BusDriver'],
+            bus_pool: 'BusPool',
+            event_log: EventLog
+    ) -> None:
+        """
+        Инициализирует состояние маршрута до первого выпуска.
+
+        Args:
+            index (int): Номер маршрута.
+            config (SimulationConfig): Параметры маршрута.
+            active_drivers (List[BusDriver]): Список активных водителей маршрута.
+            driver_pool (DriverPool): Пул водителей депо.
+            drivers_on_lunch (List[BusDriver]): Список водителей маршрута на перерыве.
+            bus_pool (BusPool): Пул свободных автобусов депо.
+            event_log (EventLog): Журнал событий маршрута.
+        """
+        self.index: int = index
+        self.config: SimulationConfig = config
+        self.active_drivers: List['BusDriver'] = active_drivers
+        self.driver_pool: 'DriverPool' = driver_pool
+        self.drivers_on_lunch: List['BusDriver'] = drivers_on_lunch
+        self.bus_pool: 'BusPool' = bus_pool
+        self.event_log: EventLog = event_log
+        self.last_dispatch_time_direct: int = INITIAL_DISPATCH_TIME
+        self.last_dispatch_time_reverse: int = INITIAL_DISPATCH_TIME
+        self.dispatch_minutes: Set[int] = set()
+
+
+class EventEngine:
+    """
+    Дискретно-событийный движок симуляции.
+
+    Вместо перебора каждой минуты движок хранит в очереди с приоритетом только реальные события:
+    прибытие на остановку, начало и конец перерыва, конец смены, моменты диспетчеризации.
+    Окончание отдыха и выходного отслеживает пул водителей. Между событиями состояние водителя
+    меняется предсказуемо, поэтому движок сразу переходит к следующему событию.
+
+    События одной минуты обрабатываются в том же порядке, что и в пошаговом цикле:
+    сначала водители в порядке выхода на линию, затем диспетчеризация.
+    Поэтому результат совпадает с результатом пошагового движка.
+
+    Движок обслуживает один или несколько маршрутов (сеть маршрутов, см. network.py) с общей очередью событий:
+    у каждого маршрута своё состояние диспетчеризации (RouteState), пулы депо общие для его маршрутов.
+    Диспетчеризация маршрутов внутри минуты выполняется в порядке их номеров.
+    Стоимость события не зависит от количества маршрутов, поэтому время прогона растёт
+    пропорционально количеству событий, а не произведению маршрутов на минуты.
+
+    Attributes:
+        routes (List[RouteState]): Состояния маршрутов; все маршруты моделируются на одном интервале времени.
+        profiler (Optional[SimulationProfiler]): Профилировщик фаз или None.
+        start_minute (int): Минута начала симуляции.
+        end_minute (int): Минута окончания симуляции (не включительно).
+    """
+
+    def __init__(self, routes: List[RouteState], profiler: Optional[SimulationProfiler] = None) -> None:
+        """
+        Инициализирует движок с пустой очередью событий.
+
+        Args:
+            routes (List[RouteState]): Состояния маршрутов.
+            profiler (Optional[SimulationProfiler], optional): Профилировщик фаз; обработка каждого события
+                учитывается как вызов фазы. По умолчанию None - без профилирования.
+        """
+        self.routes: List[RouteState] = routes
+        self.profiler: Optional[SimulationProfiler] = profiler
+        self.start_minute: int = routes[0].config.start_minute
+        self.end_minute: int = routes[0].config.end_minute
+        self._queue: List[tuple] = []
+        self._counter = itertools.count()
+        self._activation = itertools.count()
+
+    def _push(
+            self,
+            minute: int,
+            phase: int,
+            order: int,
+            kind: int,
+            route: RouteState,
+            driver: Optional['BusDriver'] = None
+    ) -> None:
+        """
+        Добавляет событие в очередь, если оно наступает до конца симуляции.
+
+        Args:
+            minute (int): Минута события.
+            phase (int): Фаза внутри минуты (PHASE_*).
+            order (int): Порядок внутри фазы.
+            kind (int): Тип события (EVENT_*).
+            route (RouteState): Маршрут, к которому относится событие.
+            driver (Optional[BusDriver], optional): Водитель, к которому относится событие.
+        """
+        if minute < self.end_minute:
+            heapq.heappush(self._queue, (minute, phase, order, next(self._counter), kind, route, driver))
+
+    def _schedule_dispatch(self, route: RouteState, minute: int) -> None:
+        """
+        Планирует проверку диспетчеризации маршрута, если на эту минуту она ещё не запланирована.
+
+        Args:
+            route (RouteState): Маршрут.
+            minute (int): Минута проверки.
+        """
+        if minute not in route.dispatch_minutes and minute < self.end_minute:
+            route.dispatch_minutes.add(minute)
+            self._push(minute, PHASE_DISPATCH, route.index, EVENT_DISPATCH, route)
+
+    def _next_driver_minute(self, driver: 'BusDriver', minute: int) -> int:
+        """
+        Находит минуту следующего события водителя и переводит его состояние на начало этой минуты.
+
+        До события водитель либо просто едет (растёт время работы, уменьшается время до остановки),
+        либо отдыхает (растёт время перерыва), поэтому промежуток пропускается целиком.
+        Только на стартовой остановке условия конца смены и перерыва проверяются поминутно.
+
+        Args:
+            driver (BusDriver): Активный водитель после обработки текущей минуты.
+            minute (int): Текущая минута.
+
+        Returns:
+            int: Минута следующего события водителя.
+        """
+        next_minute: int = minute + 1
+
+        if driver.on_lunch:
+            remaining: int = driver.break_duration - driver.resting_time
+            if remaining > TIME_INCREMENT:
+                skip: int = remaining - TIME_INCREMENT
+                driver.resting_time += skip
+                next_minute += skip
+            return next_minute
+
+        bus: 'Bus' = driver.bus
+        n_of_stations: int = driver.config.n_of_stations
+        while True:
+            if not driver.is_allowed_to_work(next_minute) or driver.is_break_due():
+                return next_minute
+            if bus.to_next <= TIME_INCREMENT:
+                return next_minute
+            if bus.station in (START_STATION, n_of_stations):
+                step: int = TIME_INCREMENT
+            else:
+                step = bus.to_next - TIME_INCREMENT
+            driver.working_time += step
+            bus.to_next -= step
+            next_minute += step
+
+    def _on_driver(self, route: RouteState, driver: 'BusDriver', minute: int, order: int) -> None:
+        """
+        Обрабатывает событие водителя и планирует его следующее событие.
+
+        Args:
+            route (RouteState): Маршрут водителя.
+            driver (BusDriver): Активный водитель.
+            minute (int): Текущая минута.
+            order (int): Порядок выхода водителя на линию.
+        """
+        n_active: int = len(route.active_drivers)
+        process_driver(
+            config=route.config,
+            driver=driver,
+            active_drivers=route.active_drivers,
+            driver_pool=route.driver_pool,
+            drivers_on_lunch=route.drivers_on_lunch,
+            bus_pool=route.bus_pool,
+            event_log=route.event_log,
+            current_time=minute
+        )
+        if len(route.active_drivers) < n_active:
+            # Количество активных водителей уменьшилось, поэтому может понадобиться новый выпуск
+            self._schedule_dispatch(route, minute)
+            return
+        self._push(self._next_driver_minute(driver, minute), PHASE_MOVEMENT, order, EVENT_DRIVER, route, driver)
+
+    def _on_dispatch(self, route: RouteState, minute: int) -> None:
+        """
+        Выполняет диспетчеризацию маршрута и планирует следующую проверку.
+
+        Следующая проверка нужна в начале следующего часа (меняется интервал выпуска)
+        или в момент, когда истечёт интервал с последнего выпуска, если автобусов не хватает.
+
+        Args:
+            route (RouteState): Маршрут.
+            minute (int): Текущая минута.
+        """
+        route.dispatch_minutes.discard(minute)
+        n_active: int = len(route.active_drivers)
+        route.last_dispatch_time_direct, route.last_dispatch_time_reverse = check_drivers(
+            config=route.config,
+            current_time=minute,
+            driver_pool=route.driver_pool,
+            active_drivers=route.active_drivers,
+            bus_pool=route.bus_pool,
+            last_dispatch_time_direct=route.last_dispatch_time_direct,
+            last_dispatch_time_reverse=route.last_dispatch_time_reverse
+        )
+        for driver in route.active_drivers[n_active:]:
+            self._push(minute + 1, PHASE_MOVEMENT, next(self._activation), EVENT_DRIVER, route, driver)
+
+        next_minute: int = (minute // MINUTES_PER_HOUR + 1) * MINUTES_PER_HOUR
+        dispatch_interval, required_buses = route.config.dispatch_plan(minute)
+        if required_buses - len(route.active_drivers) // 2 > 0:
+            for last_dispatch in (route.last_dispatch_time_direct, route.last_dispatch_time_reverse):
+                if last_dispatch == 0:
+                    due_minute: int = minute + 1
+                else:
+                    due_minute = max(math.ceil(last_dispatch + dispatch_interval), minute + 1)
+                next_minute = min(next_minute, due_minute)
+        self._schedule_dispatch(route, next_minute)
+
+    def run(self) -> None:
+        """
+        Запускает обработку событий от начала до конца симуляции.
+        """
+        for route in self.routes:
+            self._schedule_dispatch(route, self.start_minute)
+        if self.profiler is not None:
+            self._run_profiled(self.profiler)
+            return
+        while self._queue:
+            minute, _, order, _, kind, route, driver = heapq.heappop(self._queue)
+            if kind == EVENT_DRIVER:
+                self._on_driver(route, driver, minute, order)
+            else:
+                self._on_dispatch(route, minute)
+
+    def _run_profiled(self, profiler: SimulationProfiler) -> None:
+        """
+        Обрабатывает события так же, как run, учитывая время обработки каждого события в профилировщике.
+
+        Args:
+            profiler (SimulationProfiler): Профилировщик фаз.
+        """
+        while self._queue:
+            minute, _, order, _, kind, route, driver = heapq.heappop(self._queue)
+            profiler.start()
+            if kind == EVENT_DRIVER:
+                self._on_driver(route, driver, minute, order)
+                profiler.lap(PROFILE_MOVEMENT)
+            else:
+                # Таймеры отдыха иначе проверяются внутри диспетчеризации при запросе водителя
+                route.driver_pool.wake(minute)
+                profiler.lap(PROFILE_REST)
+                profiler.start_dispatch(route.driver_pool.misses, route.bus_pool.misses)
+                self._on_dispatch(route, minute)
+                profiler.end_dispatch(route.driver_pool.misses, route.bus_pool.misses)
@@ -0,0 +1,412 @@
+from constants import *
+from profiler import SimulationProfiler
+from datetime import timedelta
+from enum import IntEnum
+from typing import Dict, List, Optional, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class Action(IntEnum):
+    """
+    Коды действий водителя, которые записываются в журнал событий.
+    """
+
+    SHIFT_START = 0
+    SHIFT_END = 1
+    BREAK_START = 2
+    BREAK_END = 3
+    STOP = 4
+    DEPOT = 5
+
+
+ACTION_TEXTS: Dict[int, str] = {
+    Action.SHIFT_START: "Вышел на смену",
+    Action.SHIFT_END: "Закончил смену",
+    Action.BREAK_START: "Ушел на перерыв",
+    Action.BREAK_END: "Закончил перерыв",
+    Action.DEPOT: "В депо",
+}
+
+NO_BUS: int = -1
+INITIAL_CAPACITY: int = 4096
+
+# Столбцовые буферы журнала событий (см. EventLog.columns)
+EVENT_COLUMNS: List[str] = ["minute", "driver", "action", "bus", "stop"]
+
+# Столбцы типизированной таблицы записей расписания (см. EventLog.to_records)
+RECORD_COLUMNS: List[str] = ["minute", "driver", "action", "shift_minutes", "bus", "stop"]
+
+
+def format_time(minutes: int) -> str:
+    """
+    Формирует текст продолжительности или времени суток вида "Ч:ММ:СС".
+
+    Args:
+        minutes (int): Количество минут.
+
+    Returns:
+        str: Текстовое представление времени.
+    """
+    return str(timedelta(minutes=minutes))
+
+
+def format_time_index(minute: int) -> str:
+    """
+    Формирует метку строки расписания вида "день, Ч:ММ:СС".
+
+    Args:
+        minute (int): Время симуляции в минутах от начала первого дня.
+
+    Returns:
+        str: Метка строки (день недели и время суток).
+    """
+    days, minute_of_day = divmod(minute, MINUTES_PER_DAY)
+    return f"{days % DAYS_IN_WEEK}, {format_time(minute_of_day)}"
+
+
+def render_action(action: int, stop: int) -> str:
+    """
+    Формирует текст действия водителя.
+
+    Args:
+        action (int): Код действия (Action).
+        stop (int): Номер остановки для Action.STOP.
+
+    Returns:
+        str: Текст действия.
+    """
+    if action == Action.STOP:
+        return f"На остановке {stop}"
+    return ACTION_TEXTS[action]
+
+
+def render_bus(action: int, bus: int) -> str:
+    """
+    Формирует текст номера автобуса.
+
+    Args:
+        action (int): Код действия (Action).
+        bus (int): Номер автобуса или NO_BUS.
+
+    Returns:
+        str: Номер автобуса, "Не назначен" при выходе на смену без автобуса или "None".
+    """
+    if bus != NO_BUS:
+        return str(bus)
+    if action == Action.SHIFT_START:
+        return "Не назначен"
+    return "None"
+
+
+def render_shift(shift_minutes: int) -> str:
+    """
+    Формирует текст вида смены.
+
+    Args:
+        shift_minutes (int): Продолжительность смены в минутах.
+
+    Returns:
+        str: Текст вида "Смена: Ч:ММ:СС".
+    """
+    return f"Смена: {format_time(shift_minutes)}"
+
+
+class EventLog:
+    """
+    Журнал событий симуляции с хранением записей в столбцовых буферах.
+
+    Каждое событие занимает одну компактную запись (минута, водитель, действие, автобус, остановка).
+    Широкая таблица "время × водитель", которую ожидает excel_schedule, строится один раз по запросу.
+
+    Attributes:
+        start_minute (int): Минута начала симуляции.
+        end_minute (int): Минута окончания симуляции (не включительно).
+        driver_names (List[str]): Имена водителей в порядке первого появления в журнале.
+        driver_shifts (List[int]): Продолжительности смен водителей в минутах.
+        size (int): Количество записанных событий.
+        bus_service_minutes (Optional[np.ndarray]): Время в рейсе каждого автобуса в минутах,
+            заполняется по окончании симуляции.
+        bus_idle_minutes (Optional[np.ndarray]): Время простоя каждого автобуса в депо в минутах,
+            заполняется по окончании симуляции.
+        stats (Dict[str, float]): Сводные показатели прогона, заполняются по окончании симуляции.
+        profile (Optional[SimulationProfiler]): Профиль фаз симуляции, если она запускалась с флагом profile.
+    """
+
+    def __init__(self, start_minute: int, end_minute: int, capacity: int = INITIAL_CAPACITY) -> None:
+        """
+        Инициализирует пустой журнал событий.
+
+        Args:
+            start_minute (int): Минута начала симуляции.
+            end_minute (int): Минута окончания симуляции (не включительно).
+            capacity (int, optional): Начальный размер буферов. По умолчанию INITIAL_CAPACITY.
+        """
+        self.start_minute: int = start_minute
+        self.end_minute: int = end_minute
+        self.driver_names: List[str] = []
+        self.driver_shifts: List[int] = []
+        self.size: int = 0
+        self.bus_service_minutes: Optional[np.ndarray] = None
+        self.bus_idle_minutes: Optional[np.ndarray] = None
+        self.stats: Dict[str, float] = {}
+        self.profile: Optional[SimulationProfiler] = None
+        self._driver_ids: Dict[str, int] = {}
+        self._minute: np.ndarray = np.empty(capacity, dtype=np.int32)
+        self._driver: np.ndarray = np.empty(capacity, dtype=np.int32)
+        self._action: np.ndarray = np.empty(capacity, dtype=np.int8)
+        self._bus: np.ndarray = np.empty(capacity, dtype=np.int16)
+        self._stop: np.ndarray = np.empty(capacity, dtype=np.int16)
+        self._bus_usage: Optional['pd.DataFrame'] = None
+        self._frame: Optional['pd.DataFrame'] = None
+
+    @classmethod
+    def from_columns(
+            cls,
+            start_minute: int,
+            end_minute: int,
+            driver_names: List[str],
+            driver_shifts: List[int],
+            columns: Dict[str, np.ndarray]
+    ) -> 'EventLog':
+        """
+        Создаёт журнал по готовым столбцам событий, например загруженным из файла.
+
+        Массивы нужного типа используются без копирования, поэтому журнал может опираться
+        на файлы, отображённые в память. При первой новой записи буферы копируются.
+
+        Args:
+            start_minute (int): Минута начала симуляции.
+            end_minute (int): Минута окончания симуляции (не включительно).
+            driver_names (List[str]): Имена водителей в порядке первого появления в журнале.
+            driver_shifts (List[int]): Продолжительности смен водителей в минутах.
+            columns (Dict[str, np.ndarray]): Столбцы событий EVENT_COLUMNS одинаковой длины.
+
+        Returns:
+            EventLog: Журнал событий.
+
+        Raises:
+            ValueError: Если столбцы отсутствуют или имеют разную длину.
+        """
+        missing: List[str] = [name for name in EVENT_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"Отсутствуют столбцы журнала событий: {', '.join(missing)}")
+        sizes: set = {len(columns[name]) for name in EVENT_COLUMNS}
+        if len(sizes) != 1:
+            raise ValueError("Столбцы журнала событий имеют разную длину.")
+
+        event_log: EventLog = cls(start_minute, end_minute, capacity=0)
+        event_log.driver_names = list(driver_names)
+        event_log._driver_ids = {name: i for i, name in enumerate(event_log.driver_names)}
+        event_log.driver_shifts = [int(shift) for shift in driver_shifts]
+        event_log._minute = np.asarray(columns["minute"], dtype=np.int32)
+        event_log._driver = np.asarray(columns["driver"], dtype=np.int32)
+        event_log._action = np.asarray(columns["action"], dtype=np.int8)
+        event_log._bus = np.asarray(columns["bus"], dtype=np.int16)
+        event_log._stop = np.asarray(columns["stop"], dtype=np.int16)
+        event_log.size = sizes.pop()
+        return event_log
+
+    def set_bus_usage(self, service_minutes: np.ndarray, idle_minutes: np.ndarray) -> None:
+        """
+        Сохраняет счётчики использования автобусов.
+
+        Args:
+            service_minutes (np.ndarray): Время в рейсе каждого автобуса в минутах (индекс - номер автобуса).
+            idle_minutes (np.ndarray): Время простоя каждого автобуса в депо в минутах (индекс - номер автобуса).
+        """
+        self.bus_service_minutes = service_minutes
+        self.bus_idle_minutes = idle_minutes
+        self._bus_usage = None
+
+    @property
+    def bus_usage(self) -> Optional['pd.DataFrame']:
+        """
+        Optional[pd.DataFrame]: Статистика использования автобусов (см. bus_usage_frame) или None,
+            если счётчики не заполнены. Таблица строится при первом обращении, чтобы симуляция
+            не импортировала pandas.
+        """
+        if self._bus_usage is None and self.bus_service_minutes is not None:
+            from pools import bus_usage_frame
+            self._bus_usage = bus_usage_frame(self.bus_service_minutes, self.bus_idle_minutes)
+        return self._bus_usage
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Возвращает записанные события в виде столбцов без копирования.
+
+        Returns:
+            Dict[str, np.ndarray]: Столбцы EVENT_COLUMNS длиной size.
+        """
+        return {
+            "minute": self._minute[:self.size],
+            "driver": self._driver[:self.size],
+            "action": self._action[:self.size],
+            "bus": self._bus[:self.size],
+            "stop": self._stop[:self.size],
+        }
+
+    def has_driver(self, name: str) -> bool:
+        """
+        Проверяет, встречался ли водитель в журнале.
+
+        Args:
+            name (str): Имя водителя.
+
+        Returns:
+            bool: True, если по водителю уже есть записи, иначе False.
+        """
+        return name in self._driver_ids
+
+    def _driver_id(self, name: str, shift_duration: int) -> int:
+        """
+        Возвращает идентификатор водителя, регистрируя его при первом появлении.
+
+        Args:
+            name (str): Имя водителя.
+            shift_duration (int): Продолжительность смены водителя в минутах.
+
+        Returns:
+            int: Идентификатор водителя в журнале.
+        """
+        driver_id: Optional[int] = self._driver_ids.get(name)
+        if driver_id is None:
+            driver_id = len(self.driver_names)
+            self._driver_ids[name] = driver_id
+            self.driver_names.append(name)
+            self.driver_shifts.append(shift_duration)
+        return driver_id
+
+    def _grow(self) -> None:
+        """
+        Удваивает размер столбцовых буферов.
+        """
+        capacity: int = max(2 * len(self._minute), INITIAL_CAPACITY)
+        self._minute = np.resize(self._minute, capacity)
+        self._driver = np.resize(self._driver, capacity)
+        self._action = np.resize(self._action, capacity)
+        self._bus = np.resize(self._bus, capacity)
+        self._stop = np.resize(self._stop, capacity)
+
+    def record(
+            self,
+            minute: int,
+            name: str,
+            shift_duration: int,
+            action: int,
+            bus: int = NO_BUS,
+            stop: int = 0
+    ) -> None:
+        """
+        Добавляет событие в журнал.
+
+        Args:
+            minute (int): Время события в минутах.
+            name (str): Имя водителя.
+            shift_duration (int): Продолжительность смены водителя в минутах.
+            action (int): Код действия (Action).
+            bus (int, optional): Номер автобуса или NO_BUS. По умолчанию NO_BUS.
+            stop (int, optional): Номер остановки для Action.STOP. По умолчанию 0.
+        """
+        if self.size == len(self._minute):
+            self._grow()
+        i: int = self.size
+        self._minute[i] = minute
+        self._driver[i] = self._driver_id(name, shift_duration)
+        self._action[i] = action
+        self._bus[i] = bus
+        self._stop[i] = stop
+        self.size += 1
+        self._frame = None
+
+    def render_cell(self, driver_id: int, action: int, bus: int, stop: int) -> List[str]:
+        """
+        Формирует содержимое ячейки расписания для одного события.
+
+        Args:
+            driver_id (int): Идентификатор водителя.
+            action (int): Код действия (Action).
+            bus (int): Номер автобуса или NO_BUS.
+            stop (int): Номер остановки.
+
+        Returns:
+            List[str]: Действие, смена и автобус в текстовом виде.
+        """
+        return [
+            render_action(action, stop),
+            render_shift(self.driver_shifts[driver_id]),
+            f"Автобус: {render_bus(action, bus)}"
+        ]
+
+    def to_records(self) -> 'pd.DataFrame':
+        """
+        Строит типизированную таблицу записей расписания: одна запись на ячейку "минута недели × водитель".
+
+        Записи адресуются временем внутри недели так же, как строки to_frame: из событий одного водителя
+        в одну и ту же минуту недели остаётся последнее. Записи упорядочены по минуте недели от начала
+        симуляции, а внутри минуты - по порядку появления водителей. Текст не формируется:
+        действие хранится как категория Action, остальные поля - целые числа.
+
+        Returns:
+            pd.DataFrame: Таблица со столбцами minute (минута события), driver (категория с именами
+                водителей в порядке первого появления), action (категория с именами Action),
+                shift_minutes (продолжительность смены), bus (номер автобуса или NO_BUS)
+                и stop (номер остановки для Action.STOP).
+        """
+        import pandas as pd
+
+        minutes_in_week: int = DAYS_IN_WEEK * MINUTES_PER_DAY
+        minute: np.ndarray = self._minute[:self.size]
+        driver: np.ndarray = self._driver[:self.size]
+        rows: np.ndarray = (minute - self.start_minute) % minutes_in_week
+        key: np.ndarray = rows.astype(np.int64) * max(len(self.driver_names), 1) + driver
+
+        # Последняя запись для каждой ячейки; np.unique возвращает ключи по возрастанию
+        _, last_reversed = np.unique(key[::-1], return_index=True)
+        keep: np.ndarray = self.size - 1 - last_reversed
+
+        shifts: np.ndarray = np.asarray(self.driver_shifts, dtype=np.int16)
+        return pd.DataFrame({
+            "minute": minute[keep],
+            "driver": pd.Categorical.from_codes(driver[keep], categories=self.driver_names),
+            "action": pd.Categorical.from_codes(
+                self._action[keep], categories=[action.name for action in Action]
+            ),
+            "shift_minutes": shifts[driver[keep]],
+            "bus": self._bus[keep],
+            "stop": self._stop[keep],
+        }, columns=RECORD_COLUMNS)
+
+    def to_frame(self) -> 'pd.DataFrame':
+        """
+        Строит широкую таблицу состояний водителей (строки - минуты, столбцы - водители).
+
+        Строки адресуются временем внутри недели, поэтому при симуляции дольше недели
+        более поздние события перезаписывают ячейки той же минуты недели.
+        Результат кэшируется до следующей записи в журнал.
+
+        Returns:
+            pd.DataFrame: DataFrame с индексом "Time_index" и столбцами водителей.
+        """
+        if self._frame is not None:
+            return self._frame
+        import pandas as pd
+
+        minutes_in_week: int = DAYS_IN_WEEK * MINUTES_PER_DAY
+        n_rows: int = min(max(self.end_minute - self.start_minute, 0), minutes_in_week)
+        index: List[str] = [format_time_index(self.start_minute + i) for i in range(n_rows)]
+
+        data: np.ndarray = np.full((n_rows, len(self.driver_names) + 1), pd.NA, dtype=object)
+        rows: np.ndarray = (self._minute[:self.size] - self.start_minute) % minutes_in_week
+        for i in range(self.size):
+            driver_id: int = int(self._driver[i])
+            data[rows[i], driver_id + 1] = self.render_cell(
+                driver_id, int(self._action[i]), int(self._bus[i]), int(self._stop[i])
+            )
+
+        df: pd.DataFrame = pd.DataFrame(data, index=index, columns=[PLACEHOLDER_COLUMN] + self.driver_names)
+        df.index.name = "Time_index"
+        self._frame = df
+        return df
@@ -0,0 +1,1424 @@
+from constants import *
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+import os
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Состояния водителя в каждой минуте недели
+STATE_OFF: int = 0
+STATE_DRIVE: int = 1
+STATE_BREAK: int = 2
+STATE_NAMES: Tuple[str, ...] = ("off", "drive", "break")
+
+# Направления движения по кольцевому маршруту
+DIRECTION_CW: int = 0
+DIRECTION_CCW: int = 1
+
+# График 12-часовых водителей 2/2 на неделю
+PATTERN_12H: Tuple[int, ...] = (1, 1, 0, 0, 1, 1, 0)
+
+# Вероятности операторов скрещивания и мутации
+SWAP_ACTIVE_PROB: float = 0.1
+FLIP_ACTIVE_PROB: float = 0.02
+CHANGE_BUS_PROB: float = 0.01
+FRAGMENT_SHIFT_PROB: float = 0.05
+FRAGMENT_MIN_LENGTH: int = 60
+FRAGMENT_MAX_LENGTH: int = 240
+FRAGMENT_MAX_SHIFT: int = 120
+
+# Точечная мутация: с вероятностью POINT_THRESHOLD[old] состояние old меняется на POINT_LOW[old], иначе на POINT_HIGH[old]
+POINT_THRESHOLD: np.ndarray = np.array([0.6, 0.3, 0.5])
+POINT_LOW: np.ndarray = np.array([STATE_DRIVE, STATE_OFF, STATE_OFF], dtype=np.uint8)
+POINT_HIGH: np.ndarray = np.array([STATE_BREAK, STATE_BREAK, STATE_DRIVE], dtype=np.uint8)
+
+# Количество частей популяции на один процесс при параллельной оценке
+CHUNKS_PER_WORKER: int = 2
+
+# Общая память, к которой подключился процесс пула, по имени блока
+_ATTACHED: Dict[str, SharedMemory] = {}
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    """
+    Возвращает представление массива только для чтения без копирования данных.
+
+    Args:
+        array (np.ndarray): Массив.
+
+    Returns:
+        np.ndarray: Представление массива, запись в которое вызывает ValueError.
+    """
+    view: np.ndarray = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class DriverType:
+    """
+    Типы водителей по продолжительности смены.
+
+    Attributes:
+        H8 (str): Водитель с 8-часовой сменой; вождение ночью и в выходные штрафуется (NIGHT_OR_WEEKEND).
+        H12 (str): Водитель с 12-часовой сменой по графику 2/2 (PATTERN_12H).
+    """
+    H8 = "8h"
+    H12 = "12h"
+
+
+def required_drivers(minute: int) -> int:
+    """
+    Возвращает требуемое количество водителей на линии в заданную минуту недели.
+
+    Args:
+        minute (int): Минута от начала недели.
+
+    Returns:
+        int: Требуемое количество водителей.
+    """
+    hour: int = (minute % MINUTES_PER_DAY) // MINUTES_PER_HOUR
+    if PEAK_HOURS_MORNING_START <= hour < PEAK_HOURS_MORNING_END or PEAK_HOURS_EVENING_START <= hour < PEAK_HOURS_EVENING_END:
+        return GA_REQUIRED_PEAK
+    if hour >= GA_NIGHT_START_HOUR or hour < GA_NIGHT_END_HOUR:
+        return GA_REQUIRED_NIGHT
+    return GA_REQUIRED_REGULAR
+
+
+def is_weekend(day: int) -> bool:
+    """
+    Проверяет, является ли день недели выходным.
+
+    Args:
+        day (int): Номер дня недели, начиная с 0 (понедельник).
+
+    Returns:
+        bool: True для субботы и воскресенья.
+    """
+    return day >= 5
+
+
+def is_night(min_in_day: int) -> bool:
+    """
+    Проверяет, приходится ли минута суток на ночное время.
+
+    Ночь длится с GA_NIGHT_START_HOUR до GA_NIGHT_END_HOUR и переходит через полночь.
+
+    Args:
+        min_in_day (int): Минута от начала суток.
+
+    Returns:
+        bool: True, если минута относится к ночному времени.
+    """
+    return min_in_day >= GA_NIGHT_START_HOUR * MINUTES_PER_HOUR or min_in_day < GA_NIGHT_END_HOUR * MINUTES_PER_HOUR
+
+
+# Требуемое количество водителей и запрет работы 8-часовых водителей по минутам недели
+REQUIRED_DRIVERS: np.ndarray = np.array([required_drivers(m) for m in range(MINUTES_PER_WEEK)], dtype=np.int64)
+NIGHT_OR_WEEKEND: np.ndarray = np.array(
+    [is_weekend(m // MINUTES_PER_DAY) or is_night(m % MINUTES_PER_DAY) for m in range(MINUTES_PER_WEEK)]
+)
+
+
+class DriverChromosome:
+    """
+    Расписание одного водителя на неделю.
+
+    Attributes:
+        active (bool): Участвует ли водитель в расписании.
+        driver_type (str): Тип водителя (DriverType.H8 или DriverType.H12).
+        bus_id (int): Номер закреплённого автобуса.
+        schedule (np.ndarray): Состояние водителя по минутам недели (STATE_*), uint8.
+        directions (np.ndarray): Направление движения по минутам недели (DIRECTION_*), uint8.
+    """
+
+    def __init__(
+            self,
+            driver_type: str,
+            bus_id: int,
+            schedule: Optional[np.ndarray] = None,
+            directions: Optional[np.ndarray] = None,
+            active: bool = True
+    ) -> None:
+        """
+        Инициализирует расписание водителя; по умолчанию водитель всю неделю не работает.
+
+        Args:
+            driver_type (str): Тип водителя.
+            bus_id (int): Номер закреплённого автобуса.
+            schedule (Optional[np.ndarray], optional): Состояния по минутам недели.
+            directions (Optional[np.ndarray], optional): Направления по минутам недели.
+            active (bool, optional): Участвует ли водитель в расписании. По умолчанию True.
+        """
+        self.active: bool = active
+        self.driver_type: str = driver_type
+        self.bus_id: int = bus_id
+        self.schedule: np.ndarray = np.zeros(MINUTES_PER_WEEK, dtype=np.uint8) if schedule is None else schedule
+        self.directions: np.ndarray = np.zeros(MINUTES_PER_WEEK, dtype=np.uint8) if directions is None else directions
+
+
+class Individual:
+    """
+    Особь генетического алгоритма: расписания всех потенциальных водителей в виде матриц.
+
+    Строка матрицы соответствует водителю, столбец - минуте недели.
+    Матрицы копии особи общие с исходной особью и доступны только для чтения,
+    пока одна из особей не начнёт изменяться (копирование при записи).
+
+    Attributes:
+        states (np.ndarray): Состояния водителей (STATE_*), uint8, форма (водители, минуты).
+        directions (np.ndarray): Направления движения (DIRECTION_*), uint8, форма (водители, минуты).
+        bus_ids (np.ndarray): Номера закреплённых автобусов.
+        active (np.ndarray): Признаки участия водителей в расписании.
+        twelve_hour (np.ndarray): Признаки 12-часовых водителей.
+        cache (Optional[FitnessCache]): Накопленные показатели штрафа; если заданы,
+            операторы мутации обновляют их по изменённым минутам.
+    """
+
+    def __init__(
+            self,
+            states: np.ndarray,
+            directions: np.ndarray,
+            bus_ids: np.ndarray,
+            active: np.ndarray,
+            twelve_hour: np.ndarray
+    ) -> None:
+        """
+        Инициализирует особь готовыми массивами без копирования.
+
+        Args:
+            states (np.ndarray): Состояния водителей.
+            directions (np.ndarray): Направления движения.
+            bus_ids (np.ndarray): Номера закреплённых автобусов.
+            active (np.ndarray): Признаки участия водителей в расписании.
+            twelve_hour (np.ndarray): Признаки 12-часовых водителей.
+        """
+        self.states: np.ndarray = states
+        self.directions: np.ndarray = directions
+        self.bus_ids: np.ndarray = bus_ids
+        self.active: np.ndarray = active
+        self.twelve_hour: np.ndarray = twelve_hour
+        self.cache: Optional['FitnessCache'] = None
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    @classmethod
+    def from_drivers(cls, drivers: List['DriverChromosome']) -> 'Individual':
+        """
+        Собирает особь из расписаний отдельных водителей.
+
+        Args:
+            drivers (List[DriverChromosome]): Расписания водителей.
+
+        Returns:
+            Individual: Особь.
+        """
+        return cls(
+            np.array([driver.schedule for driver in drivers], dtype=np.uint8).reshape(-1, MINUTES_PER_WEEK),
+            np.array([driver.directions for driver in drivers], dtype=np.uint8).reshape(-1, MINUTES_PER_WEEK),
+            np.array([driver.bus_id for driver in drivers], dtype=np.int64),
+            np.array([driver.active for driver in drivers], dtype=bool),
+            np.array([driver.driver_type == DriverType.H12 for driver in drivers], dtype=bool)
+        )
+
+    def drivers(self) -> List['DriverChromosome']:
+        """
+        Возвращает расписания отдельных водителей; строки матриц не копируются.
+
+        Returns:
+            List[DriverChromosome]: Расписания водителей.
+        """
+        return [
+            DriverChromosome(
+                DriverType.H12 if twelve_hour else DriverType.H8,
+                int(bus_id),
+                self.states[i],
+                self.directions[i],
+                bool(active)
+            )
+            for i, (bus_id, active, twelve_hour) in enumerate(zip(self.bus_ids, self.active, self.twelve_hour))
+        ]
+
+    def copy(self) -> 'Individual':
+        """
+        Возвращает копию особи без копирования матриц.
+
+        Матрицы становятся общими и доступными только для чтения у обеих особей;
+        make_writable копирует их перед изменением, поэтому изменения копии не затрагивают исходную особь.
+
+        Returns:
+            Individual: Копия особи.
+        """
+        self.states = read_only(self.states)
+        self.directions = read_only(self.directions)
+        individual: Individual = Individual(
+            self.states, self.directions, self.bus_ids.copy(), self.active.copy(), self.twelve_hour.copy()
+        )
+        if self.cache is not None:
+            individual.cache = self.cache.copy()
+        return individual
+
+    def make_writable(self) -> None:
+        """
+        Копирует общие с другими особями матрицы перед изменением особи на месте.
+        """
+        if not self.states.flags.writeable:
+            self.states = self.states.copy()
+        if not self.directions.flags.writeable:
+            self.directions = self.directions.copy()
+
+
+def fill_directions(states: np.ndarray, initial: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Назначает направления движения: в начале каждого отрезка работы выбирается случайное направление,
+    в остальные минуты сохраняется предыдущее.
+
+    Args:
+        states (np.ndarray): Состояния водителей, форма (водители, минуты).
+        initial (np.ndarray): Направления до первого отрезка работы каждого водителя.
+        rng (np.random.Generator): Генератор случайных чисел.
+
+    Returns:
+        np.ndarray: Направления движения, uint8, той же формы, что и states.
+    """
+    n: int = len(states)
+    drive: np.ndarray = states == STATE_DRIVE
+    starts: np.ndarray = drive.copy()
+    starts[:, 1:] &= ~drive[:, :-1]
+    # Номер отрезка работы в строке для каждой минуты; 0 - до первого отрезка
+    runs: np.ndarray = np.cumsum(starts, axis=1, dtype=np.int32)
+    counts: np.ndarray = runs[:, -1]
+
+    # Таблица направлений: для каждого водителя начальное направление, затем по одному на отрезок работы
+    offsets: np.ndarray = (np.arange(n) + np.cumsum(counts) - counts).astype(np.int32)
+    table: np.ndarray = np.empty(n + int(counts.sum()), dtype=np.uint8)
+    drawn: np.ndarray = np.ones(len(table), dtype=bool)
+    drawn[offsets] = False
+    table[offsets] = initial
+    table[drawn] = rng.integers(0, 2, size=len(table) - n, dtype=np.uint8)
+    runs += offsets[:, None]
+    return table[runs]
+
+
+def create_8h_schedule(rng: np.random.Generator) -> np.ndarray:
+    """
+    Создаёт расписание 8-часового водителя: в каждый будний день один непрерывный блок
+    из 8 часов работы и часа перерыва, начинающийся не раньше 6:00 и заканчивающийся не позже 22:00.
+
+    Args:
+        rng (np.random.Generator): Генератор случайных чисел.
+
+    Returns:
+        np.ndarray: Состояния по минутам недели.
+    """
+    schedule: np.ndarray = np.zeros(MINUTES_PER_WEEK, dtype=np.uint8)
+    for day in range(5):
+        day_start: int = day * MINUTES_PER_DAY
+        earliest: int = day_start + GA_NIGHT_END_HOUR * MINUTES_PER_HOUR
+        latest: int = day_start + GA_NIGHT_START_HOUR * MINUTES_PER_HOUR - SHIFT_DURATION_8H - MINUTES_PER_HOUR
+        start: int = int(rng.integers(earliest, latest + 1))
+        schedule[start:start + SHIFT_DURATION_8H] = STATE_DRIVE
+        schedule[start + SHIFT_DURATION_8H:start + SHIFT_DURATION_8H + MINUTES_PER_HOUR] = STATE_BREAK
+    return schedule
+
+
+def create_12h_schedule(rng: np.random.Generator) -> np.ndarray:
+    """
+    Создаёт расписание 12-часового водителя по графику 2/2: в рабочий день один блок из 12 часов,
+    внутри которого 60 случайных минут перерыва.
+
+    Args:
+        rng (np.random.Generator): Генератор случайных чисел.
+
+    Returns:
+        np.ndarray: Состояния по минутам недели.
+    """
+    schedule: np.ndarray = np.zeros(MINUTES_PER_WEEK, dtype=np.uint8)
+    for day, works in enumerate(PATTERN_12H):
+        if not works:
+            continue
+        start: int = day * MINUTES_PER_DAY + int(rng.integers(0, MINUTES_PER_DAY - SHIFT_DURATION_12H + 1))
+        block: np.ndarray = schedule[start:start + SHIFT_DURATION_12H]
+        block[:] = STATE_DRIVE
+        block[rng.choice(SHIFT_DURATION_12H, GA_MIN_BREAK_12H, replace=False)] = STATE_BREAK
+    return schedule
+
+
+def create_random_driver(driver_type: str, bus_id: int, rng: np.random.Generator) -> DriverChromosome:
+    """
+    Создаёт водителя со случайным расписанием его типа.
+
+    Args:
+        driver_type (str): Тип водителя.
+        bus_id (int): Номер закреплённого автобуса.
+        rng (np.random.Generator): Генератор случайных чисел.
+
+    Returns:
+        DriverChromosome: Расписание водителя.
+    """
+    schedule: np.ndarray = create_8h_schedule(rng) if driver_type == DriverType.H8 else create_12h_schedule(rng)
+    directions: np.ndarray = fill_directions(schedule[None, :], rng.integers(0, 2, size=1), rng)[0]
+    return DriverChromosome(driver_type, bus_id, schedule, directions)
+
+
+def random_individual(n_max_drivers: int, rng: np.random.Generator) -> Individual:
+    """
+    Создаёт особь из случайных водителей: половина 8-часовых, половина 12-часовых в среднем,
+    автобусы назначаются случайно.
+
+    Args:
+        n_max_drivers (int): Количество потенциальных водителей.
+        rng (np.random.Generator): Генератор случайных чисел.
+
+    Returns:
+        Individual: Особь.
+    """
+    drivers: List[DriverChromosome] = []
+    for _ in range(n_max_drivers):
+        driver_type: str = DriverType.H8 if rng.random() < 0.5 else DriverType.H12
+        drivers.append(create_random_driver(driver_type, int(rng.integers(0, GA_NUM_BUSES)), rng))
+    return Individual.from_drivers(drivers)
+
+
+def compute_positions(states: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет остановку каждого водителя в каждую минуту.
+
+    Каждый отрезок работы начинается в депо (остановка 0); после каждых GA_SEGMENT_DURATION минут работы
+    автобус переходит на соседнюю остановку в направлении, заданном в последнюю минуту перегона.
+    Вне работы водитель находится в депо.
+
+    Args:
+        states (np.ndarray): Состояния водителей, форма (водители, минуты).
+        directions (np.ndarray): Направления движения той же формы.
+
+    Returns:
+        np.ndarray: Номера остановок той же формы.
+    """
+    drive: np.ndarray = states == STATE_DRIVE
+    starts: np.ndarray = drive.copy()
+    starts[:, 1:] &= ~drive[:, :-1]
+    minutes: np.ndarray = np.arange(states.shape[1], dtype=np.int32)
+    run_start: np.ndarray = np.maximum.accumulate(np.where(starts, minutes, 0), axis=1)
+
+    # Переход на соседнюю остановку в последнюю минуту каждого перегона
+    moves: np.ndarray = drive & ((minutes - run_start) % GA_SEGMENT_DURATION == GA_SEGMENT_DURATION - 1)
+    steps: np.ndarray = np.where(moves, 1 - 2 * directions.astype(np.int32), 0)
+    # Смещение к началу минуты: сумма переходов до неё с начала отрезка работы
+    before: np.ndarray = np.cumsum(steps, axis=1) - steps
+    offset: np.ndarray = before - np.take_along_axis(before, run_start, axis=1)
+    return np.where(drive, np.mod(offset, GA_STOPS_COUNT), 0)
+
+
+def bus_usage(drive: np.ndarray, bus_ids: np.ndarray, n_of_buses: int) -> np.ndarray:
+    """
+    Считает количество работающих водителей на каждом автобусе в каждую минуту.
+
+    Args:
+        drive (np.ndarray): Признаки работы водителей, форма (водители, минуты).
+        bus_ids (np.ndarray): Номера автобусов водителей.
+        n_of_buses (int): Количество автобусов; номера должны быть меньше него.
+
+    Returns:
+        np.ndarray: Количество водителей, форма (автобусы, минуты).
+    """
+    usage: np.ndarray = np.zeros((n_of_buses, drive.shape[1]), dtype=np.int32)
+    for bus_id in np.unique(bus_ids).tolist():
+        usage[bus_id] = drive[bus_ids == bus_id].sum(axis=0)
+    return usage
+
+
+def evaluate_individual(individual: Individual) -> float:
+    """
+    Вычисляет штраф расписания; чем меньше штраф, тем лучше расписание.
+
+    Штраф складывается из стоимости активных водителей, нехватки водителей на линии,
+    совместного использования автобуса, невозможных переходов между остановками,
+    переработки, работы 8-часовых водителей ночью и в выходные и недостатка перерыва у 12-часовых водителей.
+
+    Args:
+        individual (Individual): Особь.
+
+    Returns:
+        float: Штраф.
+    """
+    active: np.ndarray = individual.active
+    states: np.ndarray = individual.states[active]
+    n_active: int = len(states)
+    penalty: float = n_active * COST_PER_DRIVER
+    drive: np.ndarray = states == STATE_DRIVE
+
+    # Нехватка водителей на линии
+    shortage: np.ndarray = REQUIRED_DRIVERS - drive.sum(axis=0)
+    penalty += COVERAGE_PENALTY * int(shortage[shortage > 0].sum())
+    if n_active == 0:
+        return penalty
+
+    # Несколько водителей на одном автобусе в одну минуту
+    bus_ids: np.ndarray = individual.bus_ids[active]
+    usage: np.ndarray = bus_usage(drive, bus_ids, int(bus_ids.max()) + 1)
+    penalty += CONFLICT_PENALTY * int(np.maximum(usage - 1, 0).sum())
+
+    # Переходы между остановками, невозможные за одну минуту
+    positions: np.ndarray = compute_positions(states, individual.directions[active])
+    jumps: np.ndarray = np.abs(np.diff(positions, axis=1))
+    teleports: np.ndarray = drive[:, 1:] & drive[:, :-1] & (jumps != 0) & (jumps != 1) & (jumps != GA_STOPS_COUNT - 1)
+    penalty += TELEPORT_PENALTY * int(teleports.sum())
+
+    # Ограничения по дням недели
+    daily_drive: np.ndarray = drive.reshape(n_active, DAYS_IN_WEEK, MINUTES_PER_DAY).sum(axis=2)
+    daily_break: np.ndarray = (states == STATE_BREAK).reshape(n_active, DAYS_IN_WEEK, MINUTES_PER_DAY).sum(axis=2)
+    twelve_hour: np.ndarray = individual.twelve_hour[active]
+    eight_hour: np.ndarray = ~twelve_hour
+
+    overtime_8h: np.ndarray = np.maximum(daily_drive[eight_hour] - SHIFT_DURATION_8H, 0)
+    penalty += OVERTIME_8H_PENALTY * int(overtime_8h.sum())
+    penalty += NIGHT_WEEKEND_PENALTY * int((drive[eight_hour] & NIGHT_OR_WEEKEND).sum())
+
+    overtime_12h: np.ndarray = np.maximum(daily_drive[twelve_hour] - SHIFT_DURATION_12H, 0)
+    penalty += OVERTIME_12H_PENALTY * int(overtime_12h.sum())
+    missing_break: np.ndarray = np.where(
+        daily_drive[twelve_hour] > 0, np.maximum(GA_MIN_BREAK_12H - daily_break[twelve_hour], 0), 0
+    )
+    penalty += int(missing_break.sum())
+    return penalty
+
+
+class FitnessCache:
+    """
+    Накопленные показатели штрафа особи для пересчёта по изменённым минутам.
+
+    Хранятся количество работающих водителей по минутам, количество водителей на каждом автобусе
+    по минутам, минуты работы и перерыва каждого водителя по дням и минуты работы ночью и в выходные.
+    При изменении состояний нескольких минут, участия водителя или его автобуса обновляются
+    только затронутые значения, и штраф получается без полного пересчёта.
+
+    Штраф за невозможные переходы между остановками в накопленных показателях не учитывается:
+    внутри отрезка работы остановка за минуту меняется не больше чем на одну, поэтому он всегда равен нулю.
+    Полный пересчёт evaluate_individual остаётся эталоном для проверки.
+
+    Attributes:
+        active (np.ndarray): Признаки участия водителей, учтённые в показателях.
+        coverage (np.ndarray): Количество работающих активных водителей по минутам.
+        usage (np.ndarray): Количество работающих активных водителей на каждом автобусе по минутам.
+        daily_drive (np.ndarray): Минуты работы каждого водителя по дням.
+        daily_break (np.ndarray): Минуты перерыва каждого водителя по дням.
+        night_drive (np.ndarray): Минуты работы каждого водителя ночью и в выходные.
+        driver_penalty (np.ndarray): Штраф каждого водителя за нарушение ограничений по дням.
+        shortage (int): Суммарная нехватка водителей на линии.
+        conflicts (int): Суммарное количество лишних водителей на автобусах.
+    """
+
+    def __init__(self, individual: Individual) -> None:
+        """
+        Рассчитывает показатели по матрицам особи.
+
+        Args:
+            individual (Individual): Особь.
+        """
+        states: np.ndarray = individual.states
+        n: int = len(states)
+        drive: np.ndarray = states == STATE_DRIVE
+        self.active: np.ndarray = individual.active.copy()
+        self.daily_drive: np.ndarray = drive.reshape(n, DAYS_IN_WEEK, MINUTES_PER_DAY).sum(axis=2)
+        self.daily_break: np.ndarray = (states == STATE_BREAK).reshape(n, DAYS_IN_WEEK, MINUTES_PER_DAY).sum(axis=2)
+        self.night_drive: np.ndarray = (drive & NIGHT_OR_WEEKEND).sum(axis=1)
+        self.twelve_hour: np.ndarray = individual.twelve_hour.copy()
+        self.driver_penalty: np.ndarray = np.zeros(n)
+        self._update_penalties(np.arange(n))
+
+        active_drive: np.ndarray = drive[self.active]
+        self.coverage: np.ndarray = active_drive.sum(axis=0, dtype=np.int32)
+        self.shortage: int = int(np.maximum(REQUIRED_DRIVERS - self.coverage, 0).sum())
+        self.usage: np.ndarray = bus_usage(
+            active_drive, individual.bus_ids[self.active], max(GA_NUM_BUSES, int(individual.bus_ids.max(initial=-1)) + 1)
+        ).ravel()
+        self.conflicts: int = int(np.maximum(self.usage - 1, 0).sum())
+
+    def copy(self) -> 'FitnessCache':
+        """
+        Возвращает копию показателей без копирования массивов: массивы становятся общими и доступными
+        только для чтения, а первое изменение любой из копий копирует их (см. Individual.copy).
+
+        Returns:
+            FitnessCache: Копия показателей.
+        """
+        cache: FitnessCache = FitnessCache.__new__(FitnessCache)
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray):
+                value = read_only(value)
+                setattr(self, name, value)
+            setattr(cache, name, value)
+        return cache
+
+    def _make_writable(self) -> None:
+        """
+        Копирует общие с другими копиями массивы перед изменением показателей.
+        """
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray) and not value.flags.writeable:
+                setattr(self, name, value.copy())
+
+    def fitness(self) -> float:
+        """
+        Возвращает штраф особи; совпадает с evaluate_individual.
+
+        Returns:
+            float: Штраф.
+        """
+        penalty: float = int(self.active.sum()) * COST_PER_DRIVER
+        penalty += COVERAGE_PENALTY * self.shortage
+        penalty += CONFLICT_PENALTY * self.conflicts
+        return penalty + float(self.driver_penalty[self.active].sum())
+
+    def _update_penalties(self, rows: np.ndarray) -> None:
+        """
+        Пересчитывает штрафы водителей за нарушение ограничений по дням.
+
+        Args:
+            rows (np.ndarray): Индексы водителей.
+        """
+        daily_drive: np.ndarray = self.daily_drive[rows]
+        overtime_8h: np.ndarray = np.maximum(daily_drive - SHIFT_DURATION_8H, 0).sum(axis=1)
+        penalty_8h: np.ndarray = OVERTIME_8H_PENALTY * overtime_8h + NIGHT_WEEKEND_PENALTY * self.night_drive[rows]
+        overtime_12h: np.ndarray = np.maximum(daily_drive - SHIFT_DURATION_12H, 0).sum(axis=1)
+        missing_break: np.ndarray = np.where(
+            daily_drive > 0, np.maximum(GA_MIN_BREAK_12H - self.daily_break[rows], 0), 0
+        ).sum(axis=1)
+        penalty_12h: np.ndarray = OVERTIME_12H_PENALTY * overtime_12h + missing_break
+        self.driver_penalty[rows] = np.where(self.twelve_hour[rows], penalty_12h, penalty_8h)
+
+    def _add_drive(self, minutes: np.ndarray, bus_ids: np.ndarray, diff: np.ndarray) -> None:
+        """
+        Изменяет количество работающих водителей по минутам и по автобусам.
+
+        Args:
+            minutes (np.ndarray): Минуты; могут повторяться.
+            bus_ids (np.ndarray): Автобусы водителей в эти минуты.
+            diff (np.ndarray): Изменение количества работающих водителей (+1 или -1).
+        """
+        if len(minutes) == 0:
+            return
+        touched, inverse = np.unique(minutes, return_inverse=True)
+        before: int = int(np.maximum(REQUIRED_DRIVERS[touched] - self.coverage[touched], 0).sum())
+        self.coverage[touched] += np.bincount(inverse, weights=diff).astype(self.coverage.dtype)
+        self.shortage += int(np.maximum(REQUIRED_DRIVERS[touched] - self.coverage[touched], 0).sum()) - before
+
+        touched, inverse = np.unique(bus_ids * MINUTES_PER_WEEK + minutes, return_inverse=True)
+        before = int(np.maximum(self.usage[touched] - 1, 0).sum())
+        self.usage[touched] += np.bincount(inverse, weights=diff).astype(self.usage.dtype)
+        self.conflicts += int(np.maximum(self.usage[touched] - 1, 0).sum()) - before
+
+    def remove_rows(self, individual: Individual, rows: np.ndarray) -> None:
+        """
+        Исключает водителей из показателей покрытия и автобусов; вызывается до изменения их участия или автобуса.
+
+        Args:
+            individual (Individual): Особь.
+            rows (np.ndarray): Индексы активных водителей.
+        """
+        self._make_writable()
+        for i in rows.tolist():
+            minutes: np.ndarray = np.flatnonzero(individual.states[i] == STATE_DRIVE)
+            self._add_drive(minutes, np.full(len(minutes), individual.bus_ids[i]), np.full(len(minutes), -1))
+            self.active[i] = False
+
+    def add_rows(self, individual: Individual, rows: np.ndarray) -> None:
+        """
+        Включает водителей в показатели покрытия и автобусов; вызывается после изменения их участия или автобуса.
+
+        Args:
+            individual (Individual): Особь.
+            rows (np.ndarray): Индексы активных водителей.
+        """
+        self._make_writable()
+        for i in rows.tolist():
+            minutes: np.ndarray = np.flatnonzero(individual.states[i] == STATE_DRIVE)
+            self._add_drive(minutes, np.full(len(minutes), individual.bus_ids[i]), np.ones(len(minutes)))
+            self.active[i] = True
+
+    def update_cells(
+            self,
+            individual: Individual,
+            rows: np.ndarray,
+            minutes: np.ndarray,
+            old: np.ndarray,
+            new: np.ndarray
+    ) -> None:
+        """
+        Учитывает изменение состояний отдельных минут; каждая пара (водитель, минута) встречается один раз.
+
+        Args:
+            individual (Individual): Особь.
+            rows (np.ndarray): Индексы водителей.
+            minutes (np.ndarray): Минуты.
+            old (np.ndarray): Состояния до изменения.
+            new (np.ndarray): Состояния после изменения.
+        """
+        if len(rows) == 0:
+            return
+        self._make_writable()
+        n: int = len(self.active)
+        drive_diff: np.ndarray = (new == STATE_DRIVE).astype(np.int64) - (old == STATE_DRIVE)
+        break_diff: np.ndarray = (new == STATE_BREAK).astype(np.int64) - (old == STATE_BREAK)
+        days: np.ndarray = rows * DAYS_IN_WEEK + minutes // MINUTES_PER_DAY
+        self.daily_drive += np.bincount(days, weights=drive_diff, minlength=n * DAYS_IN_WEEK).astype(
+            self.daily_drive.dtype).reshape(n, DAYS_IN_WEEK)
+        self.daily_break += np.bincount(days, weights=break_diff, minlength=n * DAYS_IN_WEEK).astype(
+            self.daily_break.dtype).reshape(n, DAYS_IN_WEEK)
+        self.night_drive += np.bincount(
+            rows, weights=drive_diff * NIGHT_OR_WEEKEND[minutes], minlength=n
+        ).astype(self.night_drive.dtype)
+        self._update_penalties(np.unique(rows))
+
+        counted: np.ndarray = self.active[rows] & (drive_diff != 0)
+        self._add_drive(minutes[counted], individual.bus_ids[rows[counted]], drive_diff[counted])
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Подключает процесс пула к блоку общей памяти; блоки прошлых поколений отключаются.
+
+    Args:
+        name (str): Имя блока общей памяти.
+
+    Returns:
+        SharedMemory: Подключённый блок.
+    """
+    if name not in _ATTACHED:
+        for memory in _ATTACHED.values():
+            memory.close()
+        _ATTACHED.clear()
+        _ATTACHED[name] = SharedMemory(name=name)
+    return _ATTACHED[name]
+
+
+def _evaluate_chunk(
+        name: str,
+        total_rows: int,
+        offsets: np.ndarray,
+        bus_ids: np.ndarray,
+        active: np.ndarray,
+        twelve_hour: np.ndarray
+) -> List[float]:
+    """
+    Оценивает часть популяции, матрицы которой лежат в общей памяти.
+
+    Args:
+        name (str): Имя блока общей памяти с матрицами состояний и направлений всей популяции.
+        total_rows (int): Общее количество строк матриц в блоке.
+        offsets (np.ndarray): Границы строк особей части в блоке; особь k занимает строки offsets[k]:offsets[k + 1].
+        bus_ids (np.ndarray): Номера автобусов водителей части подряд.
+        active (np.ndarray): Признаки участия водителей части подряд.
+        twelve_hour (np.ndarray): Признаки 12-часовых водителей части подряд.
+
+    Returns:
+        List[float]: Штрафы особей части.
+    """
+    memory: SharedMemory = _attach(name)
+    matrices: np.ndarray = np.ndarray((2, total_rows, MINUTES_PER_WEEK), dtype=np.uint8, buffer=memory.buf)
+    base: int = int(offsets[0])
+    fits: List[float] = []
+    for lo, hi in zip(offsets[:-1].tolist(), offsets[1:].tolist()):
+        individual: Individual = Individual(
+            matrices[0, lo:hi], matrices[1, lo:hi], bus_ids[lo - base:hi - base],
+            active[lo - base:hi - base], twelve_hour[lo - base:hi - base]
+        )
+        fits.append(evaluate_individual(individual))
+    return fits
+
+
+class PopulationEvaluator:
+    """
+    Оценка популяции в пуле процессов.
+
+    Матрицы состояний и направлений всех особей копируются в один блок общей памяти,
+    а процессам передаются только имя блока и границы особей, поэтому расписания не сериализуются.
+    Популяция делится на CHUNKS_PER_WORKER частей на процесс, штрафы возвращаются в порядке популяции.
+    Оценка не использует случайные числа, поэтому результат не зависит от количества процессов.
+
+    Attributes:
+        workers (int): Количество процессов; при значении 1 оценка выполняется в текущем процессе.
+    """
+
+    def __init__(self, workers: Optional[int] = 1) -> None:
+        """
+        Создаёт пул процессов.
+
+        Args:
+            workers (Optional[int], optional): Количество процессов. По умолчанию 1 - оценка в текущем процессе;
+                None - по числу ядер.
+        """
+        self.workers: int = workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._memory: Optional[SharedMemory] = None
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self) -> 'PopulationEvaluator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Останавливает пул процессов и освобождает общую память.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def _shared_matrices(self, total_rows: int) -> np.ndarray:
+        """
+        Возвращает матрицы популяции в общей памяти; блок увеличивается, только если популяция не помещается.
+
+        Args:
+            total_rows (int): Общее количество водителей во всех особях.
+
+        Returns:
+            np.ndarray: Массив формы (2, total_rows, MINUTES_PER_WEEK): состояния и направления.
+        """
+        size: int = max(2 * total_rows * MINUTES_PER_WEEK, 1)
+        if self._memory is None or self._memory.size < size:
+            if self._memory is not None:
+                self._memory.close()
+                self._memory.unlink()
+            self._memory = SharedMemory(create=True, size=size)
+        return np.ndarray((2, total_rows, MINUTES_PER_WEEK), dtype=np.uint8, buffer=self._memory.buf)
+
+    def evaluate(self, population: Sequence[Individual]) -> List[float]:
+        """
+        Вычисляет штрафы всех особей популяции.
+
+        Args:
+            population (Sequence[Individual]): Популяция.
+
+        Returns:
+            List[float]: Штрафы в порядке популяции.
+        """
+        if self._executor is None or len(population) <= 1:
+            return [evaluate_individual(individual) for individual in population]
+
+        offsets: np.ndarray = np.cumsum([0] + [len(individual) for individual in population])
+        total_rows: int = int(offsets[-1])
+        matrices: np.ndarray = self._shared_matrices(total_rows)
+        for individual, lo, hi in zip(population, offsets[:-1].tolist(), offsets[1:].tolist()):
+            matrices[0, lo:hi] = individual.states
+            matrices[1, lo:hi] = individual.directions
+        bus_ids: np.ndarray = np.concatenate([individual.bus_ids for individual in population])
+        active: np.ndarray = np.concatenate([individual.active for individual in population])
+        twelve_hour: np.ndarray = np.concatenate([individual.twelve_hour for individual in population])
+
+        n_chunks: int = min(len(population), self.workers * CHUNKS_PER_WORKER)
+        bounds: np.ndarray = np.linspace(0, len(population), n_chunks + 1).astype(int)
+        futures: List[Future] = []
+        for first, last in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            lo, hi = int(offsets[first]), int(offsets[last])
+            futures.append(self._executor.submit(
+                _evaluate_chunk, self._memory.name, total_rows, offsets[first:last + 1],
+                bus_ids[lo:hi], active[lo:hi], twelve_hour[lo:hi]
+            ))
+        return [fit for future in futures for fit in future.result()]
+
+
+def selection(population: List[Individual], fits: List[float]) -> List[Individual]:
+    """
+    Отбирает лучшую половину популяции; при равном штрафе сохраняется исходный порядок.
+
+    Args:
+        population (List[Individual]): Популяция.
+        fits (List[float]): Штрафы особей.
+
+    Returns:
+        List[Individual]: Отобранные особи в порядке возрастания штрафа.
+    """
+    order: np.ndarray = np.argsort(np.asarray(fits), kind="stable")
+    return [population[i] for i in order[:len(population) // 2]]
+
+
+def crossover(
+        parent1: Individual,
+        parent2: Individual,
+        rng: np.random.Generator
+) -> Tuple[Individual, Individual]:
+    """
+    Скрещивает две особи.
+
+    Водители до случайной точки разреза берутся от своего родителя, после - от другого.
+    Затем у каждой пары водителей с вероятностью SWAP_ACTIVE_PROB меняются признаки участия
+    и расписания обмениваются хвостами после случайной минуты.
+    Строки потомков собираются из срезов строк родителей в новые матрицы, поэтому родители не изменяются.
+    Если у первого родителя есть накопленные показатели штрафа, они рассчитываются и для потомков.
+
+    Args:
+        parent1 (Individual): Первый родитель.
+        parent2 (Individual): Второй родитель.
+        rng (np.random.Generator): Генератор случайных чисел.
+
+    Returns:
+        Tuple[Individual, Individual]: Два потомка.
+    """
+    size: int = len(parent1)
+    cut: int = int(rng.integers(1, size)) if size > 1 else size
+    first: np.ndarray = np.arange(size) < cut
+
+    def pick(field: str) -> Tuple[np.ndarray, np.ndarray]:
+        a: np.ndarray = getattr(parent1, field)
+        b: np.ndarray = getattr(parent2, field)
+        mask: np.ndarray = first.reshape((-1,) + (1,) * (a.ndim - 1))
+        return np.where(mask, a, b), np.where(mask, b, a)
+
+    bus_ids1, bus_ids2 = pick("bus_ids")
+    twelve1, twelve2 = pick("twelve_hour")
+    active1, active2 = pick("active")
+    swap: np.ndarray = rng.random(size) < SWAP_ACTIVE_PROB
+    active1[swap], active2[swap] = active2[swap], active1[swap]
+
+    # Одноточечное скрещивание расписаний каждой пары водителей
+    points: np.ndarray = rng.integers(1, MINUTES_PER_WEEK, size=size)
+    states1: np.ndarray = np.empty_like(parent1.states)
+    states2: np.ndarray = np.empty_like(parent1.states)
+    directions1: np.ndarray = np.empty_like(parent1.directions)
+    directions2: np.ndarray = np.empty_like(parent1.directions)
+    for i, point in enumerate(points.tolist()):
+        head, tail = (parent1, parent2) if i < cut else (parent2, parent1)
+        states1[i, :point] = head.states[i, :point]
+        states1[i, point:] = tail.states[i, point:]
+        states2[i, :point] = tail.states[i, :point]
+        states2[i, point:] = head.states[i, point:]
+        directions1[i, :point] = head.directions[i, :point]
+        directions1[i, point:] = tail.directions[i, point:]
+        directions2[i, :point] = tail.directions[i, :point]
+        directions2[i, point:] = head.directions[i, point:]
+    child1: Individual = Individual(states1, directions1, bus_ids1, active1, twelve1)
+    child2: Individual = Individual(states2, directions2, bus_ids2, active2, twelve2)
+    if parent1.cache is not None:
+        child1.cache = FitnessCache(child1)
+        child2.cache = FitnessCache(child2)
+    return child1, child2
+
+
+def repair(individual: Individual, rows: np.ndarray, rng: np.random.Generator) -> None:
+    """
+    Исправляет расписания водителей: убирает работу 8-часовых водителей ночью и в выходные
+    и заново назначает направления движения отрезков работы.
+
+    Args:
+        individual (Individual): Особь, изменяется на месте.
+        rows (np.ndarray): Индексы исправляемых водителей.
+        rng (np.random.Generator): Генератор случайных чисел.
+    """
+    if len(rows) == 0:
+        return
+    states: np.ndarray = individual.states[rows]
+    forbidden: np.ndarray = ~individual.twelve_hour[rows, None] & NIGHT_OR_WEEKEND & (states == STATE_DRIVE)
+    states[forbidden] = STATE_OFF
+    individual.states[rows] = states
+    if individual.cache is not None:
+        row_ids, minutes = np.nonzero(forbidden)
+        individual.cache.update_cells(
+            individual, rows[row_ids], minutes, np.full(len(minutes), STATE_DRIVE), np.full(len(minutes), STATE_OFF)
+        )
+    individual.directions[rows] = fill_directions(states, individual.directions[rows, 0], rng)
+
+
+def shift_fragment(states: np.ndarray, directions: np.ndarray, start: int, length: int, shift: int) -> None:
+    """
+    Переносит фрагмент расписания водителя на shift минут; освободившиеся минуты становятся выходными.
+
+    Минуты фрагмента, которые после переноса оказались бы за пределами недели, не изменяются.
+
+    Args:
+        states (np.ndarray): Состояния водителя по минутам недели, изменяются на месте.
+        directions (np.ndarray): Направления водителя по минутам недели, изменяются на месте.
+        start (int): Первая минута фрагмента.
+        length (int): Длина фрагмента.
+        shift (int): Сдвиг в минутах.
+    """
+    first: int = max(start, -shift)
+    last: int = min(start + length, MINUTES_PER_WEEK - shift)
+    if first >= last:
+        return
+    moved_states: np.ndarray = states[first:last].copy()
+    moved_directions: np.ndarray = directions[first:last].copy()
+    # При сдвиге вперёд минуты, попавшие и в исходный, и в новый фрагмент, остаются выходными
+    if shift < 0:
+        states[first:last] = STATE_OFF
+    states[first + shift:last + shift] = moved_states
+    directions[first + shift:last + shift] = moved_directions
+    if shift >= 0:
+        states[first:last] = STATE_OFF
+
+
+def mutate(individual: Individual, mutation_rate: float, rng: np.random.Generator) -> None:
+    """
+    Мутирует особь на месте.
+
+    Водитель с малой вероятностью выходит из расписания или возвращается в него и меняет автобус.
+    У активных водителей с вероятностью FRAGMENT_SHIFT_PROB переносится фрагмент расписания,
+    а каждая минута с вероятностью mutation_rate меняет состояние. После этого расписания исправляются.
+    Накопленные показатели штрафа особи, если они есть, обновляются только по изменённым минутам.
+
+    Args:
+        individual (Individual): Особь.
+        mutation_rate (float): Вероятность точечной мутации минуты.
+        rng (np.random.Generator): Генератор случайных чисел.
+    """
+    individual.make_writable()
+    size: int = len(individual)
+    cache: Optional[FitnessCache] = individual.cache
+    flips: np.ndarray = rng.random(size) < FLIP_ACTIVE_PROB
+    new_bus: np.ndarray = rng.random(size) < CHANGE_BUS_PROB
+    changed: np.ndarray = flips | new_bus
+    if cache is not None:
+        cache.remove_rows(individual, np.flatnonzero(changed & individual.active))
+    individual.active ^= flips
+    individual.bus_ids[new_bus] = rng.integers(0, GA_NUM_BUSES, size=int(new_bus.sum()))
+    if cache is not None:
+        cache.add_rows(individual, np.flatnonzero(changed & individual.active))
+
+    rows: np.ndarray = np.flatnonzero(individual.active)
+    for i in rows[rng.random(len(rows)) < FRAGMENT_SHIFT_PROB].tolist():
+        length: int = int(rng.integers(FRAGMENT_MIN_LENGTH, FRAGMENT_MAX_LENGTH + 1))
+        start: int = int(rng.integers(0, MINUTES_PER_WEEK - length + 1))
+        shift: int = int(rng.integers(-FRAGMENT_MAX_SHIFT, FRAGMENT_MAX_SHIFT + 1))
+        if cache is None:
+            shift_fragment(individual.states[i], individual.directions[i], start, length, shift)
+            continue
+        # Изменяются только минуты исходного и нового положения фрагмента
+        lo: int = max(start + min(shift, 0), 0)
+        hi: int = min(start + length + max(shift, 0), MINUTES_PER_WEEK)
+        before: np.ndarray = individual.states[i, lo:hi].copy()
+        shift_fragment(individual.states[i], individual.directions[i], start, length, shift)
+        after: np.ndarray = individual.states[i, lo:hi]
+        moved: np.ndarray = np.flatnonzero(before != after)
+        cache.update_cells(individual, np.full(len(moved), i), lo + moved, before[moved], after[moved])
+
+    # Точечные мутации: количество изменённых минут имеет биномиальное распределение,
+    # сами минуты выбираются без повторений, поэтому случайное число на каждую минуту не нужно
+    n_cells: int = len(rows) * MINUTES_PER_WEEK
+    cells: np.ndarray = np.sort(rng.choice(n_cells, size=rng.binomial(n_cells, mutation_rate), replace=False))
+    row_ids: np.ndarray = rows[cells // MINUTES_PER_WEEK]
+    minutes: np.ndarray = cells % MINUTES_PER_WEEK
+    old: np.ndarray = individual.states[row_ids, minutes]
+    new: np.ndarray = np.where(rng.random(len(old)) < POINT_THRESHOLD[old], POINT_LOW[old], POINT_HIGH[old])
+    individual.states[row_ids, minutes] = new
+    if cache is not None:
+        cache.update_cells(individual, row_ids, minutes, old, new)
+    repair(individual, rows, rng)
+
+
+class Island:
+    """
+    Популяция генетического алгоритма, развивающаяся по поколениям.
+
+    Каждое поколение популяция оценивается, лучшая половина отбирается в родители,
+    а новая популяция составляется из лучших особей (elite) и мутировавших потомков.
+    Используется в run_ga и как остров в run_islands.
+
+    Attributes:
+        pop_size (int): Размер популяции.
+        mutation_rate (float): Вероятность точечной мутации минуты.
+        rng (np.random.Generator): Генератор случайных чисел.
+        incremental (bool): Пересчитывать ли штраф по накопленным показателям.
+        elite (int): Количество лучших особей, переходящих в следующее поколение без изменений.
+        population (List[Individual]): Текущая, ещё не оценённая популяция.
+        selected (List[Individual]): Родители последнего поколения в порядке возрастания штрафа.
+        best_individual (Optional[Individual]): Лучшая найденная особь.
+        best_fit (float): Штраф лучшей найденной особи.
+        fit_history (List[float]): Лучший штраф по поколениям.
+    """
+
+    def __init__(
+            self,
+            n_max_drivers: int,
+            pop_size: int,
+            mutation_rate: float,
+            rng: np.random.Generator,
+            incremental: bool = True,
+            elite: int = 0
+    ) -> None:
+        """
+        Создаёт случайную начальную популяцию.
+
+        Args:
+            n_max_drivers (int): Количество потенциальных водителей в особи.
+            pop_size (int): Размер популяции.
+            mutation_rate (float): Вероятность точечной мутации минуты.
+            rng (np.random.Generator): Генератор случайных чисел.
+            incremental (bool, optional): Пересчитывать ли штраф по накопленным показателям. По умолчанию True.
+            elite (int, optional): Количество лучших особей, переходящих в следующее поколение без изменений.
+        """
+        self.pop_size: int = pop_size
+        self.mutation_rate: float = mutation_rate
+        self.rng: np.random.Generator = rng
+        self.incremental: bool = incremental
+        self.elite: int = elite
+        self.population: List[Individual] = [random_individual(n_max_drivers, rng) for _ in range(pop_size)]
+        if incremental:
+            for individual in self.population:
+                individual.cache = FitnessCache(individual)
+        self.selected: List[Individual] = []
+        self.best_individual: Optional[Individual] = None
+        self.best_fit: float = float("inf")
+        self.fit_history: List[float] = []
+
+    def evolve(self, evaluator: PopulationEvaluator) -> float:
+        """
+        Выполняет одно поколение: оценивает популяцию и заменяет её потомками отобранных особей.
+
+        Args:
+            evaluator (PopulationEvaluator): Оценка популяции; используется при incremental=False.
+
+        Returns:
+            float: Лучший найденный штраф.
+        """
+        if self.incremental:
+            fits: List[float] = [individual.cache.fitness() for individual in self.population]
+        else:
+            fits = evaluator.evaluate(self.population)
+        for individual, fit in zip(self.population, fits):
+            if fit < self.best_fit:
+                self.best_fit = fit
+                self.best_individual = individual
+        self.fit_history.append(self.best_fit)
+
+        rng: np.random.Generator = self.rng
+        self.selected = selection(self.population, fits)
+        # Лучшие особи переходят в следующее поколение копиями без копирования матриц
+        new_population: List[Individual] = [individual.copy() for individual in self.selected[:self.elite]]
+        while len(new_population) < self.pop_size:
+            parent1: Individual = self.selected[rng.integers(len(self.selected))]
+            parent2: Individual = self.selected[rng.integers(len(self.selected))]
+            child1, child2 = crossover(parent1, parent2, rng)
+            mutate(child1, self.mutation_rate, rng)
+            mutate(child2, self.mutation_rate, rng)
+            new_population.append(child1)
+            if len(new_population) < self.pop_size:
+                new_population.append(child2)
+        self.population = new_population
+        return self.best_fit
+
+    def emigrants(self, count: int) -> List[Individual]:
+        """
+        Возвращает копии лучших родителей последнего поколения без накопленных показателей.
+
+        Args:
+            count (int): Количество особей.
+
+        Returns:
+            List[Individual]: Копии особей, матрицы которых общие с оригиналами и доступны только для чтения.
+        """
+        migrants: List[Individual] = []
+        for individual in self.selected[:count]:
+            migrant: Individual = individual.copy()
+            migrant.cache = None
+            migrants.append(migrant)
+        return migrants
+
+    def immigrate(self, migrants: List[Individual]) -> None:
+        """
+        Заменяет последних потомков текущей популяции особями с других островов.
+
+        Args:
+            migrants (List[Individual]): Особи с других островов.
+        """
+        migrants = migrants[:self.pop_size - self.elite]
+        for k, migrant in enumerate(migrants, start=self.pop_size - len(migrants)):
+            if self.incremental:
+                migrant.cache = FitnessCache(migrant)
+            self.population[k] = migrant
+
+    def run_epoch(self, generations: int, migrants: List[Individual], n_of_migrants: int) -> Tuple[List[float], List[Individual]]:
+        """
+        Принимает мигрантов, выполняет несколько поколений и отбирает особей для отправки на другие острова.
+
+        Args:
+            generations (int): Количество поколений.
+            migrants (List[Individual]): Особи с других островов.
+            n_of_migrants (int): Количество отправляемых особей.
+
+        Returns:
+            Tuple[List[float], List[Individual]]: Лучший штраф по выполненным поколениям и отправляемые особи.
+        """
+        self.immigrate(migrants)
+        with PopulationEvaluator(1) as evaluator:
+            for _ in range(generations):
+                self.evolve(evaluator)
+        return self.fit_history[-generations:], self.emigrants(n_of_migrants)
+
+
+def run_ga(
+        n_max_drivers: int,
+        pop_size: int,
+        generations: int,
+        mutation_rate: float,
+        seed: Optional[int] = None,
+        verbose: bool = True,
+        workers: Optional[int] = 1,
+        incremental: bool = True,
+        elite: int = 0
+) -> Tuple[Individual, float, List[float]]:
+    """
+    Ищет расписание с минимальным штрафом генетическим алгоритмом.
+
+    Случайные числа используются только в текущем процессе, а особи оцениваются независимо,
+    поэтому при заданном зерне результат не зависит от количества процессов и способа оценки.
+
+    Args:
+        n_max_drivers (int): Количество потенциальных водителей в особи.
+        pop_size (int): Размер популяции.
+        generations (int): Количество поколений.
+        mutation_rate (float): Вероятность точечной мутации минуты.
+        seed (Optional[int], optional): Зерно генератора случайных чисел.
+        verbose (bool, optional): Выводить ли лучший штраф каждого поколения. По умолчанию True.
+        workers (Optional[int], optional): Количество процессов для полной оценки популяции. По умолчанию 1 -
+            оценка в текущем процессе; None - по числу ядер. Используется только при incremental=False.
+        incremental (bool, optional): Пересчитывать ли штраф по накопленным показателям (FitnessCache)
+            только для изменённых минут вместо полной оценки каждой особи. По умолчанию True.
+        elite (int, optional): Количество лучших особей, переходящих в следующее поколение без изменений.
+            По умолчанию 0.
+
+    Returns:
+        Tuple[Individual, float, List[float]]: Лучшая особь, её штраф и лучший штраф по поколениям.
+    """
+    island: Island = Island(n_max_drivers, pop_size, mutation_rate, np.random.default_rng(seed), incremental, elite)
+    with PopulationEvaluator(1 if incremental else workers) as evaluator:
+        for generation in range(generations):
+            best_fit: float = island.evolve(evaluator)
+            if verbose:
+                print(f"Gen {generation + 1} | Best fit: {best_fit:.2f}")
+    return island.best_individual, island.best_fit, island.fit_history
+
+
+@dataclass
+class IslandResult:
+    """
+    Результат островной модели генетического алгоритма.
+
+    Attributes:
+        best_individual (Individual): Лучшая особь среди всех островов.
+        best_fit (float): Штраф лучшей особи.
+        island_histories (List[List[float]]): Лучший штраф каждого острова по поколениям.
+        global_history (List[float]): Лучший штраф среди всех островов по поколениям.
+        generations (int): Количество выполненных поколений (меньше заданного при ранней остановке).
+    """
+
+    best_individual: Individual
+    best_fit: float
+    island_histories: List[List[float]]
+    global_history: List[float]
+    generations: int
+
+
+def _island_process(connection: Connection, island_args: Tuple[Any, ...]) -> None:
+    """
+    Выполняет остров в отдельном процессе по командам из канала.
+
+    Команда (generations, migrants) запускает эпоху, ответ - результат Island.run_epoch.
+    Команда None завершает работу, ответ - лучшая особь острова и её штраф.
+
+    Args:
+        connection (Connection): Канал связи с основным процессом.
+        island_args (Tuple[Any, ...]): Аргументы Island и количество отправляемых особей.
+    """
+    *args, n_of_migrants = island_args
+    island: Island = Island(*args)
+    while True:
+        command: Optional[Tuple[int, List[Individual]]] = connection.recv()
+        if command is None:
+            connection.send((island.best_individual, island.best_fit))
+            connection.close()
+            return
+        generations, migrants = command
+        connection.send(island.run_epoch(generations, migrants, n_of_migrants))
+
+
+def run_islands(
+        n_islands: int,
+        n_max_drivers: int,
+        pop_size: int,
+        generations: int,
+        mutation_rate: float,
+        migration_interval: int = MIGRATION_INTERVAL,
+        n_of_migrants: int = N_OF_MIGRANTS,
+        patience: Optional[int] = None,
+        seed: Optional[int] = None,
+        verbose: bool = True,
+        parallel: bool = True,
+        elite: int = 0
+) -> IslandResult:
+    """
+    Ищет расписание островной моделью генетического алгоритма.
+
+    Острова - независимые популяции, каждая в своём процессе. Каждые migration_interval поколений
+    острова передают n_of_migrants лучших особей следующему острову по кольцу; пришедшие особи
+    заменяют часть потомков. Острова синхронизируются только в моменты миграции, а генератор
+    случайных чисел каждого острова порождается из общего зерна, поэтому при заданном зерне
+    результат не зависит от того, выполняются острова в процессах или в текущем процессе.
+
+    Args:
+        n_islands (int): Количество островов.
+        n_max_drivers (int): Количество потенциальных водителей в особи.
+        pop_size (int): Размер популяции каждого острова.
+        generations (int): Наибольшее количество поколений.
+        mutation_rate (float): Вероятность точечной мутации минуты.
+        migration_interval (int, optional): Количество поколений между миграциями.
+        n_of_migrants (int, optional): Количество особей, передаваемых каждым островом при миграции.
+        patience (Optional[int], optional): Количество поколений без улучшения лучшего штрафа среди всех островов,
+            после которого поиск останавливается; проверяется в моменты миграции. По умолчанию без ранней остановки.
+        seed (Optional[int], optional): Зерно генератора случайных чисел.
+        verbose (bool, optional): Выводить ли лучшие штрафы после каждой миграции. По умолчанию True.
+        parallel (bool, optional): Выполнять ли острова в отдельных процессах. По умолчанию True.
+        elite (int, optional): Количество лучших особей острова, переходящих в следующее поколение без изменений.
+
+    Returns:
+        IslandResult: Лучшая особь, её штраф и истории лучшего штрафа.
+
+    Raises:
+        ValueError: Если количество островов или интервал миграции меньше единицы.
+    """
+    if n_islands < 1:
+        raise ValueError(f"Количество островов должно быть положительным: {n_islands}")
+    if migration_interval < 1:
+        raise ValueError(f"Интервал миграции должен быть положительным: {migration_interval}")
+
+    seeds: List[np.random.SeedSequence] = np.random.SeedSequence(seed).spawn(n_islands)
+    island_args: List[Tuple[Any, ...]] = [
+        (n_max_drivers, pop_size, mutation_rate, np.random.default_rng(island_seed), True, elite, n_of_migrants)
+        for island_seed in seeds
+    ]
+    islands: List[Island] = []
+    connections: List[Connection] = []
+    processes: List[Process] = []
+    if parallel:
+        for args in island_args:
+            connection, child_connection = Pipe()
+            process: Process = Process(target=_island_process, args=(child_connection, args), daemon=True)
+            process.start()
+            child_connection.close()
+            connections.append(connection)
+            processes.append(process)
+    else:
+        islands = [Island(*args[:-1]) for args in island_args]
+
+    island_histories: List[List[float]] = [[] for _ in range(n_islands)]
+    global_history: List[float] = []
+    migrants: List[List[Individual]] = [[] for _ in range(n_islands)]
+    try:
+        while len(global_history) < generations:
+            epoch: int = min(migration_interval, generations - len(global_history))
+            if parallel:
+                for connection, incoming in zip(connections, migrants):
+                    connection.send((epoch, incoming))
+                replies: List[Tuple[List[float], List[Individual]]] = [connection.recv() for connection in connections]
+            else:
+                replies = [
+                    island.run_epoch(epoch, incoming, n_of_migrants) for island, incoming in zip(islands, migrants)
+                ]
+
+            for history, (chunk, _) in zip(island_histories, replies):
+                history.extend(chunk)
+            global_history.extend(np.min([chunk for chunk, _ in replies], axis=0).tolist())
+            # Кольцевая миграция: остров i получает лучших особей острова i - 1
+            migrants = [replies[i - 1][1] for i in range(n_islands)]
+            if verbose:
+                island_bests: str = ", ".join(f"{history[-1]:.2f}" for history in island_histories)
+                print(f"Gen {len(global_history)} | Best fit: {global_history[-1]:.2f} | Islands: {island_bests}")
+
+            if patience is not None and len(global_history) > patience:
+                if global_history[-1] >= global_history[-patience - 1]:
+                    break
+
+        if parallel:
+            for connection in connections:
+                connection.send(None)
+            bests: List[Tuple[Individual, float]] = [connection.recv() for connection in connections]
+        else:
+            bests = [(island.best_individual, island.best_fit) for island in islands]
+    finally:
+        for connection in connections:
+            connection.close()
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+
+    best_individual, best_fit = min(bests, key=lambda best: best[1])
+    return IslandResult(best_individual, best_fit, island_histories, global_history, len(global_history))
+
+
+def build_schedule_table(individual: Individual) -> 'pd.DataFrame':
+    """
+    Строит таблицу расписания: строка на минуту недели, столбец на водителя.
+
+    Args:
+        individual (Individual): Особь.
+
+    Returns:
+        pd.DataFrame: Таблица состояний водителей вида "drive(stop=2)", "break(depot)", "inactive".
+    """
+    import pandas as pd
+
+    minutes: np.ndarray = np.arange(MINUTES_PER_WEEK)
+    index: List[str] = [
+        f"Day{day + 1} {hour:02d}:{minute:02d}"
+        for day, hour, minute in zip(
+            (minutes // MINUTES_PER_DAY).tolist(),
+            (minutes % MINUTES_PER_DAY // MINUTES_PER_HOUR).tolist(),
+            (minutes % MINUTES_PER_HOUR).tolist()
+        )
+    ]
+    columns: List[str] = [
+        f"Drv{i + 1}_{DriverType.H12 if twelve_hour else DriverType.H8}_{'A' if active else 'X'}(bus={bus_id})"
+        for i, (bus_id, active, twelve_hour) in enumerate(
+            zip(individual.bus_ids.tolist(), individual.active.tolist(), individual.twelve_hour.tolist())
+        )
+    ]
+
+    # Код ячейки: остановка при работе, отдельные коды для выходного, перерыва и неактивного водителя
+    texts: np.ndarray = np.array(
+        ["drive(depot)"] + [f"drive(stop={stop})" for stop in range(1, GA_STOPS_COUNT)]
+        + ["off(depot)", "break(depot)", "inactive"],
+        dtype=object
+    )
+    states: np.ndarray = individual.states
+    codes: np.ndarray = np.where(
+        states == STATE_DRIVE,
+        compute_positions(states, individual.directions),
+        np.where(states == STATE_BREAK, GA_STOPS_COUNT + 1, GA_STOPS_COUNT)
+    )
+    codes[~individual.active] = GA_STOPS_COUNT + 2
+    return pd.DataFrame(texts[codes.T], index=index, columns=columns)
+
+
+def print_stats(individual: Individual) -> None:
+    """
+    Выводит количество активных водителей по типам и используемые автобусы.
+
+    Args:
+        individual (Individual): Особь.
+    """
+    active: np.ndarray = individual.active
+    print(f"Всего водителей: {len(individual)}, Активных: {int(active.sum())}")
+    n_12h: int = int((active & individual.twelve_hour).sum())
+    print(f"Среди активных: 8h={int(active.sum()) - n_12h}, 12h={n_12h}")
+    print(f"Используемые автобусы: {set(individual.bus_ids[active].tolist())}")
+
+
+if __name__ == "__main__":
+    best_individual, best_fit, fit_history = run_ga(n_max_drivers=30, pop_size=10, generations=100, mutation_rate=0.01)
+    print(f"Лучший фитнес: {best_fit:.2f}")
+    print_stats(best_individual)
+    print(build_schedule_table(best_individual).head(60))
@@ -1,108 +1,91 @@
 from constants import *
-from datetime import timedelta
-from models import Bus, BusDriver
-from help_functions import get_interval
+from config import SimulationConfig
+from models import BusDriver
+from pools import BusPool, DriverPool
 from typing import List, Optional, Tuple
-import math
 
 
 def get_driver(
-        finished_drivers: List['BusDriver'],
-        drivers: List['BusDriver'],
+        driver_pool: 'DriverPool',
         current_hour: int,
-        current_day: int
+        current_day: int,
+        current_time: int
 ) -> Optional['BusDriver']:
     """
-    Находит подходящего водителя из завершивших смену или из пула доступных водителей.
+    Находит подходящего водителя среди отдохнувших после смены или ещё не выходивших на смену.
+
+    С 5 до 22 часов в будние дни выпускаются 8-часовые водители, в остальное время - 12-часовые.
 
     Args:
-        direction (bool): Направление движения (True - прямое, False - обратное).
-        finished_drivers (List[BusDriver]): Список водителей, завершивших смену.
-        drivers (List[BusDriver]): Пул водителей, готовых к работе.
+        driver_pool (DriverPool): Пул водителей, ожидающих смены.
         current_hour (int): Текущий час (0-23).
         current_day (int): Текущий день недели (0 - понедельник, 6 - воскресенье).
+        current_time (int): Текущее время в минутах.
 
     Returns:
-        Tuple[Optional[BusDriver], List[BusDriver]]: Найденный водитель или None, обновлённый список завершивших водителей.
+        Optional[BusDriver]: Найденный водитель или None.
     """
     allow_8_hour: bool = (5 <= current_hour < 22 and current_day in range(0, 5))
-    for driver in finished_drivers[:]:
-        if allow_8_hour and driver.shift_duration == SHIFT_DURATION_8H:
-            if driver.between_shifts_time <= timedelta(minutes=0):
-                driver.between_shifts_time = timedelta(hours=11)
-                finished_drivers.remove(driver)
-                return driver
-        elif not allow_8_hour and driver.shift_duration == SHIFT_DURATION_12H:
-            if driver.can_work_today and driver.between_shifts_time <= timedelta(minutes=0):
-                driver.between_shifts_time = timedelta(hours=11)
-                finished_drivers.remove(driver)
-                return driver
-    for drv in drivers:
-        if allow_8_hour and drv.shift_duration == SHIFT_DURATION_8H:
-            drivers.remove(drv)
-            return drv
-        elif not allow_8_hour and drv.shift_duration == SHIFT_DURATION_12H:
-            drivers.remove(drv)
-            return drv
-    return None
+    shift_duration: int = SHIFT_DURATION_8H if allow_8_hour else SHIFT_DURATION_12H
+    return driver_pool.acquire(shift_duration, current_time)
 
 
 def check_drivers(
-        current_time: timedelta,
-        finished_drivers: List['BusDriver'],
+        config: SimulationConfig,
+        current_time: int,
+        driver_pool: 'DriverPool',
         active_drivers: List['BusDriver'],
-        drivers: List['BusDriver'],
-        buses: List['Bus'],
-        last_dispatch_time_direct: timedelta,
-        last_dispatch_time_reverse: timedelta
-) -> Tuple[timedelta, timedelta]:
+        bus_pool: 'BusPool',
+        last_dispatch_time_direct: int,
+        last_dispatch_time_reverse: int
+) -> Tuple[int, int]:
     """
     Проверяет и распределяет новых водителей на автобусы в зависимости от текущего времени и состояния водителей.
 
     Эта функция рассчитывает необходимое количество автобусов для текущего времени,
-    находит подходящих водителей из завершивших смену или доступных пулов водителей,
+    находит подходящих водителей в пуле водителей,
     назначает им автобусы и обновляет время последней диспетчеризации.
 
     Args:
-        current_time (timedelta): Текущее время симуляции.
-        finished_drivers (List[BusDriver]): Список водителей, завершивших смену.
+        config (SimulationConfig): Параметры сценария.
+        current_time (int): Текущее время симуляции в минутах.
+        driver_pool (DriverPool): Пул водителей, ожидающих смены.
         active_drivers (List[BusDriver]): Список активных водителей.
-        drivers (List[BusDriver]): Пул водителей.
-        buses (List[Bus]): Список автобусов, движущихся в прямом направлении.
-        last_dispatch_time_direct (timedelta): Время последней диспетчеризации для прямого направления.
-        last_dispatch_time_reverse (timedelta): Время последней диспетчеризации для обратного направления.
+        bus_pool (BusPool): Пул свободных автобусов.
+        last_dispatch_time_direct (int): Время последней диспетчеризации для прямого направления.
+        last_dispatch_time_reverse (int): Время последней диспетчеризации для обратного направления.
 
     Returns:
-        Tuple[timedelta, timedelta]: Обновлённые времена последней диспетчеризации для прямого и обратного направлений.
+        Tuple[int, int]: Обновлённые времена последней диспетчеризации для прямого и обратного направлений.
     """
-    total_minutes: float = current_time.total_seconds() // MINUTES_PER_HOUR
-    current_hour: int = int(total_minutes // MINUTES_PER_HOUR) % HOUR_IN_DAY
-    dispatch_interval: timedelta = get_interval(current_time, N_OF_BUS, FLOAT_ROAD_TIME)
-
-    interval_minutes: float = dispatch_interval.total_seconds() // MINUTES_PER_HOUR
-    required_buses: int = math.ceil(FLOAT_ROAD_TIME / interval_minutes)
+    current_hour: int = (current_time // MINUTES_PER_HOUR) % HOUR_IN_DAY
+    dispatch_interval, required_buses = config.dispatch_plan(current_time)
 
-    current_day: int = current_time.days % 7
+    current_day: int = (current_time // MINUTES_PER_DAY) % DAYS_IN_WEEK
 
     needed_buses: int = required_buses - len(active_drivers) // 2
 
     for _ in range(needed_buses):
-        if last_dispatch_time_direct + dispatch_interval <= current_time or last_dispatch_time_direct == timedelta(
-                hours=0):
+        if last_dispatch_time_direct + dispatch_interval <= current_time or last_dispatch_time_direct == 0:
             last_dispatch_time_direct = current_time
-            driver = get_driver(finished_drivers, drivers, current_hour, current_day)
+            driver = get_driver(driver_pool, current_hour, current_day, current_time)
             if driver:
-                if driver.bus_for_driver(buses):
-                    driver.bus.direct = True
+                # Водитель общего депо работает смену на маршруте, который его выпустил
+                driver.config = config
+                if driver.bus_for_driver(bus_pool, current_time, direct=True):
                     active_drivers.append(driver)
+                else:
+                    # Водитель без автобуса остаётся в пуле и может выйти на линию при следующем выпуске
+                    driver_pool.put_back(driver)
 
-        if last_dispatch_time_reverse + dispatch_interval <= current_time or last_dispatch_time_reverse == timedelta(
-                hours=0):
+        if last_dispatch_time_reverse + dispatch_interval <= current_time or last_dispatch_time_reverse == 0:
             last_dispatch_time_reverse = current_time
-            driver_rev = get_driver(finished_drivers, drivers, current_hour, current_day)
+            driver_rev = get_driver(driver_pool, current_hour, current_day, current_time)
             if driver_rev:
-                if driver_rev.bus_for_driver(buses):
-                    driver_rev.bus.direct = False
+                driver_rev.config = config
+                if driver_rev.bus_for_driver(bus_pool, current_time, direct=False):
                     active_drivers.append(driver_rev)
+                else:
+                    driver_pool.put_back(driver_rev)
 
     return last_dispatch_time_direct, last_dispatch_time_reverse
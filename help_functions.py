@@ -1,48 +1,182 @@
 from constants import *
-from datetime import timedelta
+from functools import lru_cache
+from typing import List, Tuple
+import constants
+import math
+
+MICROSECONDS_IN_MINUTE: int = SECONDS_IN_MINUTE * 1_000_000
+
+# Константы расписания, от которых зависит интервал выпуска. get_interval читает их из модуля constants
+# в момент вызова, поэтому изменённые во время работы значения учитываются сразу
+CALENDAR_CONSTANTS: Tuple[str, ...] = (
+    "WEEKDAYS_START", "WEEKDAYS_END",
+    "PEAK_HOURS_MORNING_START", "PEAK_HOURS_MORNING_END", "PEAK_HOURS_EVENING_START", "PEAK_HOURS_EVENING_END",
+    "REGULAR_HOURS_START", "REGULAR_HOURS_END", "WEEKEND_REGULAR_START_HOUR", "WEEKEND_REGULAR_END_HOUR",
+    "PEAK_MULTIPLIER", "REGULAR_MULTIPLIER", "NIGHT_MULTIPLIER",
+)
+
+
+def round_minutes(minutes: float) -> float:
+    """
+    Округляет дробное количество минут до микросекунд.
+
+    Так интервалы вида 7.5 * 8 / 3 = 19.999999999999996 минут становятся ровно 20 минутами.
+
+    Args:
+        minutes (float): Количество минут.
+
+    Returns:
+        float: Округлённое количество минут.
+    """
+    return round(minutes * MICROSECONDS_IN_MINUTE) / MICROSECONDS_IN_MINUTE
 
 
 def get_interval(
-        current_time: timedelta,
+        current_time: int,
         total_buses: int,
         road_time: float
-) -> timedelta:
+) -> float:
     """
     Рассчитывает интервал выпуска автобусов для равномерного покрытия маршрута.
 
+    Константы расписания (CALENDAR_CONSTANTS) читаются из модуля constants в момент вызова.
+
     Args:
-        current_time (timedelta): Текущее время.
+        current_time (int): Текущее время в минутах.
         total_buses (int): Общее количество автобусов.
         road_time (int): Время полного маршрута в минутах (включая остановки и развороты).
 
     Returns:
-        timedelta: Интервал выпуска автобусов.
+        float: Интервал выпуска автобусов в минутах.
     """
-    current_hour: int = int(current_time.total_seconds() // SECONDS_IN_HOUR) % HOUR_IN_DAY
+    current_hour: int = (current_time // MINUTES_PER_HOUR) % HOUR_IN_DAY
 
     if total_buses > 0:
         base_interval: float = road_time / total_buses
     else:
-        return timedelta(minutes=road_time)
-
-    current_day: int = current_time.days % DAYS_IN_WEEK
-    if WEEKDAYS_START <= current_day <= WEEKDAYS_END:
-        if (PEAK_HOURS_MORNING_START <= current_hour < PEAK_HOURS_MORNING_END) or \
-                (PEAK_HOURS_EVENING_START <= current_hour < PEAK_HOURS_EVENING_END):
-            adjusted_interval: float = base_interval * PEAK_MULTIPLIER
-        elif REGULAR_HOURS_START <= current_hour < REGULAR_HOURS_END:
-            adjusted_interval = base_interval * REGULAR_MULTIPLIER
+        return round_minutes(road_time)
+
+    current_day: int = (current_time // MINUTES_PER_DAY) % DAYS_IN_WEEK
+    if constants.WEEKDAYS_START <= current_day <= constants.WEEKDAYS_END:
+        if (constants.PEAK_HOURS_MORNING_START <= current_hour < constants.PEAK_HOURS_MORNING_END) or \
+                (constants.PEAK_HOURS_EVENING_START <= current_hour < constants.PEAK_HOURS_EVENING_END):
+            adjusted_interval: float = base_interval * constants.PEAK_MULTIPLIER
+        elif constants.REGULAR_HOURS_START <= current_hour < constants.REGULAR_HOURS_END:
+            adjusted_interval = base_interval * constants.REGULAR_MULTIPLIER
         else:
-            adjusted_interval = base_interval * NIGHT_MULTIPLIER
-        return timedelta(minutes=adjusted_interval)
+            adjusted_interval = base_interval * constants.NIGHT_MULTIPLIER
+        return round_minutes(adjusted_interval)
 
     else:
-        if WEEKEND_REGULAR_START_HOUR <= current_hour < WEEKEND_REGULAR_END_HOUR:
-            adjusted_interval: float = base_interval * REGULAR_MULTIPLIER
+        if constants.WEEKEND_REGULAR_START_HOUR <= current_hour < constants.WEEKEND_REGULAR_END_HOUR:
+            adjusted_interval: float = base_interval * constants.REGULAR_MULTIPLIER
         else:
-            adjusted_interval = base_interval * NIGHT_MULTIPLIER
+            adjusted_interval = base_interval * constants.NIGHT_MULTIPLIER
+
+        return round_minutes(adjusted_interval)
 
-        return timedelta(minutes=adjusted_interval)
+
+def calendar() -> Tuple[float, ...]:
+    """
+    Возвращает текущие значения констант расписания.
+
+    Returns:
+        Tuple[float, ...]: Значения констант CALENDAR_CONSTANTS из модуля constants в том же порядке.
+    """
+    return tuple(getattr(constants, name) for name in CALENDAR_CONSTANTS)
+
+
+def get_interval_table(total_buses: int, road_time: float) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    Строит таблицу интервалов выпуска и требуемого количества автобусов для каждого часа недели.
+
+    Интервал зависит только от дня недели, часа, количества автобусов, времени маршрута и констант расписания,
+    поэтому таблица 7×24 строится один раз для каждого их сочетания и кэшируется. Текущие значения
+    констант расписания (часы пик, множители) входят в ключ кэша, поэтому после изменения
+    constants.PEAK_MULTIPLIER и других констант CALENDAR_CONSTANTS таблица строится заново
+    без сброса кэша.
+
+    Args:
+        total_buses (int): Общее количество автобусов.
+        road_time (float): Время полного маршрута в минутах.
+
+    Returns:
+        Tuple[Tuple[float, ...], Tuple[int, ...]]: Интервалы выпуска в минутах и требуемое количество автобусов,
+            индекс - номер часа от начала недели (день * 24 + час).
+
+    Raises:
+        ValueError: Если интервал выпуска в какой-либо час меньше минуты.
+    """
+    return _interval_table(total_buses, road_time, calendar())
+
+
+@lru_cache(maxsize=None)
+def _interval_table(
+        total_buses: int,
+        road_time: float,
+        calendar_values: Tuple[float, ...]
+) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    Строит таблицу интервалов выпуска для get_interval_table.
+
+    Args:
+        total_buses (int): Общее количество автобусов.
+        road_time (float): Время полного маршрута в минутах.
+        calendar_values (Tuple[float, ...]): Значения констант расписания (см. calendar); входят в ключ кэша,
+            сами значения get_interval читает из модуля constants.
+
+    Returns:
+        Tuple[Tuple[float, ...], Tuple[int, ...]]: Интервалы выпуска и требуемое количество автобусов.
+
+    Raises:
+        ValueError: Если интервал выпуска в какой-либо час меньше минуты.
+    """
+    intervals: List[float] = []
+    required: List[int] = []
+    for hour_of_week in range(HOURS_IN_WEEK):
+        interval: float = get_interval(hour_of_week * MINUTES_PER_HOUR, total_buses, road_time)
+        interval_minutes: int = math.floor(interval)
+        if interval_minutes == 0:
+            raise ValueError(f"Интервал выпуска автобусов меньше минуты: {interval}")
+        intervals.append(interval)
+        required.append(math.ceil(road_time / interval_minutes))
+    return tuple(intervals), tuple(required)
+
+
+@lru_cache(maxsize=None)
+def apply_demand(
+        intervals: Tuple[float, ...],
+        demand: Tuple[float, ...],
+        road_time: float
+) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    Корректирует таблицу интервалов выпуска по профилю спроса маршрута.
+
+    Интервал часа делится на множитель спроса: при множителе 2 автобусы выпускаются вдвое чаще,
+    требуемое количество автобусов пересчитывается по новому интервалу.
+
+    Args:
+        intervals (Tuple[float, ...]): Интервалы выпуска для каждого часа недели (см. get_interval_table).
+        demand (Tuple[float, ...]): Множители спроса на каждый час суток или недели.
+        road_time (float): Время полного маршрута в минутах.
+
+    Returns:
+        Tuple[Tuple[float, ...], Tuple[int, ...]]: Интервалы выпуска в минутах и требуемое количество автобусов
+            для каждого часа недели.
+
+    Raises:
+        ValueError: Если интервал выпуска в какой-либо час меньше минуты.
+    """
+    adjusted: List[float] = []
+    required: List[int] = []
+    for hour_of_week, interval in enumerate(intervals):
+        interval = round_minutes(interval / demand[hour_of_week % len(demand)])
+        interval_minutes: int = math.floor(interval)
+        if interval_minutes == 0:
+            raise ValueError(f"Интервал выпуска автобусов меньше минуты: {interval}")
+        adjusted.append(interval)
+        required.append(math.ceil(road_time / interval_minutes))
+    return tuple(adjusted), tuple(required)
 
 
 def is_weekday(current_day: int) -> bool:
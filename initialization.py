@@ -1,21 +1,23 @@
-from datetime import timedelta
+from constants import *
+from config import SimulationConfig
 from models import Bus, BusDriver, BusStation
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import random
 
 
-def generate_unique_names(count: int) -> List[str]:
+def generate_unique_names(count: int, rng: Optional[random.Random] = None) -> List[str]:
     """
     Генерирует уникальные имена из предопределенного списка.
 
+    Если имён в списке не хватает, имена повторяются с номером круга: "Санёк 2", "Санёк 3" и т.д.
+
     Args:
         count (int): Количество уникальных имен для генерации.
+        rng (Optional[random.Random], optional): Генератор случайных чисел для перемешивания имён.
+            По умолчанию используется глобальный генератор модуля random.
 
     Returns:
         List[str]: Список уникальных имен.
-
-    Raises:
-        ValueError: Если запрашиваемое количество имен превышает доступное количество уникальных имен.
     """
     all_names = [
         "Санёк", "Петя", "Ванёк", "Колян", "Серёга", "Андрюха", "Диман", "Женёк", "Кирюха",
@@ -32,10 +34,14 @@ def generate_unique_names(count: int) -> List[str]:
         "Кеша", "Мирон", "Эльдар", "Ратмир", "Марат", "Геннадий", "Адам", "Ренат", "Леонид",
         "Аркаша", "Трофим", "Вадим", "Всеволод", "Борислав", "Светозар", "Родион", "Юрий"
     ]
-    if count > len(all_names):
-        raise ValueError("Запрашиваемое количество имен превышает доступное количество уникальных имен.")
-    random.shuffle(all_names)
-    return all_names[:count]
+    (rng or random).shuffle(all_names)
+    if count <= len(all_names):
+        return all_names[:count]
+    return [
+        name if lap == 0 else f"{name} {lap + 1}"
+        for lap in range(-(-count // len(all_names)))
+        for name in all_names
+    ][:count]
 
 
 def create_stations(n_of_stations: int) -> List['BusStation']:
@@ -55,31 +61,29 @@ def create_stations(n_of_stations: int) -> List['BusStation']:
     return stations
 
 
-def create_buses(n_of_bus: int) -> List[Bus]:
+def create_buses(config: SimulationConfig) -> List[Bus]:
     """
     Создает списки автобусов для прямого и обратного направления.
 
     Args:
-        n_of_bus (int): Количество автобусов
+        config (SimulationConfig): Параметры сценария.
 
     Returns:
         Tuple[List[Bus], List[Bus]]: Кортеж списков прямых и обратных автобусов.
     """
-    direct_buses = [Bus(number=i, direct=True) for i in range(n_of_bus)]
+    direct_buses = [Bus(number=i, direct=True, config=config) for i in range(config.n_of_buses)]
     return direct_buses
 
 
 def create_drivers(
-        n_of_drivers_eight_shift: int,
-        n_of_drivers_twelve_shift: int,
+        config: SimulationConfig,
         driver_names: List[str],
 ) -> List[BusDriver]:
     """
     Создает списки водителей для прямого и обратного направления.
 
     Args:
-        n_of_drivers_eight_shift (int): Количество 8-часовых водителей для прямого направления.
-        n_of_drivers_twelve_shift (int): Количество 12-часовых водителей для прямого направления.
+        config (SimulationConfig): Параметры сценария (количество 8- и 12-часовых водителей).
         driver_names (List[str]): Список уникальных имен для водителей.
 
     Returns:
@@ -88,19 +92,21 @@ def create_drivers(
     drivers: List['BusDriver'] = []
     name_index = 0
 
-    for _ in range(n_of_drivers_eight_shift):
+    for _ in range(config.n_of_drivers_eight_shift):
         drivers.append(BusDriver(
             name=driver_names[name_index],
-            shift_duration=timedelta(hours=8),
-            bus=None
+            shift_duration=SHIFT_DURATION_8H,
+            bus=None,
+            config=config
         ))
         name_index += 1
 
-    for _ in range(n_of_drivers_twelve_shift):
+    for _ in range(config.n_of_drivers_twelve_shift):
         drivers.append(BusDriver(
             name=driver_names[name_index],
-            shift_duration=timedelta(hours=12),
-            bus=None
+            shift_duration=SHIFT_DURATION_12H,
+            bus=None,
+            config=config
         ))
         name_index += 1
 
@@ -108,34 +114,31 @@ def create_drivers(
 
 
 def initialize(
-        n_of_stations: int,
-        n_of_bus: int,
-        n_of_drivers_eight_shift: int,
-        n_of_drivers_twelve_shift: int,
+        config: SimulationConfig,
+        rng: Optional[random.Random] = None
 ) -> Tuple[List['BusStation'], List['Bus'], List['BusDriver']]:
     """
     Инициализирует станции, автобусы и водителей.
 
     Args:
-        n_of_stations (int): Количество станций.
-        n_of_bus (int): Количество автобусов
-        n_of_drivers_eight_shift (int): Количество 8-часовых водителей
-        n_of_drivers_twelve_shift (int): Количество 12-часовых водителей
+        config (SimulationConfig): Параметры сценария.
+        rng (Optional[random.Random], optional): Генератор случайных чисел для имён водителей.
+            Если водителей больше, чем имён в списке, имена повторяются с номером круга.
 
     Returns:
         Tuple[List[BusStation], List[Bus], List[Bus], List[BusDriver], List[BusDriver]]:
             Кортеж, содержащий списки станций, прямых автобусов, обратных автобусов,
             водителей прямого направления и водителей обратного направления.
     """
-    stations = create_stations(n_of_stations)
-    buses = create_buses(n_of_bus)
+    stations = create_stations(config.n_of_stations)
+    buses = create_buses(config)
     driver_names = generate_unique_names(
-        n_of_drivers_eight_shift +
-        n_of_drivers_twelve_shift
+        config.n_of_drivers_eight_shift +
+        config.n_of_drivers_twelve_shift,
+        rng
     )
     drivers = create_drivers(
-        n_of_drivers_eight_shift,
-        n_of_drivers_twelve_shift,
+        config,
         driver_names
     )
     return stations, buses, drivers
@@ -1,28 +1,44 @@
 from simulation import simulate_time
-from to_excel import excel_schedule
+from storage import save_event_log, default_suffix
 from constants import *
 
 
 def main():
     # Запуск симуляции
-    df = simulate_time(
+    event_log = simulate_time(
         simulation_duration=SIMULATION_DURATION,
         n_of_stations=N_OF_STATIONS,
         n_of_buses=N_OF_BUS,
         n_of_drivers_eight_shift=N_OF_DRIVERS_EIGHT_SHIFT,
-        n_of_drivers_twelve_shift=N_OF_DRIVERS_TWELVE_SHIFT
+        n_of_drivers_twelve_shift=N_OF_DRIVERS_TWELVE_SHIFT,
+        profile=PROFILE_SIMULATION
     )
 
     # Определение имени выходного файла
     output_file = "drivers_schedule.xlsx"
 
-    # Сохранение результатов в Excel
-    excel_schedule(df, output_file)
+    # Построение записей расписания водителей и сохранение результатов в Excel
+    # Модуль выгрузки импортируется только здесь: он загружает pandas и openpyxl
+    from to_excel import excel_schedule
+    schedule = event_log.to_records()
+    excel_schedule(schedule, output_file)
+
+    # Сохранение журнала событий в столбцовом формате для последующего анализа без повторной симуляции
+    results_file = "drivers_schedule" + default_suffix()
+    save_event_log(event_log, results_file)
+
+    # Сохранение профиля фаз симуляции
+    profile_file = "drivers_schedule_profile.json"
+    if event_log.profile is not None:
+        event_log.profile.save(profile_file)
 
     # Вывод информации о завершении
     print("Симуляция завершена.")
     print(f"Расписание сохранено в файл: {output_file}")
-    print(f"Всего водителей задействовано: {len(df.columns) - 1}")
+    print(f"Журнал событий сохранён в файл: {results_file}")
+    if event_log.profile is not None:
+        print(f"Профиль симуляции сохранён в файл: {profile_file}")
+    print(f"Всего водителей задействовано: {len(event_log.driver_names)}")
 
 
 if __name__ == "__main__":
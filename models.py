@@ -1,6 +1,9 @@
 from constants import *
-from datetime import timedelta
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from config import SimulationConfig
+    from pools import BusPool, DriverPool
 
 
 class Bus:
@@ -10,21 +13,27 @@ class Bus:
     Attributes:
         number (int): Номер автобуса.
         direct (bool): Флаг, который показывает, в какую сторону едет автобус.
-        to_next (int): Время до следующей остановки.
+        to_next (int): Время до следующей остановки в минутах.
+        config (SimulationConfig): Параметры маршрута, по которому едет автобус (остановки, время перегонов).
     """
 
-    def __init__(self, number: int, direct: bool) -> None:
+    # Фиксированный набор полей без __dict__: меньше памяти на объект и быстрее доступ к атрибутам
+    __slots__ = ("number", "station", "direct", "to_next", "config")
+
+    def __init__(self, number: int, direct: bool, config: 'SimulationConfig') -> None:
         """
         Инициализирует объект Bus.
 
         Args:
             number (int): Номер автобуса.
             direct (bool): Флаг, который показывает, в какую сторону едет автобус.
+            config (SimulationConfig): Параметры сценария.
         """
         self.number: int = number
         self.station: int = START_STATION
         self.direct: bool = direct
-        self.to_next: int = DEFAULT_TO_NEXT
+        self.config: 'SimulationConfig' = config
+        self.to_next: int = config.segment_time(START_STATION, direct)
 
     def move(self) -> bool:
         """
@@ -39,18 +48,17 @@ class Bus:
         Returns:
             bool: True, если автобус достиг остановки, иначе False.
         """
-        self.to_next -= timedelta(minutes=1)
+        self.to_next -= TIME_INCREMENT
 
-        if self.to_next == timedelta(minutes=0):
+        if self.to_next == 0:
             if self.direct:
                 self.station += 1
             else:
                 self.station -= 1
 
-            self.to_next = DEFAULT_TO_NEXT
-            if abs(self.station) == N_OF_STATIONS:
+            if abs(self.station) == self.config.n_of_stations:
                 self.station = START_STATION
-                self.to_next = DEFAULT_TO_NEXT
+            self.to_next = self.config.segment_time(self.station, self.direct)
             return True
         return False
 
@@ -61,89 +69,114 @@ class BusDriver:
 
     Attributes:
         name (str): Имя водителя.
-        shift_duration (timedelta): Продолжительность смены.
+        shift_duration (int): Продолжительность смены в минутах.
         bus (Optional[Bus]): Привязанный автобус.
         on_lunch (bool): Флаг, указывающий на перерыв.
-        working_time (timedelta): Время работы за день.
+        working_time (int): Время работы за день в минутах.
         days_worked (int): Дни, отработанные подряд.
-        all_rest (timedelta): Общее время отдыха за день.
-        resting_time (timedelta): Время, которое водитель на отдыхе.
-        between_shifts_time (timedelta): Время между сменами.
+        all_rest (int): Общее время отдыха за день в минутах.
+        resting_time (int): Время, которое водитель на отдыхе, в минутах.
+        between_shifts_time (int): Время между сменами в минутах.
         daily_breaks (int): Количество перерывов за смену.
-        break_duration (timedelta): Продолжительность перерыва.
+        break_duration (int): Продолжительность перерыва в минутах.
         can_work_today (bool): Флаг, указывающий, может ли водитель работать сегодня.
-        day_off (timedelta): Время, оставшееся до следующего рабочего дня.
+        day_off (int): Время, оставшееся до следующего рабочего дня, в минутах.
+        config (SimulationConfig): Параметры маршрута, на котором водитель работает смену.
     """
 
+    __slots__ = (
+        "name", "shift_duration", "bus", "on_lunch", "working_time", "days_worked", "all_rest",
+        "resting_time", "between_shifts_time", "daily_breaks", "break_duration", "can_work_today", "day_off",
+        "config",
+    )
+
     def __init__(
             self,
             name: str,
-            shift_duration: timedelta,
+            shift_duration: int,
             bus: Optional['Bus'],
+            config: 'SimulationConfig'
     ) -> None:
         """
         Инициализирует объект BusDriver.
 
         Args:
             name (str): Имя водителя.
-            shift_duration (timedelta): Продолжительность смены.
+            shift_duration (int): Продолжительность смены в минутах.
             bus (Optional[Bus]): Привязанный автобус.
+            config (SimulationConfig): Параметры сценария.
         """
         self.name: str = name
-        self.shift_duration: timedelta = shift_duration
+        self.config: 'SimulationConfig' = config
+        self.shift_duration: int = shift_duration
         self.bus: Optional['Bus'] = bus
         self.on_lunch: bool = False
-        self.working_time: timedelta = timedelta(hours=0)
+        self.working_time: int = 0
         self.days_worked: int = 0
-        self.all_rest: timedelta = timedelta(hours=0)
-        self.resting_time: timedelta = timedelta(minutes=0)
-        self.between_shifts_time: timedelta = BETWEEN_SHIFTS_TIME
+        self.all_rest: int = 0
+        self.resting_time: int = 0
+        self.between_shifts_time: int = BETWEEN_SHIFTS_TIME
 
         if self.shift_duration == DEFAULT_SHIFT_DURATION_12H:
             self.daily_breaks: int = DAILY_BREAKS_12H
-            self.break_duration: timedelta = BREAK_DURATION_12H
+            self.break_duration: int = BREAK_DURATION_12H
             self.can_work_today: bool = True
-            self.day_off: timedelta = timedelta(hours=0)
+            self.day_off: int = 0
         else:
             self.daily_breaks: int = DAILY_BREAKS_8H
-            self.break_duration: timedelta = BREAK_DURATION_8H
+            self.break_duration: int = BREAK_DURATION_8H
 
-    def bus_for_driver(self, bus_pool: List['Bus']) -> bool:
+    def bus_for_driver(self, bus_pool: 'BusPool', current_time: int, direct: Optional[bool] = None) -> bool:
         """
         Назначает автобус водителю из пула свободных автобусов.
 
+        Автобус общего депо мог работать на другом маршруте; тогда он переходит на маршрут водителя
+        и начинает рейс с начальной остановки.
+
         Args:
-            bus_pool (List[Bus]): Пул доступных автобусов.
+            bus_pool (BusPool): Пул доступных автобусов.
+            current_time (int): Текущее время в минутах.
+            direct (Optional[bool], optional): Направление движения автобуса.
+                По умолчанию None - направление не меняется.
 
         Returns:
             bool: True, если автобус был назначен, иначе False.
         """
-        if bus_pool:
-            self.bus = bus_pool.pop(0)
+        bus: Optional['Bus'] = bus_pool.acquire(current_time)
+        if bus:
+            if direct is not None:
+                bus.direct = direct
+            if bus.config is not self.config:
+                bus.config = self.config
+                bus.station = START_STATION
+                bus.to_next = self.config.segment_time(START_STATION, bus.direct)
+            self.bus = bus
             return True
         return False
 
-    def release_bus_from_driver(self, bus_pool: List['Bus']) -> None:
+    def release_bus_from_driver(self, bus_pool: 'BusPool', current_time: int) -> None:
         """
         Освобождает автобус от водителя и возвращает его в пул.
 
         Args:
-            bus_pool (List[Bus]): Пул доступных автобусов.
+            bus_pool (BusPool): Пул доступных автобусов.
+            current_time (int): Текущее время в минутах.
         """
         if self.bus:
             self.bus.direct = None
-            bus_pool.append(self.bus)
+            bus_pool.release(self.bus, current_time)
             self.bus = None
 
-    def take_break(self, bus_pool: List['Bus'], drivers_on_lunch: List['BusDriver']) -> None:
+    def take_break(self, bus_pool: 'BusPool', drivers_on_lunch: List['BusDriver'], current_time: int) -> None:
         """
         Отправляет водителя на перерыв.
 
         Args:
-            bus_pool (List[Bus]): Пул доступных автобусов.
+            bus_pool (BusPool): Пул доступных автобусов.
             drivers_on_lunch (List[BusDriver]): Список водителей на перерыве.
+            current_time (int): Текущее время в минутах.
         """
-        self.release_bus_from_driver(bus_pool)
+        self.release_bus_from_driver(bus_pool, current_time)
         self.daily_breaks -= 1
         self.on_lunch = True
         drivers_on_lunch.append(self)
@@ -151,36 +184,38 @@ class BusDriver:
     def end_break(
             self,
             drivers_on_lunch: List['BusDriver'],
-            bus_pool: List['Bus'],
+            bus_pool: 'BusPool',
             active_drivers: List['BusDriver'],
-            finished_drivers: List['BusDriver']
+            driver_pool: 'DriverPool',
+            current_time: int
     ) -> bool:
         """
         Завершает перерыв водителя и возвращает его к работе, если перерыв закончен.
 
         Args:
             drivers_on_lunch (List[BusDriver]): Список водителей на перерыве.
-            bus_pool (List[Bus]): Пул доступных автобусов.
+            bus_pool (BusPool): Пул доступных автобусов.
             active_drivers (List[BusDriver]): Список активных водителей.
-            finished_drivers (List[BusDriver]): Список завершивших работу водителей.
+            driver_pool (DriverPool): Пул водителей, ожидающих смены.
+            current_time (int): Текущее время в минутах.
         Returns:
         bool: True, если водитель вернулся к работе, иначе False.
         """
         if self.on_lunch:
-            self.resting_time += timedelta(minutes=1)
+            self.resting_time += TIME_INCREMENT
             if self.resting_time >= self.break_duration and bus_pool:
                 drivers_on_lunch.remove(self)
-                self.bus_for_driver(bus_pool)
+                self.bus_for_driver(bus_pool, current_time)
                 self.on_lunch = False
                 self.all_rest = self.resting_time
-                self.resting_time = timedelta(minutes=0)
+                self.resting_time = 0
                 return True
-            if self.resting_time > timedelta(hours=1):
+            if self.resting_time > MAX_BREAK_DURATION:
                 self.on_lunch = False
                 self.all_rest = self.resting_time
-                self.resting_time = timedelta(minutes=0)
+                self.resting_time = 0
                 drivers_on_lunch.remove(self)
-                self.end_of_the_day(active_drivers, finished_drivers, bus_pool)
+                self.end_of_the_day(active_drivers, driver_pool, bus_pool, current_time)
             return False
 
     def drive_bus(
@@ -208,63 +243,75 @@ class BusDriver:
                 self.day_off = DAY_OFF_DURATION_12H
                 self.days_worked = 0
 
-    def update_day_off(self) -> None:
-        """
-        Обновляет оставшееся время на выходном для 12-часового водителя.
-        """
-        if self.shift_duration == DEFAULT_SHIFT_DURATION_12H:
-            if not self.can_work_today:
-                self.day_off -= timedelta(minutes=1)
-                if self.day_off <= timedelta(minutes=0):
-                    self.can_work_today = True
-                    self.day_off = DAY_OFF_DURATION_12H
-
     def end_of_the_day(
             self,
             active_drivers: List['BusDriver'],
-            finished_drivers: List['BusDriver'],
-            bus_pool: List['Bus']
+            driver_pool: 'DriverPool',
+            bus_pool: 'BusPool',
+            current_time: int
     ) -> None:
         """
         Обновляет поля водителя после завершения смены.
 
         Args:
             active_drivers (List[BusDriver]): Список активных водителей.
-            finished_drivers (List[BusDriver]): Список завершивших работу водителей.
-            bus_pool (List[Bus]): Пул доступных автобусов.
+            driver_pool (DriverPool): Пул водителей, ожидающих смены.
+            bus_pool (BusPool): Пул доступных автобусов.
+            current_time (int): Текущее время в минутах.
         """
-        self.working_time = timedelta(hours=0)
+        self.working_time = 0
         self.on_lunch = False
-        self.all_rest = timedelta(hours=0)
+        self.all_rest = 0
         if self.shift_duration == DEFAULT_SHIFT_DURATION_12H:
             self.daily_breaks = DAILY_BREAKS_12H
             self.update_work_status()
         else:
             self.daily_breaks = DAILY_BREAKS_8H
         if self.bus:
-            self.release_bus_from_driver(bus_pool)
-        finished_drivers.append(self)
+            self.release_bus_from_driver(bus_pool, current_time)
+        driver_pool.release(self, current_time)
         active_drivers.remove(self)
 
-    def is_allowed_to_work(self, time_road: timedelta, current_time: timedelta) -> bool:
+    def is_break_due(self) -> bool:
+        """
+        Проверяет, пора ли водителю уйти на перерыв.
+
+        Перерыв начинается только на стартовой остановке после отработки порогового времени:
+        для 8-часовой смены один раз, для 12-часовой смены дважды.
+
+        Returns:
+            bool: True, если водитель должен уйти на перерыв, иначе False.
+        """
+        if not self.bus or self.bus.station != START_STATION:
+            return False
+        if self.shift_duration == SHIFT_DURATION_8H:
+            return self.working_time >= WORKING_TIME_THRESHOLD_8H and self.daily_breaks > 0
+        return (
+                (self.working_time >= WORKING_TIME_THRESHOLD_12H_FIRST and self.daily_breaks == 2) or
+                (self.working_time >= WORKING_TIME_THRESHOLD_12H_SECOND and self.daily_breaks == 1)
+        )
+
+    def is_allowed_to_work(self, current_time: int) -> bool:
         """
         Проверяет, разрешено ли водителю работать в текущий момент.
 
+        На конечной остановке водитель может начать новый рейс, только если успеет
+        проехать полный маршрут до конца смены.
+
         Args:
-            time_road (timedelta): Время в пути.
-            current_time (timedelta): Текущее время.
+            current_time (int): Текущее время в минутах.
 
         Returns:
             bool: True, если разрешено работать, иначе False.
         """
         if self.bus:
-            if self.bus.station in (START_STATION, N_OF_STATIONS):
-                current_hour = ((current_time.days * MAX_HOUR) +
-                                ((current_time.seconds + time_road.seconds) // SECONDS_IN_HOUR)) % MAX_HOUR
+            if self.bus.station in (START_STATION, self.config.n_of_stations):
+                time_road: int = self.config.road_time
+                current_hour = ((current_time + time_road) // MINUTES_PER_HOUR) % MAX_HOUR
                 if self.shift_duration == DEFAULT_SHIFT_DURATION_8H:
                     return (self.working_time + time_road) < self.shift_duration and \
                            (MIN_WORK_HOUR <= current_hour <= MAX_WORK_HOUR)
-                return (self.working_time + time_road) < (self.shift_duration - timedelta(hours=1))
+                return (self.working_time + time_road) < (self.shift_duration - MINUTES_PER_HOUR)
             return True
         return True
 
@@ -278,6 +325,8 @@ class BusStation:
         direct (bool): Флаг, указывающий направление остановки.
     """
 
+    __slots__ = ("station_id", "direct")
+
     def __init__(self, station_id: int, direct: bool) -> None:
         """
         Инициализирует объект BusStation.
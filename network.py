@@ -0,0 +1,342 @@
+from constants import *
+from config import SimulationConfig
+from models import Bus, BusDriver
+from pools import BusPool, DriverPool, bus_utilization
+from event_engine import EventEngine, RouteState
+from event_log import EventLog
+from initialization import generate_unique_names
+from profiler import SimulationProfiler
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import random
+import time
+
+DEFAULT_DEPOT: str = "Депо"
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    Маршрут сети: кольцо остановок, время перегонов, плановое количество автобусов и профиль спроса.
+
+    Перегон i ведёт от остановки i к остановке i + 1, последний перегон - обратно к начальной остановке,
+    на которой водители начинают и заканчивают смену. Автобусы прямого направления проходят остановки
+    по порядку, обратного - в обратном порядке.
+
+    Attributes:
+        name (str): Название маршрута.
+        segment_times (Tuple[int, ...]): Время каждого перегона в минутах.
+        n_of_buses (int): Плановое количество автобусов, по которому рассчитываются интервалы выпуска.
+        stops (Tuple[str, ...]): Названия остановок; по умолчанию "Остановка 0", "Остановка 1" и т.д.
+        demand (Tuple[float, ...]): Множители частоты выпуска на каждый час суток или недели.
+        depot (str): Название депо, автобусы и водители которого работают на маршруте.
+    """
+
+    name: str
+    segment_times: Tuple[int, ...]
+    n_of_buses: int
+    stops: Tuple[str, ...] = ()
+    demand: Tuple[float, ...] = ()
+    depot: str = DEFAULT_DEPOT
+
+    def __post_init__(self) -> None:
+        """
+        Проверяет маршрут и задаёт названия остановок по умолчанию.
+
+        Raises:
+            ValueError: Если на маршруте меньше двух остановок или названия остановок не соответствуют перегонам.
+        """
+        if len(self.segment_times) < 2:
+            raise ValueError(f"На маршруте {self.name} должно быть не меньше двух остановок.")
+        if not self.stops:
+            object.__setattr__(self, "stops", tuple(f"Остановка {i}" for i in range(len(self.segment_times))))
+        elif len(self.stops) != len(self.segment_times):
+            raise ValueError(
+                f"На маршруте {self.name} {len(self.stops)} остановок и {len(self.segment_times)} перегонов,"
+                f" а должно быть поровну."
+            )
+
+    @property
+    def n_of_stations(self) -> int:
+        """
+        Возвращает количество остановок маршрута.
+
+        Returns:
+            int: Количество остановок.
+        """
+        return len(self.segment_times)
+
+    def stop_name(self, stop: int) -> str:
+        """
+        Возвращает название остановки по номеру из журнала событий.
+
+        Args:
+            stop (int): Номер остановки (столбец stop журнала событий).
+
+        Returns:
+            str: Название остановки.
+        """
+        return self.stops[stop % self.n_of_stations]
+
+    def config(self, simulation_duration: int, start_hour: int) -> SimulationConfig:
+        """
+        Строит конфигурацию симуляции маршрута.
+
+        Водители и автобусы принадлежат депо, поэтому их количество в конфигурации маршрута не задаётся.
+
+        Args:
+            simulation_duration (int): Продолжительность симуляции в минутах.
+            start_hour (int): Час начала симуляции.
+
+        Returns:
+            SimulationConfig: Конфигурация маршрута.
+        """
+        return SimulationConfig(
+            simulation_duration=simulation_duration,
+            n_of_stations=self.n_of_stations,
+            n_of_buses=self.n_of_buses,
+            n_of_drivers_eight_shift=0,
+            n_of_drivers_twelve_shift=0,
+            start_hour=start_hour,
+            to_next=self.segment_times[0],
+            segment_times=tuple(self.segment_times),
+            demand=tuple(self.demand)
+        )
+
+
+@dataclass(frozen=True)
+class Depot:
+    """
+    Депо с общим для его маршрутов парком автобусов и водителями.
+
+    Attributes:
+        name (str): Название депо.
+        n_of_buses (int): Количество автобусов.
+        n_of_drivers_eight_shift (int): Количество водителей с 8-часовыми сменами.
+        n_of_drivers_twelve_shift (int): Количество водителей с 12-часовыми сменами.
+    """
+
+    name: str = DEFAULT_DEPOT
+    n_of_buses: int = N_OF_BUS
+    n_of_drivers_eight_shift: int = N_OF_DRIVERS_EIGHT_SHIFT
+    n_of_drivers_twelve_shift: int = N_OF_DRIVERS_TWELVE_SHIFT
+
+
+@dataclass(frozen=True)
+class NetworkConfig:
+    """
+    Неизменяемые параметры сети маршрутов.
+
+    Attributes:
+        routes (Tuple[Route, ...]): Маршруты в порядке диспетчеризации внутри минуты.
+        depots (Tuple[Depot, ...]): Депо.
+        simulation_duration (int): Продолжительность симуляции в минутах.
+        start_hour (int): Час начала симуляции.
+        route_configs (Tuple[SimulationConfig, ...]): Конфигурации маршрутов в порядке routes.
+    """
+
+    routes: Tuple[Route, ...]
+    depots: Tuple[Depot, ...] = (Depot(),)
+    simulation_duration: int = SIMULATION_DURATION
+    start_hour: int = SIMULATION_START_HOURS
+    route_configs: Tuple[SimulationConfig, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Проверяет сеть и строит конфигурации маршрутов.
+
+        Raises:
+            ValueError: Если в сети нет маршрутов, названия маршрутов или депо повторяются,
+                маршрут ссылается на неизвестное депо или депо не обслуживает ни одного маршрута.
+        """
+        if not self.routes:
+            raise ValueError("В сети должен быть хотя бы один маршрут.")
+        route_names: List[str] = [route.name for route in self.routes]
+        depot_names: List[str] = [depot.name for depot in self.depots]
+        if len(set(route_names)) != len(route_names) or len(set(depot_names)) != len(depot_names):
+            raise ValueError("Названия маршрутов и депо должны быть уникальными.")
+        for route in self.routes:
+            if route.depot not in depot_names:
+                raise ValueError(f"Маршрут {route.name} ссылается на неизвестное депо: {route.depot}")
+        for depot in self.depots:
+            if depot.n_of_buses < 0 or depot.n_of_drivers_eight_shift < 0 or depot.n_of_drivers_twelve_shift < 0:
+                raise ValueError("Количество автобусов и водителей не может быть отрицательным.")
+            if not any(route.depot == depot.name for route in self.routes):
+                raise ValueError(f"Депо {depot.name} не обслуживает ни одного маршрута.")
+        object.__setattr__(self, "route_configs", tuple(
+            route.config(self.simulation_duration, self.start_hour) for route in self.routes
+        ))
+
+    @property
+    def n_of_drivers(self) -> int:
+        """
+        Возвращает количество водителей во всех депо.
+
+        Returns:
+            int: Количество водителей.
+        """
+        return sum(depot.n_of_drivers_eight_shift + depot.n_of_drivers_twelve_shift for depot in self.depots)
+
+
+def load_network(path: str) -> NetworkConfig:
+    """
+    Загружает сеть маршрутов из JSON-файла.
+
+    Файл содержит списки "routes" и "depots" с полями Route и Depot, а также необязательные
+    "simulation_duration" и "start_hour". Без списка "depots" используется одно депо по умолчанию.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        NetworkConfig: Сеть маршрутов.
+    """
+    with open(path, encoding="utf-8") as file:
+        data: Dict[str, Any] = json.load(file)
+    routes: Tuple[Route, ...] = tuple(
+        Route(**{key: tuple(value) if isinstance(value, list) else value for key, value in route.items()})
+        for route in data["routes"]
+    )
+    depots: Tuple[Depot, ...] = tuple(Depot(**depot) for depot in data.get("depots", [{}]))
+    return NetworkConfig(
+        routes=routes,
+        depots=depots,
+        simulation_duration=data.get("simulation_duration", SIMULATION_DURATION),
+        start_hour=data.get("start_hour", SIMULATION_START_HOURS)
+    )
+
+
+@dataclass
+class NetworkResult:
+    """
+    Результат симуляции сети маршрутов.
+
+    Attributes:
+        network (NetworkConfig): Сеть маршрутов.
+        event_logs (Dict[str, EventLog]): Журналы событий по названиям маршрутов; водитель, работавший
+            на нескольких маршрутах, есть в журнале каждого из них.
+        depot_stats (Dict[str, Dict[str, float]]): Итоги по депо: задействованные водители, промахи
+            диспетчеризации, время работы и простоя автобусов, средняя загрузка автобусов.
+        profile (Optional[SimulationProfiler]): Профиль фаз симуляции или None.
+    """
+
+    network: NetworkConfig
+    event_logs: Dict[str, EventLog]
+    depot_stats: Dict[str, Dict[str, float]]
+    profile: Optional[SimulationProfiler] = None
+
+
+def create_depot(depot: Depot, config: SimulationConfig, driver_names: List[str]) -> Tuple[DriverPool, BusPool]:
+    """
+    Создаёт автобусы и водителей депо и их пулы.
+
+    До первого выпуска автобусы и водители привязаны к первому маршруту депо; при выпуске на линию
+    они переходят на маршрут, который их выпустил.
+
+    Args:
+        depot (Depot): Депо.
+        config (SimulationConfig): Конфигурация первого маршрута депо.
+        driver_names (List[str]): Уникальные имена водителей депо.
+
+    Returns:
+        Tuple[DriverPool, BusPool]: Пул водителей и пул автобусов депо.
+    """
+    buses: List['Bus'] = [Bus(number=i, direct=True, config=config) for i in range(depot.n_of_buses)]
+    shifts: List[int] = (
+        [SHIFT_DURATION_8H] * depot.n_of_drivers_eight_shift + [SHIFT_DURATION_12H] * depot.n_of_drivers_twelve_shift
+    )
+    drivers: List['BusDriver'] = [
+        BusDriver(name=name, shift_duration=shift_duration, bus=None, config=config)
+        for name, shift_duration in zip(driver_names, shifts)
+    ]
+    return DriverPool(drivers), BusPool(buses, config.start_minute)
+
+
+def simulate_network(network: NetworkConfig, seed: Optional[int] = None, profile: bool = False) -> NetworkResult:
+    """
+    Симулирует работу сети маршрутов с общими для маршрутов одного депо автобусами и водителями.
+
+    Все маршруты обрабатываются одним событийным движком (EventEngine) с общей очередью событий.
+    У каждого маршрута своя диспетчеризация: интервалы выпуска по его времени перегонов, плановому
+    количеству автобусов и профилю спроса, свои времена последнего выпуска и активные водители.
+    Водители и автобусы берутся из пулов депо маршрута; водитель работает смену на маршруте,
+    который его выпустил, а свободный автобус депо переходит на маршрут водителя.
+
+    Сеть из одного маршрута и одного депо даёт тот же результат, что и simulate с движком "event"
+    для конфигурации с теми же параметрами.
+
+    Args:
+        network (NetworkConfig): Сеть маршрутов.
+        seed (Optional[int], optional): Зерно генератора случайных чисел для имён водителей.
+            По умолчанию используется глобальный генератор модуля random.
+        profile (bool, optional): Профилировать ли фазы симуляции. По умолчанию False.
+
+    Returns:
+        NetworkResult: Журналы событий маршрутов и итоги по депо.
+    """
+    driver_names: List[str] = generate_unique_names(
+        network.n_of_drivers, random.Random(seed) if seed is not None else None
+    )
+    pools: Dict[str, Tuple[DriverPool, BusPool]] = {}
+    name_index: int = 0
+    for depot in network.depots:
+        config: SimulationConfig = next(
+            route_config for route, route_config in zip(network.routes, network.route_configs)
+            if route.depot == depot.name
+        )
+        n_of_drivers: int = depot.n_of_drivers_eight_shift + depot.n_of_drivers_twelve_shift
+        pools[depot.name] = create_depot(depot, config, driver_names[name_index:name_index + n_of_drivers])
+        name_index += n_of_drivers
+
+    route_states: List[RouteState] = []
+    for index, (route, config) in enumerate(zip(network.routes, network.route_configs)):
+        driver_pool, bus_pool = pools[route.depot]
+        route_states.append(RouteState(
+            index=index,
+            config=config,
+            active_drivers=[],
+            driver_pool=driver_pool,
+            drivers_on_lunch=[],
+            bus_pool=bus_pool,
+            event_log=EventLog(config.start_minute, config.end_minute)
+        ))
+
+    profiler: Optional[SimulationProfiler] = SimulationProfiler("event") if profile else None
+    started_at: float = time.perf_counter()
+    EventEngine(routes=route_states, profiler=profiler).run()
+
+    event_logs: Dict[str, EventLog] = {}
+    for route, state in zip(network.routes, route_states):
+        state.event_log.stats = {"drivers_used": len(state.event_log.driver_names)}
+        event_logs[route.name] = state.event_log
+
+    depot_stats: Dict[str, Dict[str, float]] = {}
+    simulation_end: int = route_states[0].config.end_minute
+    for depot in network.depots:
+        driver_pool, bus_pool = pools[depot.name]
+        bus_pool.close(simulation_end)
+        drivers_used: set = set()
+        for route, state in zip(network.routes, route_states):
+            if route.depot == depot.name:
+                drivers_used.update(state.event_log.driver_names)
+        depot_stats[depot.name] = {
+            "drivers_used": len(drivers_used),
+            "missed_no_driver": driver_pool.misses,
+            "missed_no_bus": bus_pool.misses,
+            "bus_service_minutes": int(bus_pool.service_minutes.sum()),
+            "bus_idle_minutes": int(bus_pool.idle_minutes.sum()),
+            "bus_utilization": (
+                float(bus_utilization(bus_pool.service_minutes, bus_pool.idle_minutes).mean())
+                if bus_pool.fleet_size else 0.0
+            ),
+        }
+
+    print("Симуляция сети завершена.")
+    print(f"Маршрутов: {len(network.routes)}, депо: {len(network.depots)}")
+    for name, stats in depot_stats.items():
+        print(f"{name}: водителей задействовано {stats['drivers_used']}, загрузка автобусов {stats['bus_utilization']:.1%}")
+    if profiler is not None:
+        profiler.wall_time = time.perf_counter() - started_at
+        print(profiler.report())
+    return NetworkResult(network=network, event_logs=event_logs, depot_stats=depot_stats, profile=profiler)
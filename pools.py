@@ -0,0 +1,262 @@
+from constants import *
+from models import Bus, BusDriver
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+import heapq
+import itertools
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class DriverPool:
+    """
+    Пул водителей, ожидающих выхода на смену.
+
+    Водители, ещё не выходившие на смену, хранятся в отдельных очередях для 8- и 12-часовых смен.
+    Водители, завершившие смену, попадают в кучу, упорядоченную по моменту окончания отдыха
+    (время между сменами и выходной для 12-часовой смены). При выдаче водителя куча разбирается
+    только до текущего момента, поэтому таймеры отдыха не нужно уменьшать каждую минуту.
+
+    Среди отдохнувших водителей выдаётся тот, кто раньше всех завершил смену,
+    а затем водители, ещё не выходившие на смену, в исходном порядке.
+
+    Attributes:
+        finished_count (int): Количество водителей, завершивших смену и ожидающих следующей.
+        misses (int): Количество запросов, на которые не нашлось водителя.
+    """
+
+    def __init__(self, drivers: List['BusDriver']) -> None:
+        """
+        Инициализирует пул водителями, ещё не выходившими на смену.
+
+        Args:
+            drivers (List[BusDriver]): Список водителей.
+        """
+        self.finished_count: int = 0
+        self.misses: int = 0
+        self._fresh: Dict[int, Deque['BusDriver']] = {
+            SHIFT_DURATION_8H: deque(),
+            SHIFT_DURATION_12H: deque(),
+        }
+        for driver in drivers:
+            self._fresh.setdefault(driver.shift_duration, deque()).append(driver)
+        self._resting: List[Tuple[int, int, 'BusDriver']] = []
+        self._ready: Dict[int, List[Tuple[int, 'BusDriver']]] = {shift: [] for shift in self._fresh}
+        self._order = itertools.count()
+        self._last_order: Optional[int] = None
+
+    def release(self, driver: 'BusDriver', current_time: int) -> None:
+        """
+        Возвращает в пул водителя, завершившего смену.
+
+        Таймеры отдыха в прежнем поминутном цикле уменьшались уже в минуту завершения смены,
+        поэтому водитель становится доступен на минуту раньше полного времени отдыха.
+
+        Args:
+            driver (BusDriver): Водитель, завершивший смену.
+            current_time (int): Текущее время в минутах.
+        """
+        rest: int = driver.between_shifts_time
+        if driver.shift_duration == DEFAULT_SHIFT_DURATION_12H and not driver.can_work_today:
+            rest = max(rest, driver.day_off)
+        available_at: int = current_time + rest - TIME_INCREMENT
+        heapq.heappush(self._resting, (available_at, next(self._order), driver))
+        self.finished_count += 1
+
+    def wake(self, current_time: int) -> None:
+        """
+        Переводит водителей, у которых закончился отдых, в очередь готовых к смене.
+
+        Вызывается из acquire; повторный вызов в ту же минуту ничего не меняет,
+        поэтому профилировщик может замерять таймеры отдыха отдельно от диспетчеризации.
+
+        Args:
+            current_time (int): Текущее время в минутах.
+        """
+        while self._resting and self._resting[0][0] <= current_time:
+            _, order, driver = heapq.heappop(self._resting)
+            if driver.shift_duration == DEFAULT_SHIFT_DURATION_12H and not driver.can_work_today:
+                driver.can_work_today = True
+                driver.day_off = DAY_OFF_DURATION_12H
+            heapq.heappush(self._ready[driver.shift_duration], (order, driver))
+
+    def acquire(self, shift_duration: int, current_time: int) -> Optional['BusDriver']:
+        """
+        Выдаёт водителя с заданной продолжительностью смены.
+
+        Args:
+            shift_duration (int): Продолжительность смены в минутах.
+            current_time (int): Текущее время в минутах.
+
+        Returns:
+            Optional[BusDriver]: Найденный водитель или None.
+        """
+        self.wake(current_time)
+        ready: List[Tuple[int, 'BusDriver']] = self._ready[shift_duration]
+        if ready:
+            self._last_order, driver = heapq.heappop(ready)
+            driver.between_shifts_time = BETWEEN_SHIFTS_TIME
+            self.finished_count -= 1
+            return driver
+        fresh: Deque['BusDriver'] = self._fresh[shift_duration]
+        if fresh:
+            self._last_order = None
+            return fresh.popleft()
+        self.misses += 1
+        return None
+
+    def put_back(self, driver: 'BusDriver') -> None:
+        """
+        Возвращает только что выданного водителя на его прежнее место в очереди.
+
+        Нужен, когда водителю не нашлось автобуса: без этого водитель выпадал бы из пула до конца симуляции.
+        Вызывается сразу после acquire, который выдал этого водителя.
+
+        Args:
+            driver (BusDriver): Водитель, выданный последним вызовом acquire.
+        """
+        if self._last_order is None:
+            self._fresh[driver.shift_duration].appendleft(driver)
+        else:
+            heapq.heappush(self._ready[driver.shift_duration], (self._last_order, driver))
+            self.finished_count += 1
+
+
+class BusPool:
+    """
+    Пул свободных автобусов в депо.
+
+    Автобусы выдаются в порядке возврата в депо (очередь), поэтому выдача и возврат выполняются за O(1).
+    Для каждого автобуса считается время в рейсе и время простоя в депо: при каждой выдаче
+    и возврате к соответствующему счётчику добавляется промежуток с момента предыдущей смены состояния.
+
+    Attributes:
+        buses (List[Bus]): Все автобусы парка.
+        service_minutes (np.ndarray): Время в рейсе каждого автобуса в минутах (индекс - номер автобуса).
+        idle_minutes (np.ndarray): Время простоя каждого автобуса в депо в минутах (индекс - номер автобуса).
+        misses (int): Количество запросов, на которые не нашлось свободного автобуса.
+    """
+
+    def __init__(self, buses: List['Bus'], start_minute: int) -> None:
+        """
+        Инициализирует пул, в котором все автобусы находятся в депо.
+
+        Args:
+            buses (List[Bus]): Список автобусов.
+            start_minute (int): Минута начала симуляции.
+        """
+        self.buses: List['Bus'] = list(buses)
+        self._free: Deque['Bus'] = deque(buses)
+        n_of_buses: int = max((bus.number for bus in buses), default=-1) + 1
+        self.service_minutes: np.ndarray = np.zeros(n_of_buses, dtype=np.int64)
+        self.idle_minutes: np.ndarray = np.zeros(n_of_buses, dtype=np.int64)
+        self._since: np.ndarray = np.full(n_of_buses, start_minute, dtype=np.int64)
+        self._in_service: np.ndarray = np.zeros(n_of_buses, dtype=bool)
+        self.misses: int = 0
+
+    @property
+    def fleet_size(self) -> int:
+        """
+        Returns:
+            int: Общее количество автобусов парка, включая автобусы на линии.
+        """
+        return len(self.buses)
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: Количество свободных автобусов в депо.
+        """
+        return len(self._free)
+
+    def acquire(self, current_time: int) -> Optional['Bus']:
+        """
+        Выдаёт автобус, дольше всех простаивающий в депо.
+
+        Args:
+            current_time (int): Текущее время в минутах.
+
+        Returns:
+            Optional[Bus]: Свободный автобус или None, если все автобусы на линии.
+        """
+        if not self._free:
+            self.misses += 1
+            return None
+        bus: 'Bus' = self._free.popleft()
+        self.idle_minutes[bus.number] += current_time - self._since[bus.number]
+        self._since[bus.number] = current_time
+        self._in_service[bus.number] = True
+        return bus
+
+    def release(self, bus: 'Bus', current_time: int) -> None:
+        """
+        Возвращает автобус в депо.
+
+        Args:
+            bus (Bus): Освободившийся автобус.
+            current_time (int): Текущее время в минутах.
+        """
+        self.service_minutes[bus.number] += current_time - self._since[bus.number]
+        self._since[bus.number] = current_time
+        self._in_service[bus.number] = False
+        self._free.append(bus)
+
+    def close(self, current_time: int) -> None:
+        """
+        Учитывает в счётчиках время с последней смены состояния до конца симуляции.
+
+        Args:
+            current_time (int): Минута окончания симуляции.
+        """
+        elapsed: np.ndarray = current_time - self._since
+        self.service_minutes += np.where(self._in_service, elapsed, 0)
+        self.idle_minutes += np.where(self._in_service, 0, elapsed)
+        self._since[:] = current_time
+
+    def usage(self) -> 'pd.DataFrame':
+        """
+        Формирует таблицу использования автобусов.
+
+        Returns:
+            pd.DataFrame: Время в рейсе, время простоя в минутах и доля времени в рейсе для каждого автобуса.
+        """
+        return bus_usage_frame(self.service_minutes, self.idle_minutes)
+
+
+def bus_utilization(service_minutes: np.ndarray, idle_minutes: np.ndarray) -> np.ndarray:
+    """
+    Считает долю времени в рейсе каждого автобуса.
+
+    Args:
+        service_minutes (np.ndarray): Время в рейсе каждого автобуса в минутах (индекс - номер автобуса).
+        idle_minutes (np.ndarray): Время простоя каждого автобуса в депо в минутах (индекс - номер автобуса).
+
+    Returns:
+        np.ndarray: Доля времени в рейсе; 0 для автобусов без учтённого времени.
+    """
+    total: np.ndarray = service_minutes + idle_minutes
+    return np.divide(service_minutes, total, out=np.zeros(len(total), dtype=float), where=total > 0)
+
+
+def bus_usage_frame(service_minutes: np.ndarray, idle_minutes: np.ndarray) -> 'pd.DataFrame':
+    """
+    Формирует таблицу использования автобусов по счётчикам времени.
+
+    Args:
+        service_minutes (np.ndarray): Время в рейсе каждого автобуса в минутах (индекс - номер автобуса).
+        idle_minutes (np.ndarray): Время простоя каждого автобуса в депо в минутах (индекс - номер автобуса).
+
+    Returns:
+        pd.DataFrame: Время в рейсе, время простоя в минутах и доля времени в рейсе для каждого автобуса.
+    """
+    import pandas as pd
+
+    df: pd.DataFrame = pd.DataFrame({
+        "service_minutes": service_minutes,
+        "idle_minutes": idle_minutes,
+        "utilization": bus_utilization(service_minutes, idle_minutes),
+    })
+    df.index.name = "bus"
+    return df
@@ -0,0 +1,207 @@
+from typing import Any, Dict, List, Optional
+import json
+import time
+
+# Фазы симуляции
+PROFILE_TICK: str = "tick"
+PROFILE_MOVEMENT: str = "movement"
+PROFILE_REST: str = "rest"
+PROFILE_DISPATCH: str = "dispatch"
+PROFILE_PHASES: List[str] = [PROFILE_TICK, PROFILE_MOVEMENT, PROFILE_REST, PROFILE_DISPATCH]
+
+PHASE_TITLES: Dict[str, str] = {
+    PROFILE_TICK: "Минута целиком",
+    PROFILE_MOVEMENT: "Движение и перерывы",
+    PROFILE_REST: "Таймеры отдыха",
+    PROFILE_DISPATCH: "Диспетчеризация",
+}
+
+# Количество корзин гистограммы: в корзине i длительности меньше 2^i микросекунд,
+# но не меньше 2^(i-1); в последней корзине - все более долгие вызовы
+HISTOGRAM_BINS: int = 24
+
+
+class PhaseStats:
+    """
+    Накопленное время, количество вызовов и гистограмма длительностей одной фазы симуляции.
+
+    Attributes:
+        calls (int): Количество вызовов фазы.
+        total (float): Суммарное время в секундах.
+        max (float): Наибольшая длительность вызова в секундах.
+        histogram (List[int]): Количество вызовов по корзинам длительности (см. HISTOGRAM_BINS).
+    """
+
+    __slots__ = ("calls", "total", "max", "histogram")
+
+    def __init__(self) -> None:
+        """
+        Инициализирует пустую статистику.
+        """
+        self.calls: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.histogram: List[int] = [0] * HISTOGRAM_BINS
+
+    def add(self, seconds: float) -> None:
+        """
+        Учитывает один вызов фазы.
+
+        Args:
+            seconds (float): Длительность вызова в секундах.
+        """
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.histogram[min(int(seconds * 1_000_000).bit_length(), HISTOGRAM_BINS - 1)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Возвращает статистику в виде, сериализуемом в JSON.
+
+        Returns:
+            Dict[str, Any]: Количество вызовов, суммарное, среднее и наибольшее время и непустые корзины
+                гистограммы с верхней границей в микросекундах (None - без границы).
+        """
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total,
+            "mean_us": self.total / self.calls * 1_000_000 if self.calls else 0.0,
+            "max_us": self.max * 1_000_000,
+            "histogram_us": [
+                [2 ** i if i < HISTOGRAM_BINS - 1 else None, count]
+                for i, count in enumerate(self.histogram) if count
+            ],
+        }
+
+
+class SimulationProfiler:
+    """
+    Встроенный профилировщик фаз симуляции.
+
+    Учитывает время и количество вызовов фаз: движение водителей (вместе с таймерами перерывов,
+    которые обновляются при обработке каждого водителя), таймеры отдыха между сменами в пуле водителей
+    и диспетчеризацию, а также время минуты целиком в пошаговых движках. В событийном движке вызовом фазы
+    считается обработка одного события. Отдельно считаются промахи диспетчеризации: запросы,
+    на которые get_driver не нашёл водителя, и запросы автобуса при пустом депо.
+
+    Профилировщик создаётся только по флагу profile функции simulate; без него цикл симуляции
+    выполняет лишь проверку на None в каждой фазе.
+
+    Attributes:
+        engine (str): Движок симуляции.
+        phases (Dict[str, PhaseStats]): Статистика по фазам (PROFILE_*).
+        dispatch_no_driver (int): Количество запросов диспетчеризации без свободного водителя.
+        dispatch_no_bus (int): Количество запросов диспетчеризации без свободного автобуса.
+        wall_time (float): Полное время симуляции в секундах.
+    """
+
+    def __init__(self, engine: str) -> None:
+        """
+        Инициализирует пустую статистику.
+
+        Args:
+            engine (str): Движок симуляции.
+        """
+        self.engine: str = engine
+        self.phases: Dict[str, PhaseStats] = {phase: PhaseStats() for phase in PROFILE_PHASES}
+        self.dispatch_no_driver: int = 0
+        self.dispatch_no_bus: int = 0
+        self.wall_time: float = 0.0
+        self._tick_start: float = 0.0
+        self._lap_start: float = 0.0
+        self._driver_misses: int = 0
+        self._bus_misses: int = 0
+
+    def start(self) -> None:
+        """
+        Отмечает начало минуты (или события) и первой фазы в ней.
+        """
+        self._tick_start = self._lap_start = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """
+        Учитывает время, прошедшее с конца предыдущей фазы, как вызов фазы phase.
+
+        Args:
+            phase (str): Фаза (PROFILE_*).
+        """
+        now: float = time.perf_counter()
+        self.phases[phase].add(now - self._lap_start)
+        self._lap_start = now
+
+    def finish(self) -> None:
+        """
+        Учитывает время минуты целиком.
+        """
+        self.phases[PROFILE_TICK].add(time.perf_counter() - self._tick_start)
+
+    def start_dispatch(self, driver_misses: int, bus_misses: int) -> None:
+        """
+        Запоминает счётчики промахов пулов перед диспетчеризацией.
+
+        Args:
+            driver_misses (int): Счётчик промахов пула водителей (DriverPool.misses).
+            bus_misses (int): Счётчик промахов пула автобусов (BusPool.misses).
+        """
+        self._driver_misses = driver_misses
+        self._bus_misses = bus_misses
+
+    def end_dispatch(self, driver_misses: int, bus_misses: int) -> None:
+        """
+        Учитывает время диспетчеризации и промахи пулов, случившиеся во время неё.
+
+        Args:
+            driver_misses (int): Счётчик промахов пула водителей (DriverPool.misses).
+            bus_misses (int): Счётчик промахов пула автобусов (BusPool.misses).
+        """
+        self.lap(PROFILE_DISPATCH)
+        self.dispatch_no_driver += driver_misses - self._driver_misses
+        self.dispatch_no_bus += bus_misses - self._bus_misses
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Возвращает результаты профилирования в виде, сериализуемом в JSON.
+
+        Returns:
+            Dict[str, Any]: Движок, полное время, статистика вызванных фаз и промахи диспетчеризации.
+        """
+        return {
+            "engine": self.engine,
+            "wall_time_seconds": self.wall_time,
+            "phases": {phase: stats.to_dict() for phase, stats in self.phases.items() if stats.calls},
+            "dispatch_misses": {"no_driver": self.dispatch_no_driver, "no_bus": self.dispatch_no_bus},
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет результаты профилирования в JSON-файл.
+
+        Args:
+            path (str): Путь к файлу.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+
+    def report(self) -> str:
+        """
+        Формирует текстовый отчёт для вывода вместе с итогами симуляции.
+
+        Returns:
+            str: Отчёт: время и доля каждой фазы, среднее и наибольшее время вызова, промахи диспетчеризации.
+        """
+        lines: List[str] = [f"Профиль симуляции (движок {self.engine}, {self.wall_time:.3f} с):"]
+        for phase, stats in self.phases.items():
+            if not stats.calls:
+                continue
+            share: Optional[float] = stats.total / self.wall_time if self.wall_time else None
+            lines.append(
+                f"  {PHASE_TITLES[phase]:<20} {stats.total:8.3f} с"
+                f"{f' ({share:5.1%})' if share is not None else ''}, вызовов: {stats.calls},"
+                f" в среднем {stats.total / stats.calls * 1_000_000:.1f} мкс, максимум {stats.max * 1_000_000:.1f} мкс"
+            )
+        lines.append(
+            f"  Промахи диспетчеризации: нет водителя - {self.dispatch_no_driver}, нет автобуса - {self.dispatch_no_bus}"
+        )
+        return "\n".join(lines)
@@ -0,0 +1,318 @@
+from constants import *
+from genetic import (
+    DriverChromosome, DriverType, REQUIRED_DRIVERS, PATTERN_12H, STATE_BREAK, STATE_DRIVE, STATE_OFF
+)
+from typing import List, Optional, Tuple
+import numpy as np
+
+# Шаг сетки начала смен в минутах
+ROSTER_STEP: int = 30
+
+# Наибольшее количество проходов локального поиска
+MAX_LOCAL_SEARCH_ROUNDS: int = 20
+
+# Период графика 2/2 в днях
+CYCLE_12H: int = 4
+
+# Графики 2/2 12-часовых водителей: сдвиги графика PATTERN_12H на 0-3 дня
+PATTERNS_12H: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(PATTERN_12H[(day + offset) % CYCLE_12H] for day in range(DAYS_IN_WEEK)) for offset in range(CYCLE_12H)
+)
+
+
+class ShiftTemplate:
+    """
+    Шаблон недельной смены водителя.
+
+    Attributes:
+        driver_type (str): Тип водителя (DriverType.H8 или DriverType.H12).
+        start (int): Минута начала смены от начала суток.
+        days (Tuple[int, ...]): Рабочие дни недели.
+        drive (np.ndarray): Минуты недели, в которые водитель на смене (без учёта перерыва 12-часовых водителей).
+    """
+
+    def __init__(self, driver_type: str, start: int, days: Tuple[int, ...]) -> None:
+        """
+        Строит маску смены по типу водителя, началу смены и рабочим дням.
+
+        8-часовой водитель работает 8 часов подряд, после чего следует час перерыва;
+        12-часовой водитель находится на смене 12 часов, перерыв внутри смены назначается позже.
+
+        Args:
+            driver_type (str): Тип водителя.
+            start (int): Минута начала смены от начала суток.
+            days (Tuple[int, ...]): Рабочие дни недели.
+        """
+        self.driver_type: str = driver_type
+        self.start: int = start
+        self.days: Tuple[int, ...] = days
+        length: int = SHIFT_DURATION_8H if driver_type == DriverType.H8 else SHIFT_DURATION_12H
+        self.drive: np.ndarray = np.zeros(MINUTES_PER_WEEK, dtype=bool)
+        for day in days:
+            day_start: int = day * MINUTES_PER_DAY + start
+            self.drive[day_start:day_start + length] = True
+
+    def states(self, coverage: np.ndarray) -> np.ndarray:
+        """
+        Возвращает состояния водителя по минутам недели.
+
+        У 12-часового водителя в каждый рабочий день выбирается непрерывный час перерыва,
+        начинающийся между 4 и 7 часами от начала смены, в который на линии больше всего лишних водителей.
+
+        Args:
+            coverage (np.ndarray): Количество водителей на линии по минутам недели с учётом этого водителя.
+
+        Returns:
+            np.ndarray: Состояния по минутам недели (STATE_*), uint8.
+        """
+        states: np.ndarray = np.where(self.drive, STATE_DRIVE, STATE_OFF).astype(np.uint8)
+        if self.driver_type == DriverType.H8:
+            for day in self.days:
+                break_start: int = day * MINUTES_PER_DAY + self.start + SHIFT_DURATION_8H
+                states[break_start:break_start + MINUTES_PER_HOUR] = STATE_BREAK
+            return states
+
+        surplus: np.ndarray = (coverage > REQUIRED_DRIVERS).astype(np.int64)
+        for day in self.days:
+            first: int = day * MINUTES_PER_DAY + self.start + WORKING_TIME_THRESHOLD_12H_FIRST
+            last: int = day * MINUTES_PER_DAY + self.start + WORKING_TIME_THRESHOLD_12H_SECOND
+            window: np.ndarray = np.convolve(
+                surplus[first:last + GA_MIN_BREAK_12H], np.ones(GA_MIN_BREAK_12H, dtype=np.int64), mode="valid"
+            )
+            break_start = first + int(np.argmax(window))
+            states[break_start:break_start + GA_MIN_BREAK_12H] = STATE_BREAK
+        return states
+
+
+def shift_templates(step: int = ROSTER_STEP) -> List[ShiftTemplate]:
+    """
+    Перечисляет допустимые шаблоны смен.
+
+    8-часовые водители работают по будням, смена с перерывом укладывается в промежуток с 6:00 до 22:00.
+    12-часовые водители работают по одному из сдвигов графика 2/2, смена укладывается в сутки.
+
+    Args:
+        step (int, optional): Шаг сетки начала смен в минутах. По умолчанию ROSTER_STEP.
+
+    Returns:
+        List[ShiftTemplate]: Шаблоны смен.
+    """
+    weekdays: Tuple[int, ...] = tuple(range(5))
+    earliest_8h: int = GA_NIGHT_END_HOUR * MINUTES_PER_HOUR
+    latest_8h: int = GA_NIGHT_START_HOUR * MINUTES_PER_HOUR - SHIFT_DURATION_8H - MINUTES_PER_HOUR
+    templates: List[ShiftTemplate] = [
+        ShiftTemplate(DriverType.H8, start, weekdays) for start in range(earliest_8h, latest_8h + 1, step)
+    ]
+    for pattern in PATTERNS_12H:
+        days: Tuple[int, ...] = tuple(day for day, works in enumerate(pattern) if works)
+        templates.extend(
+            ShiftTemplate(DriverType.H12, start, days)
+            for start in range(0, MINUTES_PER_DAY - SHIFT_DURATION_12H + 1, step)
+        )
+    return templates
+
+
+def _coverage(states: List[np.ndarray]) -> np.ndarray:
+    """
+    Считает количество водителей на линии по минутам недели.
+
+    Args:
+        states (List[np.ndarray]): Состояния водителей.
+
+    Returns:
+        np.ndarray: Количество водителей на линии.
+    """
+    coverage: np.ndarray = np.zeros(MINUTES_PER_WEEK, dtype=np.int64)
+    for driver_states in states:
+        coverage += driver_states == STATE_DRIVE
+    return coverage
+
+
+def _shortage(coverage: np.ndarray) -> int:
+    """
+    Считает суммарную нехватку водителей на линии.
+
+    Args:
+        coverage (np.ndarray): Количество водителей на линии по минутам недели.
+
+    Returns:
+        int: Суммарная нехватка в водителе-минутах.
+    """
+    return int(np.maximum(REQUIRED_DRIVERS - coverage, 0).sum())
+
+
+def _place(template: ShiftTemplate, coverage: np.ndarray) -> np.ndarray:
+    """
+    Возвращает состояния водителя по шаблону, добавляемого к водителям с заданным покрытием.
+
+    Args:
+        template (ShiftTemplate): Шаблон смены.
+        coverage (np.ndarray): Количество водителей на линии без этого водителя.
+
+    Returns:
+        np.ndarray: Состояния водителя.
+    """
+    return template.states(coverage + template.drive)
+
+
+def _greedy_cover(
+        templates: List[ShiftTemplate],
+        drives: np.ndarray,
+        roster: List[int],
+        states: List[np.ndarray]
+) -> None:
+    """
+    Добавляет водителей, пока очередной водитель окупает свою стоимость покрытием нехватки.
+
+    На каждом шаге выбирается шаблон, закрывающий больше всего минут с нехваткой водителей;
+    при равенстве - первый в списке шаблонов.
+
+    Args:
+        templates (List[ShiftTemplate]): Шаблоны смен.
+        drives (np.ndarray): Маски смен шаблонов, форма (шаблоны, минуты).
+        roster (List[int]): Индексы шаблонов водителей, дополняется на месте.
+        states (List[np.ndarray]): Состояния водителей, дополняются на месте.
+    """
+    coverage: np.ndarray = _coverage(states)
+    while True:
+        gains: np.ndarray = drives @ (REQUIRED_DRIVERS > coverage).astype(np.int64)
+        best: int = int(np.argmax(gains))
+        if COVERAGE_PENALTY * gains[best] <= COST_PER_DRIVER:
+            return
+        driver_states: np.ndarray = _place(templates[best], coverage)
+        new_coverage: np.ndarray = coverage + (driver_states == STATE_DRIVE)
+        if COVERAGE_PENALTY * (_shortage(coverage) - _shortage(new_coverage)) <= COST_PER_DRIVER:
+            return
+        roster.append(best)
+        states.append(driver_states)
+        coverage = new_coverage
+
+
+def _local_search(
+        templates: List[ShiftTemplate],
+        drives: np.ndarray,
+        roster: List[int],
+        states: List[np.ndarray]
+) -> bool:
+    """
+    Улучшает состав водителей: удаляет водителей, без которых нехватка растёт меньше их стоимости,
+    и переводит водителей на шаблон того же типа, уменьшающий нехватку.
+
+    Args:
+        templates (List[ShiftTemplate]): Шаблоны смен.
+        drives (np.ndarray): Маски смен шаблонов, форма (шаблоны, минуты).
+        roster (List[int]): Индексы шаблонов водителей, изменяется на месте.
+        states (List[np.ndarray]): Состояния водителей, изменяются на месте.
+
+    Returns:
+        bool: Было ли найдено улучшение.
+    """
+    improved: bool = False
+    coverage: np.ndarray = _coverage(states)
+    for i in reversed(range(len(roster))):
+        without: np.ndarray = coverage - (states[i] == STATE_DRIVE)
+        if COVERAGE_PENALTY * (_shortage(without) - _shortage(coverage)) < COST_PER_DRIVER:
+            del roster[i], states[i]
+            coverage = without
+            improved = True
+
+    types: np.ndarray = np.array([template.driver_type for template in templates])
+    for i in range(len(roster)):
+        without = coverage - (states[i] == STATE_DRIVE)
+        current: int = _shortage(coverage)
+        # Кандидаты - шаблоны того же типа, закрывающие больше всего минут с нехваткой
+        gains: np.ndarray = drives @ (REQUIRED_DRIVERS > without).astype(np.int64)
+        gains[types != templates[roster[i]].driver_type] = -1
+        for candidate in np.argsort(-gains, kind="stable")[:5].tolist():
+            if candidate == roster[i]:
+                continue
+            candidate_states: np.ndarray = _place(templates[candidate], without)
+            candidate_coverage: np.ndarray = without + (candidate_states == STATE_DRIVE)
+            if _shortage(candidate_coverage) < current:
+                roster[i], states[i] = candidate, candidate_states
+                coverage = candidate_coverage
+                improved = True
+                break
+    return improved
+
+
+def assign_buses(states: List[np.ndarray], n_of_buses: int = GA_NUM_BUSES) -> List[int]:
+    """
+    Закрепляет за водителями автобусы так, чтобы водители одного автобуса не работали одновременно.
+
+    Водители перебираются по убыванию количества минут работы, каждому назначается первый автобус,
+    на котором его смены не пересекаются со сменами уже назначенных водителей;
+    если такого нет - автобус с наименьшим пересечением.
+
+    Args:
+        states (List[np.ndarray]): Состояния водителей по минутам недели.
+        n_of_buses (int, optional): Количество автобусов. По умолчанию GA_NUM_BUSES.
+
+    Returns:
+        List[int]: Номер автобуса каждого водителя.
+    """
+    usage: np.ndarray = np.zeros((n_of_buses, MINUTES_PER_WEEK), dtype=np.int64)
+    bus_ids: List[int] = [0] * len(states)
+    drive_minutes: List[int] = [int((driver_states == STATE_DRIVE).sum()) for driver_states in states]
+    for i in sorted(range(len(states)), key=lambda k: -drive_minutes[k]):
+        drive: np.ndarray = states[i] == STATE_DRIVE
+        overlaps: np.ndarray = usage @ drive.astype(np.int64)
+        bus_id: int = int(np.argmin(overlaps))
+        usage[bus_id] += drive
+        bus_ids[i] = bus_id
+    return bus_ids
+
+
+def solve_roster(
+        step: int = ROSTER_STEP,
+        n_of_buses: int = GA_NUM_BUSES,
+        n_max_drivers: Optional[int] = None
+) -> List[DriverChromosome]:
+    """
+    Составляет недельное расписание водителей, покрывающее требуемое количество водителей на линии,
+    без генетического алгоритма.
+
+    Жадный алгоритм покрытия множества добавляет смены из допустимых шаблонов (см. shift_templates),
+    пока каждая новая смена окупает стоимость водителя, затем локальный поиск удаляет лишних водителей
+    и переносит смены. Оба шага повторяются, пока расписание улучшается. Перерывы 12-часовых водителей
+    ставятся на минуты с лишними водителями, автобусы назначаются без одновременной работы на одном автобусе.
+    Алгоритм не использует случайные числа и возвращает одно и то же расписание при одинаковых параметрах.
+
+    Args:
+        step (int, optional): Шаг сетки начала смен в минутах. По умолчанию ROSTER_STEP.
+        n_of_buses (int, optional): Количество автобусов. По умолчанию GA_NUM_BUSES.
+        n_max_drivers (Optional[int], optional): Дополнить расписание неактивными водителями до этого количества,
+            чтобы сравнивать его с особями генетического алгоритма того же размера.
+
+    Returns:
+        List[DriverChromosome]: Расписания водителей; Individual.from_drivers строит из них особь
+            для evaluate_individual и build_schedule_table.
+
+    Raises:
+        ValueError: Если шаг сетки не положителен или водителей больше, чем n_max_drivers.
+    """
+    if step <= 0:
+        raise ValueError(f"Шаг сетки начала смен должен быть положительным: {step}")
+
+    templates: List[ShiftTemplate] = shift_templates(step)
+    drives: np.ndarray = np.array([template.drive for template in templates], dtype=np.int64)
+    roster: List[int] = []
+    states: List[np.ndarray] = []
+    for _ in range(MAX_LOCAL_SEARCH_ROUNDS):
+        _greedy_cover(templates, drives, roster, states)
+        if not _local_search(templates, drives, roster, states):
+            break
+    _greedy_cover(templates, drives, roster, states)
+
+    drivers: List[DriverChromosome] = [
+        DriverChromosome(templates[template].driver_type, bus_id, driver_states)
+        for template, driver_states, bus_id in zip(roster, states, assign_buses(states, n_of_buses))
+    ]
+    if n_max_drivers is not None:
+        if len(drivers) > n_max_drivers:
+            raise ValueError(f"Для покрытия требуется {len(drivers)} водителей, больше чем {n_max_drivers}")
+        drivers.extend(
+            DriverChromosome(DriverType.H8, 0, active=False) for _ in range(n_max_drivers - len(drivers))
+        )
+    return drivers
+
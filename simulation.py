@@ -1,11 +1,17 @@
 from constants import *
-from datetime import timedelta
+from config import SimulationConfig
 from models import BusDriver
 from drivers_movement import drivers_movement
 from get_and_check_drivers import check_drivers
-from typing import List
+from typing import List, Optional
+import random
 from initialization import initialize
-import pandas as pd
+from pools import BusPool, DriverPool, bus_utilization
+from event_log import EventLog
+from event_engine import EventEngine, RouteState
+from fleet_state import FleetState
+from profiler import SimulationProfiler, PROFILE_MOVEMENT, PROFILE_REST
+import time
 
 
 def simulate_time(
@@ -14,12 +20,14 @@ def simulate_time(
         n_of_buses: int,
         n_of_drivers_eight_shift: int,
         n_of_drivers_twelve_shift: int,
-) -> pd.DataFrame:
+        engine: str = "tick",
+        seed: Optional[int] = None,
+        profile: bool = False
+) -> EventLog:
     """
     Симулирует работу системы автобусов за заданный период времени.
 
-    Эта функция инициализирует станции, автобусы и водителей, затем запускает цикл симуляции,
-    обновляя состояния водителей и автобусов каждую минуту.
+    Собирает из параметров конфигурацию сценария и запускает simulate.
 
     Args:
         simulation_duration (int): Продолжительность симуляции в минутах.
@@ -27,60 +35,170 @@ def simulate_time(
         n_of_buses (int): Количество автобусов в прямом направлении.
         n_of_drivers_eight_shift (int): Количество водителей с 8-часовыми сменами.
         n_of_drivers_twelve_shift (int): Количество водителей с 12-часовыми сменами.
+        engine (str, optional): Движок симуляции: "tick", "event" или "vector". По умолчанию "tick".
+        seed (Optional[int], optional): Зерно генератора случайных чисел для имён водителей.
+            По умолчанию используется глобальный генератор модуля random.
+        profile (bool, optional): Профилировать ли фазы симуляции (см. simulate). По умолчанию False.
 
     Returns:
-        pd.DataFrame: DataFrame с состояниями водителей на протяжении симуляции.
+        EventLog: Журнал событий симуляции; таблица состояний водителей строится методом to_frame.
+
+    Raises:
+        ValueError: Если указан неизвестный движок симуляции или некорректные параметры.
     """
-    # Инициализация станций, автобусов и водителей
-    stations, buses, drivers = initialize(
-        n_of_stations,
-        n_of_buses,
-        n_of_drivers_eight_shift,
-        n_of_drivers_twelve_shift
+    config: SimulationConfig = SimulationConfig(
+        simulation_duration=simulation_duration,
+        n_of_stations=n_of_stations,
+        n_of_buses=n_of_buses,
+        n_of_drivers_eight_shift=n_of_drivers_eight_shift,
+        n_of_drivers_twelve_shift=n_of_drivers_twelve_shift
     )
+    return simulate(config, engine=engine, seed=seed, profile=profile)
 
-    active_drivers: List['BusDriver'] = []
-    finished_drivers: List['BusDriver'] = []
-    drivers_on_lunch: List['BusDriver'] = []
-    df: pd.DataFrame = pd.DataFrame(columns=[PLACEHOLDER_COLUMN], dtype=object)
-    df.index.name = "Time_index"
-    current_time: timedelta = timedelta(hours=SIMULATION_START_HOURS)
-    simulation_end: timedelta = timedelta(minutes=simulation_duration) + current_time
 
-    last_dispatch_time_direct: timedelta = INITIAL_DISPATCH_TIME
-    last_dispatch_time_reverse: timedelta = INITIAL_DISPATCH_TIME
+def simulate(
+        config: SimulationConfig,
+        engine: str = "tick",
+        seed: Optional[int] = None,
+        profile: bool = False
+) -> EventLog:
+    """
+    Симулирует работу системы автобусов по конфигурации сценария.
+
+    Эта функция инициализирует станции, автобусы и водителей, затем запускает цикл симуляции.
+    Пошаговый движок ("tick") обновляет состояния водителей и автобусов каждую минуту,
+    событийный движок ("event") переходит сразу от одного события к следующему,
+    векторный движок ("vector") делает тот же поминутный шаг операциями над массивами NumPy
+    (на парках этой модели он не быстрее пошагового, см. FleetState).
+    Все движки дают одинаковый результат.
+
+    Всё состояние прогона создаётся внутри функции, а параметры берутся только из config,
+    поэтому несколько сценариев можно выполнять одновременно в потоках или процессах.
 
-    while current_time < simulation_end:
+    С флагом profile встроенный профилировщик (SimulationProfiler) учитывает время и количество вызовов
+    фаз движения, таймеров отдыха и диспетчеризации, гистограммы их длительностей и промахи диспетчеризации.
+    Профиль сохраняется в атрибут profile журнала событий и выводится вместе с итогами симуляции.
+    Результат симуляции от флага не зависит.
+
+    Args:
+        config (SimulationConfig): Параметры сценария.
+        engine (str, optional): Движок симуляции: "tick", "event" или "vector". По умолчанию "tick".
+        seed (Optional[int], optional): Зерно генератора случайных чисел для имён водителей.
+            По умолчанию используется глобальный генератор модуля random.
+        profile (bool, optional): Профилировать ли фазы симуляции. По умолчанию False.
+
+    Returns:
+        EventLog: Журнал событий симуляции; таблица состояний водителей строится методом to_frame.
+
+    Raises:
+        ValueError: Если указан неизвестный движок симуляции.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Неизвестный движок симуляции: {engine}")
 
-        # Обновление состояний водителей и автобусов
-        df = drivers_movement(
+    # Инициализация станций, автобусов и водителей
+    stations, buses, drivers = initialize(config, random.Random(seed) if seed is not None else None)
+
+    active_drivers: List['BusDriver'] = []
+    driver_pool: DriverPool = DriverPool(drivers)
+    drivers_on_lunch: List['BusDriver'] = []
+    current_time: int = config.start_minute
+    bus_pool: BusPool = BusPool(buses, current_time)
+    simulation_end: int = config.end_minute
+    event_log: EventLog = EventLog(current_time, simulation_end)
+    profiler: Optional[SimulationProfiler] = SimulationProfiler(engine) if profile else None
+    started_at: float = time.perf_counter()
+
+    if engine == "event":
+        route: RouteState = RouteState(
+            index=0,
+            config=config,
             active_drivers=active_drivers,
-            finished_drivers=finished_drivers,
+            driver_pool=driver_pool,
             drivers_on_lunch=drivers_on_lunch,
-            buses=buses,
-            df=df,
-            current_time=current_time
+            bus_pool=bus_pool,
+            event_log=event_log
         )
+        EventEngine(routes=[route], profiler=profiler).run()
+    else:
+        last_dispatch_time_direct: int = INITIAL_DISPATCH_TIME
+        last_dispatch_time_reverse: int = INITIAL_DISPATCH_TIME
+        fleet: Optional[FleetState] = None
+        if engine == "vector":
+            fleet = FleetState(
+                config=config,
+                active_drivers=active_drivers,
+                driver_pool=driver_pool,
+                drivers_on_lunch=drivers_on_lunch,
+                bus_pool=bus_pool,
+                event_log=event_log
+            )
 
-        if finished_drivers:
-            for driver in finished_drivers:
-                driver.between_shifts_time -= TIME_INCREMENT
-                driver.update_day_off()
+        while current_time < simulation_end:
+            if profiler is not None:
+                profiler.start()
 
-        # Диспетчеризация новых водителей
-        last_dispatch_time_direct, last_dispatch_time_reverse = check_drivers(
-            current_time=current_time,
-            finished_drivers=finished_drivers,
-            active_drivers=active_drivers,
-            drivers=drivers,
-            buses=buses,
-            last_dispatch_time_direct=last_dispatch_time_direct,
-            last_dispatch_time_reverse=last_dispatch_time_reverse
-        )
+            # Обновление состояний водителей и автобусов
+            if fleet is not None:
+                fleet.step(current_time)
+            else:
+                drivers_movement(
+                    config=config,
+                    active_drivers=active_drivers,
+                    driver_pool=driver_pool,
+                    drivers_on_lunch=drivers_on_lunch,
+                    bus_pool=bus_pool,
+                    event_log=event_log,
+                    current_time=current_time
+                )
+
+            if profiler is not None:
+                profiler.lap(PROFILE_MOVEMENT)
+                # Таймеры отдыха иначе проверяются внутри диспетчеризации при запросе водителя
+                driver_pool.wake(current_time)
+                profiler.lap(PROFILE_REST)
+                profiler.start_dispatch(driver_pool.misses, bus_pool.misses)
+
+            # Диспетчеризация новых водителей
+            last_dispatch_time_direct, last_dispatch_time_reverse = check_drivers(
+                config=config,
+                current_time=current_time,
+                driver_pool=driver_pool,
+                active_drivers=active_drivers,
+                bus_pool=bus_pool,
+                last_dispatch_time_direct=last_dispatch_time_direct,
+                last_dispatch_time_reverse=last_dispatch_time_reverse
+            )
+
+            if profiler is not None:
+                profiler.end_dispatch(driver_pool.misses, bus_pool.misses)
+                profiler.finish()
+
+            # Увеличиваем текущее время на одну минуту
+            current_time += TIME_INCREMENT
+
+        if fleet is not None:
+            fleet.flush()
 
-        # Увеличиваем текущее время на одну минуту
-        current_time += TIME_INCREMENT
+    bus_pool.close(simulation_end)
+    event_log.set_bus_usage(bus_pool.service_minutes, bus_pool.idle_minutes)
+    event_log.stats = {
+        "drivers_used": len(event_log.driver_names),
+        "missed_no_driver": driver_pool.misses,
+        "missed_no_bus": bus_pool.misses,
+        "bus_service_minutes": int(bus_pool.service_minutes.sum()),
+        "bus_idle_minutes": int(bus_pool.idle_minutes.sum()),
+        "bus_utilization": (
+            float(bus_utilization(bus_pool.service_minutes, bus_pool.idle_minutes).mean())
+            if bus_pool.fleet_size else 0.0
+        ),
+    }
 
     print("Симуляция завершена.")
-    print("Всего водителей:", len(active_drivers) + len(finished_drivers))
-    return df
+    print("Всего водителей:", len(active_drivers) + driver_pool.finished_count)
+    print(f"Загрузка автобусов: {event_log.stats['bus_utilization']:.1%}")
+    if profiler is not None:
+        profiler.wall_time = time.perf_counter() - started_at
+        event_log.profile = profiler
+        print(profiler.report())
+    return event_log
@@ -0,0 +1,250 @@
+from event_log import EventLog, EVENT_COLUMNS
+from typing import Any, Dict
+import importlib
+import importlib.util
+import json
+import os
+import struct
+import zipfile
+import numpy as np
+
+# Форматы файлов результатов по расширению
+FORMAT_PARQUET: str = "parquet"
+FORMAT_FEATHER: str = "feather"
+FORMAT_NPZ: str = "npz"
+
+SUFFIXES: Dict[str, str] = {
+    ".parquet": FORMAT_PARQUET,
+    ".feather": FORMAT_FEATHER,
+    ".arrow": FORMAT_FEATHER,
+    ".npz": FORMAT_NPZ,
+}
+
+# Ключ метаданных в схеме Arrow и имя массива метаданных в архиве .npz
+METADATA_KEY: str = "busschedule"
+
+# Размер локального заголовка файла в ZIP-архиве без имени и дополнительного поля
+ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+def pyarrow_available() -> bool:
+    """
+    Проверяет, установлен ли pyarrow, не импортируя его.
+
+    Returns:
+        bool: True, если pyarrow доступен, иначе False.
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def default_suffix() -> str:
+    """
+    Возвращает расширение файла результатов по умолчанию.
+
+    Returns:
+        str: ".parquet", если установлен pyarrow, иначе ".npz".
+    """
+    return ".parquet" if pyarrow_available() else ".npz"
+
+
+def _format_of(path: str) -> str:
+    """
+    Определяет формат файла результатов по расширению.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        str: Формат файла (FORMAT_*).
+
+    Raises:
+        ValueError: Если расширение не поддерживается.
+    """
+    suffix: str = os.path.splitext(path)[1].lower()
+    if suffix not in SUFFIXES:
+        raise ValueError(f"Неподдерживаемый формат файла результатов: {path} (ожидается {', '.join(SUFFIXES)})")
+    return SUFFIXES[suffix]
+
+
+def _import_pyarrow(module: str) -> Any:
+    """
+    Импортирует модуль pyarrow, необходимый для форматов Parquet и Feather.
+
+    Args:
+        module (str): Имя модуля, например "pyarrow.parquet".
+
+    Returns:
+        Any: Импортированный модуль.
+
+    Raises:
+        ImportError: Если pyarrow не установлен.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        raise ImportError(
+            "Для форматов Parquet и Feather требуется pyarrow; установите его или сохраните результаты в .npz."
+        ) from error
+
+
+def _metadata(event_log: EventLog) -> Dict[str, Any]:
+    """
+    Собирает параметры журнала, которые не являются столбцами событий.
+
+    Args:
+        event_log (EventLog): Журнал событий.
+
+    Returns:
+        Dict[str, Any]: Метаданные, сериализуемые в JSON.
+    """
+    metadata: Dict[str, Any] = {
+        "start_minute": event_log.start_minute,
+        "end_minute": event_log.end_minute,
+        "driver_names": event_log.driver_names,
+        "driver_shifts": event_log.driver_shifts,
+        "stats": event_log.stats,
+    }
+    if event_log.bus_service_minutes is not None:
+        metadata["bus_service_minutes"] = event_log.bus_service_minutes.tolist()
+        metadata["bus_idle_minutes"] = event_log.bus_idle_minutes.tolist()
+    return metadata
+
+
+def _restore(metadata: Dict[str, Any], columns: Dict[str, np.ndarray]) -> EventLog:
+    """
+    Восстанавливает журнал событий по метаданным и столбцам.
+
+    Args:
+        metadata (Dict[str, Any]): Метаданные (см. _metadata).
+        columns (Dict[str, np.ndarray]): Столбцы событий.
+
+    Returns:
+        EventLog: Журнал событий.
+    """
+    event_log: EventLog = EventLog.from_columns(
+        metadata["start_minute"],
+        metadata["end_minute"],
+        metadata["driver_names"],
+        metadata["driver_shifts"],
+        columns
+    )
+    event_log.stats = dict(metadata.get("stats", {}))
+    if "bus_service_minutes" in metadata:
+        event_log.set_bus_usage(
+            np.asarray(metadata["bus_service_minutes"], dtype=np.int64),
+            np.asarray(metadata["bus_idle_minutes"], dtype=np.int64)
+        )
+    return event_log
+
+
+def save_event_log(event_log: EventLog, path: str) -> None:
+    """
+    Сохраняет журнал событий в столбцовом двоичном формате.
+
+    Формат выбирается по расширению: .parquet, .feather/.arrow (требуют pyarrow) или .npz.
+    Столбцы событий записываются как есть, имена водителей, параметры прогона, сводные показатели
+    и использование автобусов - в метаданные. Архив .npz записывается без сжатия,
+    чтобы при загрузке массивы можно было отобразить в память.
+
+    Args:
+        event_log (EventLog): Журнал событий.
+        path (str): Путь к файлу результатов.
+    """
+    file_format: str = _format_of(path)
+    columns: Dict[str, np.ndarray] = event_log.columns()
+    metadata: str = json.dumps(_metadata(event_log), ensure_ascii=False)
+
+    if file_format == FORMAT_NPZ:
+        np.savez(path, **columns, **{METADATA_KEY: np.array(metadata)})
+        return
+
+    pa = _import_pyarrow("pyarrow")
+    table = pa.table(columns).replace_schema_metadata({METADATA_KEY: metadata})
+    if file_format == FORMAT_PARQUET:
+        _import_pyarrow("pyarrow.parquet").write_table(table, path)
+    else:
+        # Feather без сжатия читается через отображение в память без копирования
+        _import_pyarrow("pyarrow.feather").write_feather(table, path, compression="uncompressed")
+
+
+def _memmap_npz_member(path: str, info: zipfile.ZipInfo) -> np.ndarray:
+    """
+    Отображает в память массив, хранящийся в архиве .npz без сжатия.
+
+    Args:
+        path (str): Путь к архиву.
+        info (zipfile.ZipInfo): Описание файла массива в архиве.
+
+    Returns:
+        np.ndarray: Массив только для чтения, отображённый в память.
+
+    Raises:
+        ValueError: Если заголовок массива записан в неподдерживаемой версии формата.
+    """
+    with open(path, "rb") as file:
+        file.seek(info.header_offset)
+        header = ZIP_LOCAL_HEADER.unpack(file.read(ZIP_LOCAL_HEADER.size))
+        name_length, extra_length = header[-2], header[-1]
+        file.seek(info.header_offset + ZIP_LOCAL_HEADER.size + name_length + extra_length)
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        else:
+            raise ValueError(f"Неподдерживаемая версия формата .npy: {version}")
+        offset: int = file.tell()
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape, order="F" if fortran_order else "C", offset=offset)
+
+
+def _load_npz(path: str, mmap: bool) -> EventLog:
+    """
+    Загружает журнал событий из архива .npz.
+
+    Args:
+        path (str): Путь к архиву.
+        mmap (bool): Отображать ли столбцы событий в память вместо чтения.
+
+    Returns:
+        EventLog: Журнал событий.
+    """
+    columns: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(path) as archive:
+        with archive.open(f"{METADATA_KEY}.npy") as member:
+            metadata: Dict[str, Any] = json.loads(np.lib.format.read_array(member, allow_pickle=False).item())
+        for name in EVENT_COLUMNS:
+            info: zipfile.ZipInfo = archive.getinfo(f"{name}.npy")
+            if mmap and info.compress_type == zipfile.ZIP_STORED and info.file_size > 0:
+                try:
+                    columns[name] = _memmap_npz_member(path, info)
+                    continue
+                except ValueError:
+                    # Пустые массивы и заголовки неизвестной версии читаются обычным образом
+                    pass
+            with archive.open(info) as member:
+                columns[name] = np.lib.format.read_array(member, allow_pickle=False)
+    return _restore(metadata, columns)
+
+
+def load_event_log(path: str, mmap: bool = True) -> EventLog:
+    """
+    Загружает журнал событий, сохранённый функцией save_event_log.
+
+    Args:
+        path (str): Путь к файлу результатов.
+        mmap (bool, optional): Отображать ли файл в память вместо чтения. По умолчанию True.
+
+    Returns:
+        EventLog: Журнал событий; по нему можно строить to_records и to_frame без повторной симуляции.
+    """
+    file_format: str = _format_of(path)
+    if file_format == FORMAT_NPZ:
+        return _load_npz(path, mmap)
+
+    if file_format == FORMAT_PARQUET:
+        table = _import_pyarrow("pyarrow.parquet").read_table(path, memory_map=mmap)
+    else:
+        table = _import_pyarrow("pyarrow.feather").read_table(path, memory_map=mmap)
+    metadata: Dict[str, Any] = json.loads(table.schema.metadata[METADATA_KEY.encode()])
+    columns: Dict[str, np.ndarray] = {name: table.column(name).to_numpy() for name in EVENT_COLUMNS}
+    return _restore(metadata, columns)
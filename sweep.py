@@ -0,0 +1,167 @@
+from constants import *
+from config import SimulationConfig
+from simulation import simulate, ENGINES
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+import argparse
+import contextlib
+import io
+import itertools
+import time
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def build_grid(
+        n_of_buses: Sequence[int],
+        n_of_drivers_eight_shift: Sequence[int],
+        n_of_drivers_twelve_shift: Sequence[int],
+        seeds: Sequence[int]
+) -> List[Dict[str, int]]:
+    """
+    Строит список сценариев как декартово произведение значений параметров.
+
+    Args:
+        n_of_buses (Sequence[int]): Варианты количества автобусов.
+        n_of_drivers_eight_shift (Sequence[int]): Варианты количества 8-часовых водителей.
+        n_of_drivers_twelve_shift (Sequence[int]): Варианты количества 12-часовых водителей.
+        seeds (Sequence[int]): Зёрна генератора случайных чисел.
+
+    Returns:
+        List[Dict[str, int]]: Параметры сценариев.
+    """
+    return [
+        {
+            "n_of_buses": buses,
+            "n_of_drivers_eight_shift": eight,
+            "n_of_drivers_twelve_shift": twelve,
+            "seed": seed,
+        }
+        for buses, eight, twelve, seed in itertools.product(
+            n_of_buses, n_of_drivers_eight_shift, n_of_drivers_twelve_shift, seeds
+        )
+    ]
+
+
+def run_scenario(
+        scenario: Dict[str, int],
+        simulation_duration: int = SIMULATION_DURATION,
+        n_of_stations: int = N_OF_STATIONS,
+        engine: str = "event"
+) -> Dict[str, Any]:
+    """
+    Выполняет один прогон симуляции и возвращает его сводные показатели.
+
+    Имена водителей перемешиваются генератором с зерном сценария, поэтому результат
+    не зависит от того, в каком процессе и в каком порядке выполняется прогон.
+
+    Args:
+        scenario (Dict[str, int]): Параметры сценария (см. build_grid).
+        simulation_duration (int, optional): Продолжительность симуляции в минутах.
+        n_of_stations (int, optional): Количество остановок.
+        engine (str, optional): Движок симуляции. По умолчанию "event".
+
+    Returns:
+        Dict[str, Any]: Параметры сценария и показатели прогона.
+    """
+    config: SimulationConfig = SimulationConfig(
+        simulation_duration=simulation_duration,
+        n_of_stations=n_of_stations,
+        n_of_buses=scenario["n_of_buses"],
+        n_of_drivers_eight_shift=scenario["n_of_drivers_eight_shift"],
+        n_of_drivers_twelve_shift=scenario["n_of_drivers_twelve_shift"]
+    )
+    start: float = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        event_log = simulate(config, engine=engine, seed=scenario["seed"])
+    stats: Dict[str, float] = event_log.stats
+    return {
+        **scenario,
+        **stats,
+        "uncovered_slots": stats["missed_no_driver"] + stats["missed_no_bus"],
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def run_sweep(
+        scenarios: Sequence[Dict[str, int]],
+        simulation_duration: int = SIMULATION_DURATION,
+        n_of_stations: int = N_OF_STATIONS,
+        engine: str = "event",
+        workers: Optional[int] = None
+) -> 'pd.DataFrame':
+    """
+    Выполняет прогоны симуляции для всех сценариев в пуле процессов.
+
+    Args:
+        scenarios (Sequence[Dict[str, int]]): Параметры сценариев (см. build_grid).
+        simulation_duration (int, optional): Продолжительность симуляции в минутах.
+        n_of_stations (int, optional): Количество остановок.
+        engine (str, optional): Движок симуляции. По умолчанию "event".
+        workers (Optional[int], optional): Количество процессов. По умолчанию по числу ядер;
+            при значении 1 прогоны выполняются в текущем процессе.
+
+    Returns:
+        pd.DataFrame: Таблица показателей, одна строка на сценарий в порядке scenarios.
+
+    Raises:
+        ValueError: Если указан неизвестный движок симуляции.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Неизвестный движок симуляции: {engine}")
+
+    n: int = len(scenarios)
+    args: List[Sequence[Any]] = [scenarios, [simulation_duration] * n, [n_of_stations] * n, [engine] * n]
+    if workers == 1:
+        rows: List[Dict[str, Any]] = list(map(run_scenario, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(run_scenario, *args))
+    # pandas нужен только для итоговой таблицы и импортируется после работы пула,
+    # поэтому процессы пула запускаются без него
+    import pandas as pd
+    return pd.DataFrame(rows)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Аргументы; по умолчанию sys.argv.
+
+    Returns:
+        argparse.Namespace: Разобранные аргументы.
+    """
+    parser = argparse.ArgumentParser(description="Перебор параметров парка автобусов и водителей.")
+    parser.add_argument("--buses", type=int, nargs="+", default=[N_OF_BUS], help="Количество автобусов")
+    parser.add_argument("--eight", type=int, nargs="+", default=[N_OF_DRIVERS_EIGHT_SHIFT],
+                        help="Количество 8-часовых водителей")
+    parser.add_argument("--twelve", type=int, nargs="+", default=[N_OF_DRIVERS_TWELVE_SHIFT],
+                        help="Количество 12-часовых водителей")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="Зёрна генератора случайных чисел")
+    parser.add_argument("--duration", type=int, default=SIMULATION_DURATION, help="Продолжительность в минутах")
+    parser.add_argument("--engine", choices=ENGINES, default="event", help="Движок симуляции")
+    parser.add_argument("--workers", type=int, default=None, help="Количество процессов")
+    parser.add_argument("--output", default=None, help="CSV-файл для сохранения результатов")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args: argparse.Namespace = parse_args(argv)
+    scenarios: List[Dict[str, int]] = build_grid(args.buses, args.eight, args.twelve, args.seeds)
+    results: 'pd.DataFrame' = run_sweep(
+        scenarios,
+        simulation_duration=args.duration,
+        engine=args.engine,
+        workers=args.workers
+    )
+    if args.output:
+        results.to_csv(args.output, index=False)
+        print(f"Результаты сохранены в файл: {args.output}")
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from config import SimulationConfig
+from event_log import EventLog
+from simulation import simulate
+import contextlib
+import io
+import pandas as pd
+import pytest
+
+SEEDS = (0, 1, 2)
+# Автобусов от явной нехватки (3) до избытка (12)
+FLEETS = (3, 6, 12)
+
+
+def run(config: SimulationConfig, engine: str, seed: int) -> EventLog:
+    """
+    Выполняет симуляцию без вывода итогов.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return simulate(config, engine=engine, seed=seed)
+
+
+def assert_same_result(engine: str, n_of_buses: int, seed: int) -> None:
+    """
+    Проверяет, что движок engine даёт тот же журнал и ту же таблицу состояний, что и пошаговый движок.
+    """
+    config: SimulationConfig = SimulationConfig(simulation_duration=4000, n_of_buses=n_of_buses)
+    expected: EventLog = run(config, "tick", seed)
+    actual: EventLog = run(config, engine, seed)
+    pd.testing.assert_frame_equal(actual.to_records(), expected.to_records())
+    pd.testing.assert_frame_equal(actual.to_frame(), expected.to_frame())
+    assert actual.stats == expected.stats
+
+
+@pytest.mark.parametrize("n_of_buses", FLEETS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_event_engine_matches_tick(n_of_buses: int, seed: int) -> None:
+    assert_same_result("event", n_of_buses, seed)
+
+
+@pytest.mark.parametrize("n_of_buses", FLEETS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_vector_engine_matches_tick(n_of_buses: int, seed: int) -> None:
+    assert_same_result("vector", n_of_buses, seed)
@@ -0,0 +1,51 @@
+from genetic import FitnessCache, Individual, crossover, evaluate_individual, mutate, random_individual
+import numpy as np
+import pytest
+
+N_MAX_DRIVERS: int = 12
+
+
+def cached_individual(rng: np.random.Generator) -> Individual:
+    """
+    Создаёт случайную особь с накопленными показателями штрафа.
+    """
+    individual: Individual = random_individual(N_MAX_DRIVERS, rng)
+    individual.cache = FitnessCache(individual)
+    return individual
+
+
+def assert_cache_matches(individual: Individual) -> None:
+    """
+    Проверяет, что штраф по накопленным показателям совпадает с полным пересчётом.
+    """
+    assert individual.cache.fitness() == pytest.approx(evaluate_individual(individual))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cache_matches_full_evaluation_after_crossover_and_mutate(seed: int) -> None:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    population = [cached_individual(rng) for _ in range(4)]
+    for individual in population:
+        assert_cache_matches(individual)
+    for _ in range(5):
+        children = []
+        for _ in range(len(population) // 2):
+            parent1, parent2 = rng.choice(len(population), size=2, replace=False).tolist()
+            children.extend(crossover(population[parent1], population[parent2], rng))
+        for child in children:
+            assert_cache_matches(child)
+            mutate(child, 0.01, rng)
+            assert_cache_matches(child)
+        population = children
+
+
+def test_mutating_copy_leaves_original_cache_unchanged() -> None:
+    rng: np.random.Generator = np.random.default_rng(0)
+    individual: Individual = cached_individual(rng)
+    fitness: float = individual.cache.fitness()
+    copy: Individual = individual.copy()
+    for _ in range(3):
+        mutate(copy, 0.01, rng)
+        assert_cache_matches(copy)
+    assert individual.cache.fitness() == fitness
+    assert_cache_matches(individual)
@@ -0,0 +1,32 @@
+from constants import *
+from config import SimulationConfig
+from help_functions import get_interval_table
+import constants
+import pytest
+
+# Понедельник, 7:00 - час пик
+PEAK_HOUR_OF_WEEK: int = 7
+
+
+def test_interval_table_follows_changed_calendar_constants(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    После изменения множителя часа пик таблица интервалов строится заново без сброса кэша.
+    """
+    intervals, _ = get_interval_table(N_OF_BUS, FLOAT_ROAD_TIME)
+    monkeypatch.setattr(constants, "PEAK_MULTIPLIER", 2 * constants.PEAK_MULTIPLIER)
+    changed, _ = get_interval_table(N_OF_BUS, FLOAT_ROAD_TIME)
+    assert changed[PEAK_HOUR_OF_WEEK] == pytest.approx(2 * intervals[PEAK_HOUR_OF_WEEK])
+    assert SimulationConfig().dispatch_intervals == changed
+    monkeypatch.undo()
+    assert get_interval_table(N_OF_BUS, FLOAT_ROAD_TIME)[0] == intervals
+
+
+def test_interval_table_follows_changed_peak_hours(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Перенос часов пик меняет интервалы выпуска в эти часы.
+    """
+    intervals, required = get_interval_table(N_OF_BUS, FLOAT_ROAD_TIME)
+    monkeypatch.setattr(constants, "PEAK_HOURS_MORNING_START", PEAK_HOUR_OF_WEEK + 1)
+    changed, changed_required = get_interval_table(N_OF_BUS, FLOAT_ROAD_TIME)
+    assert changed[PEAK_HOUR_OF_WEEK] > intervals[PEAK_HOUR_OF_WEEK]
+    assert changed_required[PEAK_HOUR_OF_WEEK] < required[PEAK_HOUR_OF_WEEK]
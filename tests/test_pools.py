@@ -0,0 +1,66 @@
+from constants import *
+from config import SimulationConfig
+from get_and_check_drivers import check_drivers
+from models import BusDriver
+from pools import BusPool, DriverPool
+from typing import List
+
+
+def make_drivers(config: SimulationConfig, count: int) -> List[BusDriver]:
+    """
+    Создаёт 8-часовых водителей с именами "0", "1", ...
+    """
+    return [BusDriver(name=str(i), shift_duration=SHIFT_DURATION_8H, bus=None, config=config) for i in range(count)]
+
+
+def test_put_back_returns_fresh_driver_to_head_of_queue() -> None:
+    """
+    Водитель, ещё не выходивший на смену, возвращается в начало очереди.
+    """
+    drivers: List[BusDriver] = make_drivers(SimulationConfig(), 2)
+    pool: DriverPool = DriverPool(drivers)
+    driver = pool.acquire(SHIFT_DURATION_8H, 0)
+    pool.put_back(driver)
+    assert pool.acquire(SHIFT_DURATION_8H, 0) is drivers[0]
+    assert pool.acquire(SHIFT_DURATION_8H, 0) is drivers[1]
+    assert pool.misses == 0
+
+
+def test_put_back_returns_rested_driver_before_later_ones() -> None:
+    """
+    Отдохнувший водитель возвращается на своё место среди отдохнувших, счётчик завершивших смену восстанавливается.
+    """
+    drivers: List[BusDriver] = make_drivers(SimulationConfig(), 2)
+    pool: DriverPool = DriverPool([])
+    for driver in drivers:
+        pool.release(driver, 0)
+    ready_at: int = BETWEEN_SHIFTS_TIME
+    driver = pool.acquire(SHIFT_DURATION_8H, ready_at)
+    assert driver is drivers[0]
+    pool.put_back(driver)
+    assert pool.finished_count == 2
+    assert pool.acquire(SHIFT_DURATION_8H, ready_at) is drivers[0]
+    assert pool.acquire(SHIFT_DURATION_8H, ready_at) is drivers[1]
+
+
+def test_check_drivers_keeps_driver_without_bus_in_pool() -> None:
+    """
+    Водитель, которому не хватило автобуса, не выпадает из пула до конца симуляции.
+    """
+    config: SimulationConfig = SimulationConfig(n_of_drivers_eight_shift=4, n_of_drivers_twelve_shift=0)
+    drivers: List[BusDriver] = make_drivers(config, 4)
+    driver_pool: DriverPool = DriverPool(drivers)
+    bus_pool: BusPool = BusPool([], config.start_minute)
+    active_drivers: List[BusDriver] = []
+    check_drivers(
+        config=config,
+        current_time=config.start_minute,
+        driver_pool=driver_pool,
+        active_drivers=active_drivers,
+        bus_pool=bus_pool,
+        last_dispatch_time_direct=INITIAL_DISPATCH_TIME,
+        last_dispatch_time_reverse=INITIAL_DISPATCH_TIME
+    )
+    assert active_drivers == []
+    assert bus_pool.misses > 0
+    assert [driver_pool.acquire(SHIFT_DURATION_8H, config.start_minute) for _ in drivers] == drivers
@@ -0,0 +1,28 @@
+from config import SimulationConfig
+from simulation import simulate
+from to_excel import excel_schedule
+from openpyxl import load_workbook
+from pathlib import Path
+import contextlib
+import io
+
+
+def test_excel_schedule_styles_driver_sheets(tmp_path: Path) -> None:
+    """
+    Листы водителей получают толстые границы групп и выравнивание заголовка через именованные стили.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        event_log = simulate(SimulationConfig(simulation_duration=1500), engine="event", seed=0)
+    schedule = event_log.to_records()
+    output: Path = tmp_path / "schedule.xlsx"
+    excel_schedule(schedule, str(output))
+
+    workbook = load_workbook(output)
+    assert workbook.sheetnames == ["Итоги"] + list(schedule["driver"].cat.categories)
+    sheet = workbook.worksheets[1]
+    assert sheet["A1"].border.left.style == "thick"
+    assert sheet["A1"].border.top.style == "thick"
+    assert sheet["A1"].alignment.horizontal == "center"
+    assert sheet["C3"].border.left.style == "thick"
+    assert sheet["D3"].border.left.style is None
+    assert "A1:A2" in {str(cells) for cells in sheet.merged_cells.ranges}
@@ -1,237 +1,339 @@
+from constants import *
+from event_log import format_time, render_action, render_bus, render_shift
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.styles import Border, Side, Alignment
-from typing import List, Tuple, Dict, Any
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border, Side, Alignment, NamedStyle, DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+from typing import Iterator, List, Tuple, Dict, Any, Optional, Sequence, Set
 
+DAYS_OF_WEEK: List[str] = ["Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье"]
+DAY_COLUMNS: List[str] = ["Автобус", "Время", "Действие"]
+DAYS_START_COL: int = 3
+HEADER_ROWS: int = 2
 
-def auto_adjust_column_width(sheet: Worksheet, padding: int = 2) -> None:
+# Стороны ячейки с толстой границей: слева, справа, сверху, снизу
+BorderSides = Tuple[bool, bool, bool, bool]
+
+# Данные листа одного водителя: имя, продолжительность смены, минуты, действия, автобусы, остановки
+DriverTask = Tuple[str, Optional[int], List[int], List[int], List[int], List[int]]
+
+THICK_SIDE: Side = Side(style='thick')
+CENTER_ALIGNMENT: Alignment = Alignment(horizontal="center", vertical="center")
+
+# Текст времени суток для каждой минуты дня
+TIME_TEXTS: List[str] = [format_time(minute) for minute in range(MINUTES_PER_DAY)]
+
+
+def column_widths(rows: Sequence[Sequence[Any]], padding: int = 2) -> List[int]:
     """
-    Автоматически подстраивает ширину столбцов листа Excel на основе содержимого ячеек.
+    Рассчитывает ширину столбцов листа Excel по записываемым данным.
+
+    Ширина столбца равна длине самого длинного непустого значения в нём плюс отступ.
 
     Args:
-        sheet (Worksheet): Лист Excel, для которого необходимо подстроить ширину столбцов.
+        rows (Sequence[Sequence[Any]]): Строки листа.
         padding (int, optional): Дополнительное пространство для ширины столбца. По умолчанию 2.
-    """
-    for col in sheet.iter_cols(min_row=1, max_row=sheet.max_row, min_col=1, max_col=sheet.max_column):
-        max_length: int = 0
-        col_letter: str = col[0].coordinate.split(":")[0][0]
-        for cell in col:
-            if cell.value:
-                cell_length: int = len(str(cell.value))
-                if cell_length > max_length:
-                    max_length = cell_length
-        adjusted_width: int = max_length + padding
-        sheet.column_dimensions[col_letter].width = adjusted_width
 
-
-def add_thick_border(cell: Any, border_side: str, thick_border: Border) -> None:
+    Returns:
+        List[int]: Ширина каждого столбца.
+    """
+    n_of_columns: int = max((len(row) for row in rows), default=0)
+    max_lengths: List[int] = [0] * n_of_columns
+    for row in rows:
+        for col_idx, value in enumerate(row):
+            if value:
+                cell_length: int = len(str(value))
+                if cell_length > max_lengths[col_idx]:
+                    max_lengths[col_idx] = cell_length
+    return [max_length + padding for max_length in max_lengths]
+
+
+def thick_border(sides: BorderSides) -> Border:
     """
-    Добавляет толстую границу к указанной стороне ячейки.
+    Создаёт объект Border с толстыми линиями на указанных сторонах ячейки.
 
     Args:
-        cell (Cell): Ячейка Excel, к которой необходимо добавить границу.
-        border_side (str): Сторона границы ('left', 'right', 'top', 'bottom').
-        thick_border (Border): Объект Border с заданным стилем.
+        sides (BorderSides): Признаки толстой границы слева, справа, сверху и снизу.
+
+    Returns:
+        Border: Граница ячейки.
     """
-    current_border: Border = cell.border
-    border_kwargs = {'left': current_border.left, 'right': current_border.right, 'top': current_border.top,
-                     'bottom': current_border.bottom, border_side: getattr(thick_border, border_side)}
-    cell.border = Border(**border_kwargs)
+    left, right, top, bottom = sides
+    return Border(
+        left=THICK_SIDE if left else Side(),
+        right=THICK_SIDE if right else Side(),
+        top=THICK_SIDE if top else Side(),
+        bottom=THICK_SIDE if bottom else Side()
+    )
 
 
-def add_group_borders(sheet: Worksheet, start_row: int, end_row: int, start_col: int, end_col: int) -> None:
+def group_border(row: int, col: int, max_row: int) -> Optional[BorderSides]:
     """
-    Добавляет толстые границы вокруг указанного диапазона ячеек.
+    Определяет внешние толстые границы групп ячеек для ячейки листа водителя.
+
+    Группами являются блок "Водитель" и "Вид смены" в строках заголовка
+    и три столбца каждого дня недели на всю высоту листа.
 
     Args:
-        sheet (Worksheet): Лист Excel, на котором добавляются границы.
-        start_row (int): Начальный ряд диапазона.
-        end_row (int): Конечный ряд диапазона.
-        start_col (int): Начальный столбец диапазона.
-        end_col (int): Конечный столбец диапазона.
+        row (int): Номер строки (с 1).
+        col (int): Номер столбца (с 1).
+        max_row (int): Последняя строка листа.
+
+    Returns:
+        Optional[BorderSides]: Стороны с толстой границей или None, если ячейка не входит ни в одну группу.
     """
-    for row in range(start_row, end_row + 1):
-        for col in range(start_col, end_col + 1):
-            cell = sheet.cell(row=row, column=col)
-            if row == start_row:
-                cell.border = cell.border + Border(top=Side(style='thick'))
-            if row == end_row:
-                cell.border = cell.border + Border(bottom=Side(style='thick'))
-            if col == start_col:
-                cell.border = cell.border + Border(left=Side(style='thick'))
-            if col == end_col:
-                cell.border = cell.border + Border(right=Side(style='thick'))
+    if col < DAYS_START_COL:
+        if row > HEADER_ROWS:
+            return None
+        return col == 1, col == DAYS_START_COL - 1, row == 1, row == HEADER_ROWS
+    offset: int = (col - DAYS_START_COL) % len(DAY_COLUMNS)
+    return offset == 0, offset == len(DAY_COLUMNS) - 1, row == 1, row == max_row
 
 
-def add_borders(sheet: Worksheet) -> None:
+def style_name(sides: BorderSides, centered: bool) -> str:
     """
-    Добавляет только внешние толстые границы для групп ячеек на листе Excel.
+    Возвращает имя стиля ячейки с заданными границами и выравниванием.
 
     Args:
-        sheet (Worksheet): Лист Excel, к которому добавляются границы.
-    """
-    thick_border: Border = Border(
-        left=Side(style='thick'),
-        right=Side(style='thick'),
-        top=Side(style='thick'),
-        bottom=Side(style='thick')
-    )
+        sides (BorderSides): Стороны с толстой границей.
+        centered (bool): Выравнивание по центру.
 
-    # Добавляем границы вокруг блока "Водитель" и "Вид смены"
-    add_group_borders(sheet, start_row=1, end_row=2, start_col=1, end_col=2)
+    Returns:
+        str: Имя стиля, например "Расписание 1010 по центру".
+    """
+    border: str = "".join("1" if side else "0" for side in sides)
+    return f"Расписание {border}{' по центру' if centered else ''}"
 
-    # Определяем границы для дней недели
-    days_start_col: int = 3
-    total_days: int = 7
 
-    for i in range(total_days):
-        start_col: int = days_start_col + i * 3
-        end_col: int = start_col + 2
+def cell_style(
+        workbook: Workbook,
+        styles: Set[str],
+        sides: BorderSides,
+        centered: bool
+) -> str:
+    """
+    Возвращает именованный стиль ячейки с заданными границами и выравниванием.
 
-        add_group_borders(sheet, start_row=1, end_row=sheet.max_row, start_col=start_col, end_col=end_col)
+    Каждое сочетание границ и выравнивания регистрируется в книге как именованный стиль (NamedStyle) один раз,
+    после чего ячейкам назначается имя готового стиля без повторного сравнения объектов Border.
+    Шрифт стиля - шрифт книги по умолчанию.
 
+    Args:
+        workbook (Workbook): Книга Excel.
+        styles (Set[str]): Имена уже зарегистрированных стилей книги.
+        sides (BorderSides): Стороны с толстой границей.
+        centered (bool): Выравнивание по центру.
 
-def add_summary_sheet(workbook: Workbook, job_result_df: pd.DataFrame, driver_columns: List[str]) -> None:
+    Returns:
+        str: Имя стиля ячейки.
     """
-    Добавляет лист 'Итоги' с агрегированной информацией о водителях.
+    name: str = style_name(sides, centered)
+    if name not in styles:
+        style: NamedStyle = NamedStyle(name=name, font=DEFAULT_FONT, border=thick_border(sides))
+        if centered:
+            style.alignment = CENTER_ALIGNMENT
+        workbook.add_named_style(style)
+        styles.add(name)
+    return name
+
+
+def driver_rows(
+        driver_name: str,
+        shift_minutes: Optional[int],
+        minutes: Sequence[int],
+        actions: Sequence[int],
+        buses: Sequence[int],
+        stops: Sequence[int]
+) -> List[List[Any]]:
+    """
+    Формирует строки листа водителя: заголовок и действия по дням недели.
+
+    Текст ячеек формируется здесь из типизированных записей расписания (см. EventLog.to_records).
 
     Args:
-        workbook (Workbook): Книга Excel, в которую добавляется лист 'Итоги'.
-        job_result_df (pd.DataFrame): DataFrame с результатами работы водителей.
-        driver_columns (List[str]): Список столбцов, соответствующих водителям.
+        driver_name (str): Имя водителя.
+        shift_minutes (Optional[int]): Продолжительность смены водителя в минутах или None, если записей нет.
+        minutes (Sequence[int]): Минуты записей водителя.
+        actions (Sequence[int]): Коды действий (Action).
+        buses (Sequence[int]): Номера автобусов или NO_BUS.
+        stops (Sequence[int]): Номера остановок.
+
+    Returns:
+        List[List[Any]]: Значения ячеек по строкам; пустые ячейки равны None.
+    """
+    n_of_columns: int = DAYS_START_COL - 1 + len(DAYS_OF_WEEK) * len(DAY_COLUMNS)
+    day_data: List[List[Tuple[str, str, str]]] = [[] for _ in DAYS_OF_WEEK]
+
+    for minute, action, bus, stop in zip(minutes, actions, buses, stops):
+        days, minute_of_day = divmod(minute, MINUTES_PER_DAY)
+        day_data[days % DAYS_IN_WEEK].append(
+            (render_bus(action, bus), TIME_TEXTS[minute_of_day], render_action(action, stop))
+        )
+
+    title_row: List[Any] = ["Водитель", "Вид смены"]
+    header_row: List[Any] = [None, None]
+    for day in DAYS_OF_WEEK:
+        title_row += [day, None, None]
+        header_row += DAY_COLUMNS
+
+    max_len: int = max(len(actions) for actions in day_data)
+    rows: List[List[Any]] = [title_row, header_row]
+    for i in range(max(max_len, 1)):
+        row: List[Any] = [None] * n_of_columns
+        for day_idx, actions in enumerate(day_data):
+            if i < len(actions):
+                col_idx: int = DAYS_START_COL - 1 + day_idx * len(DAY_COLUMNS)
+                row[col_idx:col_idx + len(DAY_COLUMNS)] = actions[i]
+        rows.append(row)
+    rows[HEADER_ROWS][0] = driver_name
+    rows[HEADER_ROWS][1] = render_shift(shift_minutes) if shift_minutes is not None else ""
+    return rows
+
+
+def driver_layout(task: DriverTask) -> Tuple[List[List[Any]], List[int]]:
     """
-    summary_sheet: Worksheet = workbook.create_sheet(title="Итоги", index=0)
+    Рассчитывает содержимое листа водителя и ширину его столбцов.
 
-    total_drivers: int = len(driver_columns)
+    Args:
+        task (DriverTask): Данные листа водителя (аргументы driver_rows).
 
-    def contains_shift(data: Any, shift_time: str) -> bool:
-        """
-        Проверяет, содержит ли список или строка время смены.
+    Returns:
+        Tuple[List[List[Any]], List[int]]: Значения ячеек по строкам и ширина столбцов.
+    """
+    rows: List[List[Any]] = driver_rows(*task)
+    return rows, column_widths(rows)
 
-        Args:
-            data (Any): Данные ячейки (список или строка).
-            shift_time (str): Время смены в формате 'HH:MM:SS'.
 
-        Returns:
-            bool: True, если время смены содержится, иначе False.
-        """
-        if isinstance(data, list):
-            return any(f"Смена: {shift_time}" in str(item) for item in data)
-        return False
+def write_driver_sheet(
+        workbook: Workbook,
+        driver_name: str,
+        rows: List[List[Any]],
+        widths: List[int],
+        styles: Set[str]
+) -> None:
+    """
+    Записывает лист водителя построчно в книгу, открытую в режиме только для записи.
 
-    drivers_8_hour_shift: int = sum(
-        job_result_df[col].apply(lambda x: contains_shift(x, "8:00:00")).any()
-        for col in driver_columns
-    )
-    drivers_12_hour_shift: int = sum(
-        job_result_df[col].apply(lambda x: contains_shift(x, "12:00:00")).any()
-        for col in driver_columns
-    )
+    Ширина столбцов, объединения и стили рассчитываются по данным до записи,
+    поэтому ячейки не нужно перечитывать, а в памяти хранится только текущий лист.
 
-    days_of_week: List[str] = ["Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье"]
-    drivers_per_day: Dict[str, int] = {day: 0 for day in days_of_week}
-
-    for col in driver_columns:
-        for day_idx, day_name in enumerate(days_of_week):
-            day_data = job_result_df[
-                (job_result_df['Day'] == day_idx) & job_result_df[col].notna()
-                ][col]
-            if day_data.apply(lambda x: contains_shift(x, "8:00:00") or contains_shift(x, "12:00:00")).any():
-                drivers_per_day[day_name] += 1
-    summary_sheet.append(["Общие данные"])
-    summary_sheet.append(["Общее количество водителей", total_drivers])
-    summary_sheet.append(["Общее количество водителей с 8-часовой сменой", drivers_8_hour_shift])
-    summary_sheet.append(["Общее количество водителей с 12-часовой сменой", drivers_12_hour_shift])
-    summary_sheet.append([])
-
-    summary_sheet.append(["Количество водителей по дням недели"])
-    summary_sheet.append(["День недели", "Количество водителей"])
+    Args:
+        workbook (Workbook): Книга Excel в режиме только для записи.
+        driver_name (str): Имя водителя (название листа).
+        rows (List[List[Any]]): Значения ячеек по строкам (см. driver_rows).
+        widths (List[int]): Ширина столбцов (см. column_widths).
+        styles (Set[str]): Имена уже зарегистрированных стилей книги (см. cell_style).
+    """
+    sheet = workbook.create_sheet(title=driver_name)
+    for col_idx, width in enumerate(widths, start=1):
+        sheet.column_dimensions[get_column_letter(col_idx)].width = width
+
+    sheet.merged_cells.add(f"A1:A{HEADER_ROWS}")
+    sheet.merged_cells.add(f"B1:B{HEADER_ROWS}")
+    for day_idx in range(len(DAYS_OF_WEEK)):
+        start_col: int = DAYS_START_COL + day_idx * len(DAY_COLUMNS)
+        sheet.merged_cells.add(
+            f"{get_column_letter(start_col)}1:{get_column_letter(start_col + len(DAY_COLUMNS) - 1)}1"
+        )
+
+    max_row: int = len(rows)
+    for row_idx, values in enumerate(rows, start=1):
+        cells: List[Any] = []
+        centered: bool = row_idx <= HEADER_ROWS
+        for col_idx, value in enumerate(values, start=1):
+            sides: Optional[BorderSides] = group_border(row_idx, col_idx, max_row)
+            if sides is None and value is None and not centered:
+                cells.append(None)
+                continue
+            cell: WriteOnlyCell = WriteOnlyCell(sheet, value=value)
+            if sides is not None:
+                cell.style = cell_style(workbook, styles, sides, centered)
+            cells.append(cell)
+        sheet.append(cells)
+
+
+def add_summary_sheet(workbook: Workbook, schedule: pd.DataFrame) -> None:
+    """
+    Добавляет лист 'Итоги' с агрегированной информацией о водителях.
+
+    Args:
+        workbook (Workbook): Книга Excel, в которую добавляется лист 'Итоги'.
+        schedule (pd.DataFrame): Записи расписания (см. EventLog.to_records).
+    """
+    summary_sheet = workbook.create_sheet(title="Итоги", index=0)
+
+    total_drivers: int = len(schedule["driver"].cat.categories)
+    driver_ids: np.ndarray = schedule["driver"].cat.codes.to_numpy()
+    shifts: np.ndarray = schedule["shift_minutes"].to_numpy()
+    days: np.ndarray = (schedule["minute"].to_numpy() // MINUTES_PER_DAY) % DAYS_IN_WEEK
+
+    drivers_8_hour_shift: int = len(np.unique(driver_ids[shifts == SHIFT_DURATION_8H]))
+    drivers_12_hour_shift: int = len(np.unique(driver_ids[shifts == SHIFT_DURATION_12H]))
+
+    # Водитель учитывается в дне недели, если у него есть хотя бы одна запись в этот день
+    worked: np.ndarray = np.zeros((total_drivers, len(DAYS_OF_WEEK)), dtype=bool)
+    worked[driver_ids, days] = True
+    drivers_per_day: Dict[str, int] = dict(zip(DAYS_OF_WEEK, worked.sum(axis=0).tolist()))
+
+    rows: List[List[Any]] = [
+        ["Общие данные"],
+        ["Общее количество водителей", total_drivers],
+        ["Общее количество водителей с 8-часовой сменой", drivers_8_hour_shift],
+        ["Общее количество водителей с 12-часовой сменой", drivers_12_hour_shift],
+        [],
+        ["Количество водителей по дням недели"],
+        ["День недели", "Количество водителей"],
+    ]
     for day, count in drivers_per_day.items():
-        summary_sheet.append([day, count])
+        rows.append([day, count])
 
-    auto_adjust_column_width(summary_sheet)
+    for col_idx, width in enumerate(column_widths(rows), start=1):
+        summary_sheet.column_dimensions[get_column_letter(col_idx)].width = width
+    for row in rows:
+        summary_sheet.append(row)
 
 
-def excel_schedule(job_result_df: pd.DataFrame, output_file: str) -> None:
+def excel_schedule(schedule: pd.DataFrame, output_file: str) -> None:
     """
     Создаёт Excel-файл с расписанием водителей и агрегированной информацией.
 
+    Книга открывается в режиме только для записи: листы водителей формируются по одному
+    и сразу передаются на запись, поэтому расход памяти не растёт с количеством водителей.
+
     Args:
-        job_result_df (pd.DataFrame): DataFrame с результатами работы водителей.
+        schedule (pd.DataFrame): Записи расписания (см. EventLog.to_records).
         output_file (str): Путь к выходному Excel-файлу.
     """
-    job_result_df = job_result_df.reset_index()
-    job_result_df[['Day', 'Time']] = job_result_df['Time_index'].str.split(', ', expand=True)
-    job_result_df['Day'] = job_result_df['Day'].astype(int)
-    job_result_df['Time'] = job_result_df['Time'].str.strip()
-
-    driver_columns: List[str] = [col for col in job_result_df.columns if
-                                 col not in ['Time_index', 'placeholder', 'Day', 'Time']]
-
-    days_of_week: List[str] = ["Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье"]
-
-    workbook: Workbook = Workbook()
-    add_summary_sheet(workbook, job_result_df, driver_columns)
-
-    for driver_name in driver_columns:
-        sheet: Worksheet = workbook.create_sheet(title=driver_name)
-
-        sheet["A1"] = "Водитель"
-        sheet.merge_cells(start_row=1, start_column=1, end_row=2, end_column=1)
-        sheet["B1"] = "Вид смены"
-        sheet.merge_cells(start_row=1, start_column=2, end_row=2, end_column=2)
-
-        col_idx: int = 3
-        for day in days_of_week:
-            sheet.merge_cells(start_row=1, start_column=col_idx, end_row=1, end_column=col_idx + 2)
-            sheet.cell(row=1, column=col_idx).value = day
-            sheet.cell(row=2, column=col_idx).value = "Автобус"
-            sheet.cell(row=2, column=col_idx + 1).value = "Время"
-            sheet.cell(row=2, column=col_idx + 2).value = "Действие"
-            col_idx += 3
-
-        for row in sheet.iter_rows(min_row=1, max_row=2):
-            for cell in row:
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        driver_data: pd.DataFrame = job_result_df[job_result_df[driver_name].notna()][['Day', 'Time', driver_name]]
-        driver_data = driver_data.rename(columns={driver_name: 'Shift Details'})
-
-        day_data: Dict[str, List[Tuple[str, str, str]]] = {day: [] for day in days_of_week}
-
-        for _, row in driver_data.iterrows():
-            current_time: str = row["Time"]
-            shift_details: List[str] = row["Shift Details"] if isinstance(row["Shift Details"], list) else []
-            action: str = shift_details[0] if len(shift_details) > 0 else ""
-            bus: str = shift_details[2].split(": ")[-1] if len(shift_details) > 2 else ""
-
-            day_idx: int = row["Day"]
-            day_name: str = days_of_week[day_idx]
-
-            day_data[day_name].append((bus, current_time, action))
-
-        row_idx: int = 3
-        sheet.cell(row=row_idx, column=1, value=driver_name)
-        sheet.cell(row=row_idx, column=2, value=shift_details[1] if len(shift_details) > 1 else "")
-
-        max_len: int = max(len(actions) for actions in day_data.values())
-
-        for i in range(max_len):
-            col_idx = 3
-            for day in days_of_week:
-                if i < len(day_data[day]):
-                    bus, time, action = day_data[day][i]
-                    sheet.cell(row=row_idx, column=col_idx, value=bus)
-                    sheet.cell(row=row_idx, column=col_idx + 1, value=time)
-                    sheet.cell(row=row_idx, column=col_idx + 2, value=action)
-                col_idx += 3
-            row_idx += 1
-
-        auto_adjust_column_width(sheet)
-        add_borders(sheet)
-
-    if "Sheet" in workbook.sheetnames:
-        del workbook["Sheet"]
+    workbook: Workbook = Workbook(write_only=True)
+    add_summary_sheet(workbook, schedule)
+
+    # Записи группируются по водителям с сохранением порядка по времени
+    driver_names: List[str] = list(schedule["driver"].cat.categories)
+    driver_ids: np.ndarray = schedule["driver"].cat.codes.to_numpy()
+    order: np.ndarray = np.argsort(driver_ids, kind="stable")
+    bounds: np.ndarray = np.searchsorted(driver_ids[order], np.arange(len(driver_names) + 1))
+    minutes: List[int] = schedule["minute"].to_numpy()[order].tolist()
+    actions: List[int] = schedule["action"].cat.codes.to_numpy()[order].tolist()
+    shifts: List[int] = schedule["shift_minutes"].to_numpy()[order].tolist()
+    buses: List[int] = schedule["bus"].to_numpy()[order].tolist()
+    stops: List[int] = schedule["stop"].to_numpy()[order].tolist()
+
+    def tasks() -> Iterator[DriverTask]:
+        for driver_id, driver_name in enumerate(driver_names):
+            start, end = int(bounds[driver_id]), int(bounds[driver_id + 1])
+            yield (
+                driver_name,
+                shifts[start] if start < end else None,
+                minutes[start:end],
+                actions[start:end],
+                buses[start:end],
+                stops[start:end]
+            )
+
+    styles: Set[str] = set()
+    for driver_name, (rows, widths) in zip(driver_names, map(driver_layout, tasks())):
+        write_driver_sheet(workbook, driver_name, rows, widths, styles)
 
     workbook.save(output_file)